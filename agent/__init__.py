@@ -1,3 +1,3 @@
 from .base import Base
 from .random import Random
-from .q_learning import QLearning, SimpleDqn, DQN
+from .q_learning import QLearning, ArrayQLearning, MultiConfigQLearning, SimpleDqn, DQN
@@ -1,4 +1,6 @@
 from .observable_environment import ObservableEnvironment
 from .q_learning import QLearning
+from .array_q_learning import ArrayQLearning
+from .multi_config_q_learning import MultiConfigQLearning
 from .simple_dqn import SimpleDqn
 from .dqn import DQN
@@ -0,0 +1,138 @@
+from . import ObservableEnvironment as O_Env
+from .q_learning import QLearning
+from agent.utils import QTable
+from random import random, randint
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+
+class ArrayQLearning(QLearning):
+    def __init__(self, all_possible_actions: Tuple[Any, ...], training_amount: int = 100000,
+                 learning_rate: float = 0.3, gamma: float = 0.9) -> None:
+        super().__init__(training_amount=training_amount, learning_rate=learning_rate, gamma=gamma)
+        self._all_actions = all_possible_actions
+        self._actions_indices = {self._all_actions[i]: i for i in range(len(self._all_actions))}
+        self._q_table = QTable(nbr_of_actions=len(self._all_actions), init_q_value=self._init_q_value)
+        self._state_actions = None
+        self._current_row = None
+        self._previous_row = None
+        self._previous_action_i = None
+
+    def prepare_for_episode(self) -> None:
+        super().prepare_for_episode()
+        self._previous_row = None
+        self._previous_action_i = None
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._q_table.is_read_only
+
+    @property
+    def is_frozen(self) -> bool:
+        # A read-only table can only be used for inference
+        return self._is_frozen or self._q_table.is_read_only
+
+    @is_frozen.setter
+    def is_frozen(self, is_frozen: bool) -> None:
+        self._is_frozen = is_frozen
+
+    def observe_environment(self, env: O_Env) -> None:
+        if self.is_frozen:
+            # Inference only: no Bellman update, and states the table has never seen have no row
+            self._current_state = env.state
+            self._current_row = self._q_table.find_row(env.state)
+            return
+
+        row = self._q_table.row(env.state)
+
+        self._update_q_table_row(env, row)
+        self._current_state = env.state
+        self._current_row = row
+
+        if env.is_terminal and self._epsilon > 0:
+            self._epsilon -= self._epsilon_decay
+
+    def choose_action(self, actions: Tuple[Any, ...]) -> Optional[Any]:
+        if len(actions) == 0:
+            return None
+
+        action_indices = self._legal_action_indices(actions)
+
+        if action_indices is None:
+            # Unknown to a frozen agent, so there is nothing to exploit
+            action_i = self._actions_indices[actions[randint(0, len(actions) - 1)]]
+        elif random() < self._epsilon:
+            action_i = action_indices[randint(0, len(action_indices) - 1)]
+        else:
+            best = self._q_table.best_action_indices(self._current_row)
+            action_i = best[randint(0, len(best) - 1)]
+
+        self._previous_state = self._current_state
+        self._previous_row = self._current_row
+        self._previous_action = self._all_actions[action_i]
+        self._previous_action_i = action_i
+
+        return self._previous_action
+
+    def state_dict(self) -> Dict[str, Any]:
+        state = super().state_dict()
+        state.update(current_row=self._current_row, previous_row=self._previous_row,
+                     previous_action_i=self._previous_action_i)
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict(state)
+        self._current_row = state['current_row']
+        self._previous_row = state['previous_row']
+        self._previous_action_i = state['previous_action_i']
+
+    def save_q_table(self, file_name: Optional[str] = None, use_float16: bool = False) -> None:
+        if file_name is None:
+            now = datetime.now()
+            file_name = 'q_table_' + now.strftime('%Y_%m_%d_%H_%M_%S')
+
+        self._q_table.save(file_name, dtype=np.float16 if use_float16 else None)
+
+    def load_q_table(self, file_name: str, read_only: bool = False) -> None:
+        self.set_q_table(QTable.load(file_name, read_only=read_only))
+
+    def set_q_table(self, q_table: QTable) -> None:
+        if q_table.nbr_of_actions != len(self._all_actions):
+            raise Exception(f'Q-table has {q_table.nbr_of_actions} actions, expected {len(self._all_actions)}')
+
+        self._q_table = q_table
+
+    def _copy_q_table(self) -> QTable:
+        return self._q_table.copy()
+
+    def _restore_q_table(self, q_table: QTable) -> None:
+        self.set_q_table(q_table.copy())
+
+    def _legal_action_indices(self, actions: Tuple[Any, ...]) -> Optional[List[int]]:
+        if self._current_row is None:
+            return None
+
+        # The legal actions of a state never change, so they are only translated to indices on its first visit
+        action_indices = self._q_table.legal_indices(self._current_row)
+        if action_indices is None and not self.is_frozen:
+            self._q_table.set_legal(self._current_row, [self._actions_indices[action] for action in actions])
+            action_indices = self._q_table.legal_indices(self._current_row)
+
+        return action_indices
+
+    def _update_q_table_row(self, env: O_Env, row: int) -> None:
+        # Same Bellman update as QLearning, with a masked max over the legal actions instead of a sort
+        if self._previous_row is None or self._previous_action_i is None:
+            return
+
+        values = self._q_table.values
+        next_q = self._q_table.max_value(row)
+
+        if next_q is not None:
+            old_q = values[self._previous_row, self._previous_action_i]
+            values[self._previous_row, self._previous_action_i] = \
+                (1 - self._learning_rate) * old_q + self._learning_rate * (env.reward + self._gamma * next_q)
+        elif env.is_terminal:
+            values[self._previous_row, self._previous_action_i] = env.reward
@@ -1,70 +1,178 @@
 from agent.q_learning import SimpleDqn
-from agent.utils import ReplayMemory
+from agent.utils import PrioritizedReplayMemory, TensorReplayMemory
+import os
 import torch
-from typing import Tuple, Any
+from typing import Tuple, Any, Dict, Optional
 from .observable_environment import ObservableEnvironment
 
 
+def dqn_loss(preds: torch.Tensor, actions: torch.Tensor, rewards: torch.Tensor, next_preds: torch.Tensor,
+             is_terminals: torch.Tensor, gamma: float,
+             weights: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    # Gather, masked target and (importance-sampling weighted) MSE in one function, so it can be scripted as a whole
+    previous_q = preds.gather(dim=1, index=actions.unsqueeze(-1)).squeeze(-1)
+    next_q = next_preds.max(dim=1).values.detach()
+    target_q = torch.where(is_terminals, rewards, next_q * gamma + rewards)
+
+    # target_q.clamp_(min=-1.0, max=1.0)
+
+    td_errors = target_q - previous_q
+    if weights is None:
+        loss = td_errors.pow(2).mean()
+    else:
+        loss = (weights * td_errors.pow(2)).mean()
+
+    return loss, td_errors
+
+
 class DQN(SimpleDqn):
     def __init__(self, state_size: int, all_possible_actions: Tuple[Any, ...], training_amount: int = 100000,
                  replay_memory_size: int = 64000, batch_size: int = 512, alpha: float = 0.001,
-                 gamma: int = 0.999) -> None:
-        super().__init__(state_size=state_size, all_possible_actions=all_possible_actions,
-                         training_amount=training_amount, alpha=alpha, gamma=gamma)
+                 gamma: int = 0.999, prioritized_replay: bool = False, use_torchscript: bool = False,
+                 train_every: Optional[int] = None, gradient_steps_per_update: int = 1, target_update_every: int = 10,
+                 target_update_tau: float = 1.0) -> None:
+        # train_every: environment steps between updates, None updates once at the end of every episode
+        # gradient_steps_per_update: gradient steps per update (replay ratio)
+        # target_update_every: gradient steps between target net syncs. Earlier versions synced at the end of an
+        #   episode whenever the environment step count was a multiple of 10, so the default cadence differs from those
+        # target_update_tau: 1.0 copies the policy net, smaller values average it in (Polyak)
+        if train_every is not None and train_every < 1:
+            raise Exception('train_every must be positive')
+        if gradient_steps_per_update < 1 or target_update_every < 1:
+            raise Exception('Gradient steps per update and target update interval must be positive')
+        if not 0.0 < target_update_tau <= 1.0:
+            raise Exception(f'Target update tau must be in (0, 1], got {target_update_tau}')
 
-        self._replay_memory = ReplayMemory(memory_size=replay_memory_size, batch_size=batch_size)
+        super().__init__(state_size=state_size, all_possible_actions=all_possible_actions,
+                         training_amount=training_amount, alpha=alpha, gamma=gamma, use_torchscript=use_torchscript)
+
+        if prioritized_replay:
+            self._replay_memory = PrioritizedReplayMemory(state_size=state_size, memory_size=replay_memory_size,
+                                                          batch_size=batch_size, device=self._device)
+        else:
+            self._replay_memory = TensorReplayMemory(state_size=state_size, memory_size=replay_memory_size,
+                                                     batch_size=batch_size, device=self._device)
+        self._prioritized_replay = prioritized_replay
         self._batch_size = batch_size
 
         self._target_net = self._create_neural_network()
         self._target_net.load_state_dict(self._policy_net.state_dict())  # Load weights from policy to target net
         self._target_net.eval()  # Target net in evaluation mode
+        self._policy_params = list(self._policy_net.parameters())
+        self._target_params = list(self._target_net.parameters())
+
+        self._train_every = train_every
+        self._gradient_steps_per_update = gradient_steps_per_update
+        self._target_update_every = target_update_every
+        self._target_update_tau = target_update_tau
+        self._gradient_step_cnt = 0
+
+        # Only the loss is scripted, TorchScript cannot compile the backward pass or the optimizer step
+        self._loss_step = torch.jit.script(dqn_loss) if use_torchscript else dqn_loss
+
+    def state_dict(self) -> Dict[str, Any]:
+        # Experiences live in the replay memory, the episode memory of SimpleDqn stays empty and is left out
+        state = super().state_dict()
+        del state['memory']
+        state.update(target_net=self._copy_state_dict(self._target_net.state_dict()),
+                     replay_memory=self._replay_memory.state_dict(), gradient_step_cnt=self._gradient_step_cnt)
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict({key: value for key, value in state.items() if key != 'memory'})
+        self._target_net.load_state_dict(state['target_net'])
+        self._replay_memory.load_state_dict(state['replay_memory'])
+        self._gradient_step_cnt = state['gradient_step_cnt']
+
+    def save_model(self, file_name: Optional[str] = None) -> None:
+        # The target net is saved next to the policy net as <name>.target.weights (and <name>.target.pt)
+        if file_name is None:
+            now = self._generate_time_string()
+            file_name = f'dqn_model_{now}.weights'
+
+        super().save_model(file_name)
+
+        base_name, extension = os.path.splitext(file_name)
+        torch.save(self._target_net.state_dict(), f'{base_name}.target{extension}')
+
+        if self._use_torchscript:
+            torch.jit.save(self._target_net, self._scripted_file_name(file_name, suffix='.target'))
 
     def observe_environment(self, env: ObservableEnvironment) -> None:
+        if self._is_frozen:
+            super().observe_environment(env)
+            return
+
         self._update_replay_memory(env)
         super().observe_environment(env)
 
+        if self._train_every is not None and self._step_cnt % self._train_every == 0:
+            self._train()
+
+    def _store_experience(self, env: ObservableEnvironment) -> None:
+        # Experiences go to the replay memory in _update_replay_memory
+        pass
+
     def _update_network(self, env: ObservableEnvironment) -> None:
-        if self._replay_memory.can_sample():
-            self._policy_net.train()
+        if self._train_every is None:
+            self._train()
+
+    def _train(self) -> None:
+        for _ in range(self._gradient_steps_per_update):
+            if not self._replay_memory.can_sample():
+                return
+
+            self._gradient_step()
+            self._gradient_step_cnt += 1
+
+            if self._gradient_step_cnt % self._target_update_every == 0:
+                self._update_target_net()
 
-            batch = self._replay_memory.get_sample()
-            experiences = zip(*batch)
+    def _gradient_step(self) -> None:
+        self._policy_net.train()
 
-            previous_states, previous_actions, rewards, next_states, is_terminals = map(torch.cat, experiences)
-            not_is_terminals = is_terminals.logical_not()
+        if self._prioritized_replay:
+            experiences, weights, indices = self._replay_memory.get_prioritized_sample()
+        else:
+            experiences, weights, indices = self._replay_memory.get_sample(), None, None
 
-            target_q = torch.zeros(self._batch_size, device=self._device)
+        previous_states, previous_actions, rewards, next_states, is_terminals = experiences
 
-            pa = previous_actions.unsqueeze(-1)
-            previous_q = self._policy_net(previous_states).gather(dim=1, index=pa)
-            target_q[is_terminals] = rewards[is_terminals]
+        with torch.no_grad():
+            next_preds = self._target_net(next_states)
 
-            if torch.sum(not_is_terminals).item() > 0:
-                next_q = self._target_net(next_states[not_is_terminals]).max(dim=1).values.detach()
-                target_q[not_is_terminals] = next_q * self._gamma + rewards[not_is_terminals]
+        loss, td_errors = self._loss_step(self._policy_net(previous_states), previous_actions, rewards, next_preds,
+                                          is_terminals, float(self._gamma), weights)
 
-            # target_q.clamp_(min=-1.0, max=1.0)
+        if self._prioritized_replay:
+            self._replay_memory.update_priorities(indices, td_errors)
 
-            loss = self._loss(previous_q, target_q.unsqueeze(dim=-1))
-            self._optim.zero_grad()
-            loss.backward()
-            self._optim.step()
+        self._optim.zero_grad()
+        loss.backward()
+        self._optim.step()
 
-            if self._step_cnt % 10 == 0:
-                self._target_net.load_state_dict(self._policy_net.state_dict())
+        # self.print_special_case_info()
 
-            # self.print_special_case_info()
+    def _update_target_net(self) -> None:
+        # In place on the cached parameter lists, with fused foreach kernels where this torch version has them
+        with torch.no_grad():
+            if self._target_update_tau >= 1.0:
+                if hasattr(torch, '_foreach_copy_'):
+                    torch._foreach_copy_(self._target_params, self._policy_params)
+                else:
+                    for target_param, policy_param in zip(self._target_params, self._policy_params):
+                        target_param.copy_(policy_param)
+            elif hasattr(torch, '_foreach_lerp_'):
+                torch._foreach_lerp_(self._target_params, self._policy_params, self._target_update_tau)
+            else:
+                for target_param, policy_param in zip(self._target_params, self._policy_params):
+                    target_param.mul_(1.0 - self._target_update_tau).add_(policy_param, alpha=self._target_update_tau)
 
     def _update_replay_memory(self, env: ObservableEnvironment) -> None:
         if self._previous_action is not None and self._previous_state is not None:
-            experience = (self._previous_state,
-                          torch.as_tensor([self._actions_indices[self._previous_action]], dtype=torch.int64).to(
-                              self._device),
-                          torch.as_tensor([env.reward], dtype=torch.float32).to(self._device),
-                          torch.as_tensor([env.state], dtype=torch.float32).to(self._device),
-                          torch.as_tensor([env.is_terminal], dtype=torch.bool).to(self._device)
-                          )
-            self._replay_memory.insert(experience)
+            self._replay_memory.insert(self._previous_state, self._actions_indices[self._previous_action], env.reward,
+                                       env.state, env.is_terminal)
 
     def _write_to_tensorboard(self) -> None:
         if self._replay_memory.can_sample():
@@ -0,0 +1,232 @@
+from . import ObservableEnvironment as O_Env
+from .q_learning import QLearning
+from agent.utils.random_opponent import choose_random_actions, play_against_random
+from datetime import datetime
+from environment import VecTicTacToe
+from random import random, randint
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pickle
+
+
+class MultiConfigQLearning(QLearning):
+    # Trains one Q-table per (learning_rate, gamma) config from a single stream of experience. Q-learning is off-policy,
+    # so every config learns from the shared transitions while the behaviour policy is epsilon-greedy on their summed values.
+    def __init__(self, all_possible_actions: Tuple[Any, ...], configs: Sequence[Tuple[float, float]],
+                 training_amount: int = 100000, capacity: int = 1024) -> None:
+        if len(configs) < 1 or capacity < 1:
+            raise Exception('Multi-config Q-learning needs at least one config and a positive capacity')
+
+        super().__init__(training_amount=training_amount)
+        self._all_actions = all_possible_actions
+        self._actions_indices = {self._all_actions[i]: i for i in range(len(self._all_actions))}
+        self._configs = tuple(configs)
+        self._learning_rates = np.array([config[0] for config in self._configs], dtype=np.float64)
+        self._gammas = np.array([config[1] for config in self._configs], dtype=np.float64)
+        self._retain_rates = 1 - self._learning_rates
+        self._q_values = np.full((len(self._configs), capacity, len(self._all_actions)), self._init_q_value,
+                                 dtype=np.float64)
+        self._masks = np.zeros((capacity, len(self._all_actions)), dtype=bool)
+        self._index = {}
+        self._states = []
+        self._q_table = None
+        self._state_actions = None
+        self._current_row = None
+        self._previous_row = None
+        self._previous_action_i = None
+
+    @property
+    def configs(self) -> Tuple[Tuple[float, float], ...]:
+        return self._configs
+
+    @property
+    def q_values(self) -> np.ndarray:
+        return self._q_values[:, :len(self._states)]
+
+    @property
+    def masks(self) -> np.ndarray:
+        return self._masks[:len(self._states)]
+
+    @property
+    def states(self) -> List[Tuple[int, ...]]:
+        return self._states
+
+    def state_dict(self) -> Dict[str, Any]:
+        state = super().state_dict()
+        state.update(current_row=self._current_row, previous_row=self._previous_row,
+                     previous_action_i=self._previous_action_i)
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict(state)
+        self._current_row = state['current_row']
+        self._previous_row = state['previous_row']
+        self._previous_action_i = state['previous_action_i']
+
+    def prepare_for_episode(self) -> None:
+        super().prepare_for_episode()
+        self._previous_row = None
+        self._previous_action_i = None
+
+    def observe_environment(self, env: O_Env) -> None:
+        if self.is_frozen:
+            self._current_state = env.state
+            self._current_row = self._index.get(env.state)
+            return
+
+        row = self._row(env.state)
+
+        if env.action_mask is not None:
+            self._masks[row] |= env.action_mask
+
+        self._update_q_values(env, row)
+        self._current_state = env.state
+        self._current_row = row
+
+        if env.is_terminal and self._epsilon > 0:
+            self._epsilon -= self._epsilon_decay
+
+    def choose_action(self, actions: Tuple[Any, ...]) -> Optional[Any]:
+        if len(actions) == 0:
+            return None
+
+        action_indices = [self._actions_indices[action] for action in actions]
+        if not self.is_frozen:
+            self._masks[self._current_row, action_indices] = True
+
+        if random() < self._epsilon or self._current_row is None:
+            action_i = action_indices[randint(0, len(action_indices) - 1)]
+        else:
+            values = self._q_values[:, self._current_row, action_indices].sum(axis=0)
+            best = np.flatnonzero(values == values.max())
+            action_i = action_indices[best[randint(0, len(best) - 1)]]
+
+        self._previous_state = self._current_state
+        self._previous_row = self._current_row
+        self._previous_action = self._all_actions[action_i]
+        self._previous_action_i = action_i
+
+        return self._previous_action
+
+    def evaluate(self, nbr_of_games: int = 10000, seed: Optional[int] = None) -> np.ndarray:
+        # Plays every config greedily as 'x' against a random 'o' on its own slice of a VecTicTacToe and returns the
+        # number of wins per config. Expects the 3x3 observations of the TicTacToe QLearning interpreter.
+        nbr_of_configs = len(self._configs)
+        rng = np.random.default_rng(seed)
+        env = VecTicTacToe(nbr_of_boards=nbr_of_configs * nbr_of_games)
+        configs = np.repeat(np.arange(nbr_of_configs), nbr_of_games)
+        rows = self._create_row_lookup()
+        columns = [self._actions_indices[action] for action in env.actions]
+        weights = 3 ** np.arange(len(env.actions))
+
+        def choose_actions(is_agent: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            board = env.state.reshape(env.nbr_of_boards, -1)[is_agent]
+            # Mover's cells as 1 and opponent's as 2, matching the digits of _create_row_lookup
+            digits = np.where(board == VecTicTacToe.X, 1, np.where(board == VecTicTacToe.O, 2, 0))
+            board_rows = rows[digits @ weights]
+            is_known = board_rows >= 0
+
+            values = np.zeros(mask.shape, dtype=np.float64)
+            values[is_known] = self._q_values[configs[is_agent][is_known], board_rows[is_known]][:, columns]
+            best = np.max(np.where(mask, values, -np.inf), axis=1, keepdims=True)
+            # Random among the best legal actions
+            return choose_random_actions(mask & (values == best), rng)
+
+        winners = play_against_random(env, choose_actions, rng)
+
+        return (winners == VecTicTacToe.X).reshape(nbr_of_configs, nbr_of_games).sum(axis=1)
+
+    def save_q_table(self, file_name: Optional[str] = None) -> None:
+        if file_name is None:
+            now = datetime.now()
+            file_name = 'q_table_' + now.strftime('%Y_%m_%d_%H_%M_%S') + '.pkl'
+
+        with open(file_name, 'wb') as f:
+            pickle.dump(self._copy_q_table(), f)
+
+    def load_q_table(self, file_name: str) -> None:
+        with open(file_name, 'rb') as f:
+            self.set_q_table(pickle.load(f))
+
+    def set_q_table(self, q_table: Dict[str, Any]) -> None:
+        # Takes the configs, q_values, masks and states saved by save_q_table, not the dict table of QLearning
+        if not isinstance(q_table, dict) or not {'configs', 'q_values', 'masks', 'states'} <= q_table.keys():
+            raise Exception('Multi-config Q-learning expects a table saved by save_q_table')
+
+        self._restore_q_table(q_table)
+
+    def _copy_q_table(self) -> Dict[str, Any]:
+        return {'configs': self._configs, 'q_values': self.q_values.copy(), 'masks': self.masks.copy(),
+                'states': list(self._states)}
+
+    def _restore_q_table(self, q_table: Dict[str, Any]) -> None:
+        if tuple(q_table['configs']) != self._configs:
+            raise Exception('Checkpoint was trained with different configs')
+
+        nbr_of_states = len(q_table['states'])
+        self._states = list(q_table['states'])
+        self._index = {state: row for row, state in enumerate(self._states)}
+
+        while self._masks.shape[0] < nbr_of_states:
+            self._grow()
+
+        self._q_values[:] = self._init_q_value
+        self._q_values[:, :nbr_of_states] = q_table['q_values']
+        self._masks[:] = False
+        self._masks[:nbr_of_states] = q_table['masks']
+
+    def _row(self, state: Tuple[int, ...]) -> int:
+        row = self._index.get(state)
+
+        if row is None:
+            row = len(self._states)
+
+            if row == self._masks.shape[0]:
+                self._grow()
+
+            self._index[state] = row
+            self._states.append(state)
+
+        return row
+
+    def _grow(self) -> None:
+        capacity = 2 * self._masks.shape[0]
+
+        q_values = np.full((len(self._configs), capacity, len(self._all_actions)), self._init_q_value,
+                           dtype=np.float64)
+        q_values[:, :self._q_values.shape[1]] = self._q_values
+        masks = np.zeros((capacity, len(self._all_actions)), dtype=bool)
+        masks[:len(self._masks)] = self._masks
+
+        self._q_values = q_values
+        self._masks = masks
+
+    def _update_q_values(self, env: O_Env, row: int) -> None:
+        # Bellman update of the previous state-action pair, for all configs at once
+        if self._previous_row is None or self._previous_action_i is None:
+            return
+
+        legal = self._masks[row]
+        # Basic indexing, so the update below writes through this view
+        q = self._q_values[:, self._previous_row, self._previous_action_i]
+
+        if legal.any():
+            next_q = np.maximum.reduce(self._q_values[:, row], axis=1, where=legal, initial=-np.inf)
+            q *= self._retain_rates
+            q += self._learning_rates * (env.reward + self._gammas * next_q)
+        elif env.is_terminal:
+            q[:] = env.reward
+
+    def _create_row_lookup(self) -> np.ndarray:
+        nbr_of_cells = len(self._all_actions)
+        rows = np.full(3 ** nbr_of_cells, -1, dtype=np.int64)
+
+        if len(self._states) == 0:
+            return rows
+
+        observations = np.array(self._states, dtype=np.int64).reshape(len(self._states), nbr_of_cells, 2)
+        digits = np.where(observations[:, :, 1] == 1, 1, np.where(observations[:, :, 0] == 1, 2, 0))
+        rows[digits @ (3 ** np.arange(nbr_of_cells))] = np.arange(len(self._states))
+
+        return rows
@@ -1,7 +1,8 @@
-from typing import NamedTuple, Tuple
+from typing import NamedTuple, Optional, Tuple
 
 
 class ObservableEnvironment(NamedTuple):
     state: Tuple[int, ...]
     reward: float
     is_terminal: bool
+    action_mask: Optional[Tuple[bool, ...]] = None
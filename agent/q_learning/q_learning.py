@@ -1,13 +1,13 @@
 from . import ObservableEnvironment as O_Env
 from agent.base import Base
 from random import random, randint
-from typing import Tuple, Any, Optional
+from typing import Tuple, Any, Dict, Optional
 from datetime import datetime
 import pickle
 
 
 class QLearning(Base):
-    def __init__(self, training_amount: int = 100000):
+    def __init__(self, training_amount: int = 100000, learning_rate: float = 0.3, gamma: float = 0.9):
         super(Base, self).__init__()
         self._q_table = {}
         self._state_actions = {}
@@ -15,16 +15,38 @@ class QLearning(Base):
         self._current_state = None
         self._previous_state = None
         self._init_q_value = 0.0
-        self._learning_rate = 0.3
-        self._gamma = 0.9
+        self._learning_rate = learning_rate
+        self._gamma = gamma
         self._epsilon = 1.0
         self._epsilon_decay = self._epsilon / training_amount
+        self._is_frozen = False
+
+    @property
+    def epsilon(self) -> float:
+        return self._epsilon
+
+    @epsilon.setter
+    def epsilon(self, epsilon: float) -> None:
+        self._epsilon = epsilon
+
+    @property
+    def is_frozen(self) -> bool:
+        # A frozen agent only acts: no Q-value updates, no new states and no epsilon decay
+        return self._is_frozen
+
+    @is_frozen.setter
+    def is_frozen(self, is_frozen: bool) -> None:
+        self._is_frozen = is_frozen
 
     def prepare_for_episode(self) -> None:
         self._previous_action = None
         self._previous_state = None
 
     def observe_environment(self, env: O_Env) -> None:
+        if self.is_frozen:
+            self._current_state = env.state
+            return
+
         if env.state not in self._state_actions.keys():
             self._add_state_to_q_table(env.state)
             self._state_actions[env.state] = []
@@ -36,6 +58,9 @@ class QLearning(Base):
             self._epsilon -= self._epsilon_decay
 
     def choose_action(self, actions: Tuple[Any, ...]) -> Optional[Any]:
+        if self.is_frozen:
+            return self._choose_frozen_action(actions)
+
         for action in actions:
             if action not in self._state_actions[self._current_state]:
                 self._add_action_to_q_table(action)
@@ -51,13 +76,42 @@ class QLearning(Base):
 
         return action
 
-    def save_q_table(self) -> None:
-        now = datetime.now()
-        file_name = 'q_table_' + now.strftime('%Y_%m_%d_%H_%M_%S') + '.pkl'
+    def state_dict(self) -> Dict[str, Any]:
+        # Snapshot copy of everything training depends on, see agent.utils.Checkpointer
+        return {'q_table': self._copy_q_table(), 'epsilon': self._epsilon, 'epsilon_decay': self._epsilon_decay,
+                'previous_action': self._previous_action, 'previous_state': self._previous_state,
+                'current_state': self._current_state}
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        self._restore_q_table(state['q_table'])
+        self._epsilon = state['epsilon']
+        self._epsilon_decay = state['epsilon_decay']
+        self._previous_action = state['previous_action']
+        self._previous_state = state['previous_state']
+        self._current_state = state['current_state']
+
+    def save_q_table(self, file_name: Optional[str] = None) -> None:
+        if file_name is None:
+            now = datetime.now()
+            file_name = 'q_table_' + now.strftime('%Y_%m_%d_%H_%M_%S') + '.pkl'
 
         with open(file_name, 'wb') as f:
             pickle.dump(self._q_table, f)
 
+    def load_q_table(self, file_name: str) -> None:
+        with open(file_name, 'rb') as f:
+            self.set_q_table(pickle.load(f))
+
+    def set_q_table(self, q_table: Dict[Tuple[int, ...], Dict[Any, float]]) -> None:
+        self._q_table = q_table
+        self._state_actions = {state: list(actions.keys()) for state, actions in self._q_table.items()}
+
+    def _copy_q_table(self) -> Any:
+        return {state: dict(actions) for state, actions in self._q_table.items()}
+
+    def _restore_q_table(self, q_table: Any) -> None:
+        self.set_q_table({state: dict(actions) for state, actions in q_table.items()})
+
     def _add_state_to_q_table(self, state: Tuple[int, ...]) -> None:
         self._q_table[state] = {}
 
@@ -81,6 +135,23 @@ class QLearning(Base):
 
         # self.print_special_case_info()
 
+    def _choose_frozen_action(self, actions: Tuple[Any, ...]) -> Optional[Any]:
+        # Like choose_action, with a random action where the table knows no action of the state
+        if len(actions) == 0:
+            return None
+
+        action = None
+        if random() >= self._epsilon and len(self._state_actions.get(self._current_state, ())) > 0:
+            action = self._choose_best_action(actions)
+
+        if action is None:
+            action = self._choose_random_action(actions)
+
+        self._previous_state = self._current_state
+        self._previous_action = action
+
+        return action
+
     @staticmethod
     def _choose_random_action(actions: Tuple[Any, ...]) -> Any:
         rnd = randint(0, len(actions) - 1)
@@ -1,18 +1,23 @@
 from .observable_environment import ObservableEnvironment
 from agent.base import Base
-from agent.utils import ReplayMemory
+from agent.utils import InferenceServer, ReplayMemory
+from agent.utils.random_opponent import play_against_random
+from environment import StateSpace, VecTicTacToe
+import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
 from torch.utils.tensorboard import SummaryWriter
-from typing import Any, Tuple, Optional
+from typing import Any, Dict, Tuple, Optional, Union
 from random import random, randint
 from datetime import datetime
+import copy
+import os
 
 
 class SimpleDqn(Base):
     def __init__(self, state_size: int, all_possible_actions: Tuple[Any, ...], training_amount: int = 100000,
-                 alpha: float = 0.001, gamma: int = 0.999) -> None:
+                 alpha: float = 0.001, gamma: int = 0.999, use_torchscript: bool = False) -> None:
         super().__init__()
         torch.set_grad_enabled(True)
 
@@ -24,6 +29,10 @@ class SimpleDqn(Base):
         self._all_actions = all_possible_actions
         self._actions_indices = {self._all_actions[i]: i for i in range(len(self._all_actions))}
         self._previous_possible_actions = None
+        # Legality masks of the current and previous step, built at most once per step (see _get_action_mask)
+        self._observed_action_mask = None
+        self._current_action_mask = None
+        self._previous_action_mask = None
 
         self._alpha = alpha  # Learning rate
         self._gamma = gamma  # Future reward discount
@@ -33,8 +42,10 @@ class SimpleDqn(Base):
         self._nbr_of_inputs = state_size
         self._nbr_of_outputs = len(self._all_actions)
         self._device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self._use_torchscript = use_torchscript
 
         self._policy_net = self._create_neural_network()
+        self._quantized_net = None
         self._loss = nn.MSELoss()
         self._optim = optim.Adam(self._policy_net.parameters(), self._alpha)
 
@@ -46,6 +57,24 @@ class SimpleDqn(Base):
 
         self._summary_writer = None
         self._is_training = True
+        self._is_frozen = False
+
+    @property
+    def epsilon(self) -> float:
+        return self._epsilon
+
+    @epsilon.setter
+    def epsilon(self, epsilon: float) -> None:
+        self._epsilon = epsilon
+
+    @property
+    def is_frozen(self) -> bool:
+        # A frozen agent only acts: no experiences, no network updates, no epsilon decay and no step counting
+        return self._is_frozen
+
+    @is_frozen.setter
+    def is_frozen(self, is_frozen: bool) -> None:
+        self._is_frozen = is_frozen
 
     def prepare_for_episode(self) -> None:
         self._previous_action = None
@@ -54,6 +83,10 @@ class SimpleDqn(Base):
     def observe_environment(self, env: ObservableEnvironment) -> None:
         self._update_states(env)
         self._update_actions()
+
+        if self._is_frozen:
+            return
+
         self._store_experience(env)
         self._update_reward_sum(env)
 
@@ -80,48 +113,221 @@ class SimpleDqn(Base):
         self._step_cnt += 1
 
     def choose_action(self, actions: Tuple[Any, ...]) -> Optional[Any]:
+        self._current_action_mask = None
         self._determine_current_action(actions)
         self._previous_possible_actions = actions
 
         return self._current_action
 
-    def save_model(self) -> None:
-        now = self._generate_time_string()
-        file_name = f'dqn_model_{now}.weights'
+    @property
+    def is_quantized(self) -> bool:
+        return self._quantized_net is not None
+
+    def quantize(self) -> float:
+        # Exploit-only mode: greedy actions come from a dynamic int8 copy of the linear_* layers, run on the CPU.
+        # Training keeps updating the fp32 policy net, so call dequantize() before training again.
+        # Returns the share of TicTacToe positions where the greedy action differs from the fp32 policy net.
+        self._quantized_net = self._create_quantized_neural_network()
+        return self.quantization_mismatch_rate()
+
+    def dequantize(self) -> None:
+        self._quantized_net = None
+
+    def save_quantized_model(self, file_name: Optional[str] = None) -> None:
+        # Scripted, so it loads with scripted_policy.ScriptedPolicy
+        if self._quantized_net is None:
+            raise Exception('Model is not quantized')
+
+        if file_name is None:
+            now = self._generate_time_string()
+            file_name = f'dqn_model_{now}'
+
+        torch.jit.save(torch.jit.script(self._quantized_net), f'{file_name}.int8.pt')
+
+    def quantization_mismatch_rate(self, state_space: Optional[StateSpace] = None) -> float:
+        if self._quantized_net is None:
+            raise Exception('Model is not quantized')
+
+        if state_space is None:
+            state_space = StateSpace()
+
+        is_active = ~state_space.is_terminal
+        columns = [self._actions_indices[action] for action in state_space.actions]
+        states = torch.as_tensor(state_space.observations[is_active], dtype=torch.float32)
+        masks = torch.zeros((len(states), self._nbr_of_outputs), dtype=torch.bool)
+        masks[:, columns] = torch.as_tensor(state_space.legal_actions[is_active])
+
+        self._policy_net.eval()
+        with torch.no_grad():
+            preds = self._policy_net(states.to(self._device)).cpu()
+            quantized_preds = self._quantized_net(states)
+
+        actions = preds.masked_fill(masks.logical_not(), float('-inf')).argmax(dim=1)
+        quantized_actions = quantized_preds.masked_fill(masks.logical_not(), float('-inf')).argmax(dim=1)
+
+        return (actions != quantized_actions).float().mean().item()
+
+    def create_inference_server(self, max_batch_size: int = 256, max_wait: float = 0.001) -> InferenceServer:
+        # Greedy actions of the policy net (or its quantized copy) for many concurrent games, see InferenceServer
+        if self._quantized_net is not None:
+            return InferenceServer(self._quantized_net, max_batch_size=max_batch_size, max_wait=max_wait)
+
+        self._policy_net.eval()
+        return InferenceServer(self._policy_net, max_batch_size=max_batch_size, max_wait=max_wait,
+                               device=self._device)
+
+    def evaluate(self, nbr_of_games: int = 10000, max_batch_size: int = 4096,
+                 seed: Optional[int] = None) -> Tuple[int, int, int]:
+        # Greedy 'x' against a random 'o' on a VecTicTacToe, one forward pass per move for all boards.
+        # Returns wins, losses and draws.
+        rng = np.random.default_rng(seed)
+        env = VecTicTacToe(nbr_of_boards=nbr_of_games)
+        server = self.create_inference_server(max_batch_size=max_batch_size)
+        # Environment action of every network output
+        env_actions = np.argsort([self._actions_indices[action] for action in env.actions])
+
+        def choose_actions(is_agent: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            agent_actions = server.infer_batch(torch.as_tensor(env.observation[is_agent]),
+                                               torch.as_tensor(mask[:, env_actions]))
+            return env_actions[agent_actions.cpu().numpy()]
+
+        winners = play_against_random(env, choose_actions, rng)
+
+        wins = int((winners == VecTicTacToe.X).sum())
+        losses = int((winners == VecTicTacToe.O).sum())
+        return wins, losses, nbr_of_games - wins - losses
+
+    def state_dict(self) -> Dict[str, Any]:
+        # Snapshot copy of everything training depends on, see agent.utils.Checkpointer. States are new tensors every
+        # step, so they can be shared with the snapshot.
+        return {
+            'policy_net': self._copy_state_dict(self._policy_net.state_dict()),
+            'optim': copy.deepcopy(self._optim.state_dict()),
+            'memory': self._memory.state_dict(),
+            'epsilon': self._epsilon,
+            'epsilon_decay': self._epsilon_decay,
+            'step_cnt': self._step_cnt,
+            'episode_cnt': self._episode_cnt,
+            'rewards_sum': self._rewards_sum,
+            'is_training': self._is_training,
+            'previous_state': self._previous_state,
+            'previous_action': self._previous_action,
+            'current_state': self._current_state,
+            'current_action': self._current_action,
+            'previous_possible_actions': self._previous_possible_actions
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        self._policy_net.load_state_dict(state['policy_net'])
+        self._optim.load_state_dict(copy.deepcopy(state['optim']))
+        if 'memory' in state:
+            self._memory.load_state_dict(state['memory'])
+        self._epsilon = state['epsilon']
+        self._epsilon_decay = state['epsilon_decay']
+        self._step_cnt = state['step_cnt']
+        self._episode_cnt = state['episode_cnt']
+        self._rewards_sum = state['rewards_sum']
+        self._is_training = state['is_training']
+        self._previous_state = self._to_device(state['previous_state'])
+        self._previous_action = state['previous_action']
+        self._current_state = self._to_device(state['current_state'])
+        self._current_action = state['current_action']
+        self._previous_possible_actions = state['previous_possible_actions']
+        self._observed_action_mask = None
+        self._current_action_mask = None
+        self._previous_action_mask = None
+        self._quantized_net = None
+
+    def save_model(self, file_name: Optional[str] = None) -> None:
+        # The weights go to file_name as given. With TorchScript the scripted policy net is saved next to them as
+        # <name>.pt, it can be loaded with scripted_policy.ScriptedPolicy.
+        if file_name is None:
+            now = self._generate_time_string()
+            file_name = f'dqn_model_{now}.weights'
 
         torch.save(self._policy_net.state_dict(), file_name)
 
+        if self._use_torchscript:
+            torch.jit.save(self._policy_net, self._scripted_file_name(file_name))
+
     def load_model(self, file_path: str) -> None:
         state_dict = torch.load(file_path)
         self._policy_net.load_state_dict(state_dict)
 
-    def _create_neural_network(self) -> nn.Sequential:
+    def _create_neural_network(self) -> Union[nn.Sequential, torch.jit.ScriptModule]:
+        network = self._create_eager_neural_network()
+        network.to(self._device)
+
+        if self._use_torchscript:
+            return torch.jit.script(network)
+
+        return network
+
+    def _create_eager_neural_network(self) -> nn.Sequential:
         network = nn.Sequential()
         network.add_module('linear_0', nn.Linear(in_features=self._nbr_of_inputs, out_features=1000))
         network.add_module('relu_0', nn.ReLU())
         network.add_module('linear_1', nn.Linear(in_features=1000, out_features=1000))
         network.add_module('relu_1', nn.ReLU())
         network.add_module('linear_2', nn.Linear(in_features=1000, out_features=self._nbr_of_outputs))
-        network.to(self._device)
         return network
 
+    def _create_quantized_neural_network(self) -> nn.Module:
+        # quantize_dynamic needs an eager module on the CPU, the policy net may be scripted or on the GPU
+        network = self._create_eager_neural_network()
+        network.load_state_dict({name: param.cpu() for name, param in self._policy_net.state_dict().items()})
+        network.eval()
+
+        linear_layers = {name for name, module in network.named_children() if name.startswith('linear_')}
+        # torch.ao.quantization since torch 1.10, torch.quantization before
+        quantization = torch.ao.quantization if hasattr(torch, 'ao') else torch.quantization
+        return quantization.quantize_dynamic(network, linear_layers, dtype=torch.qint8)
+
     def _update_states(self, env: ObservableEnvironment) -> None:
         if self._current_state is not None:
             self._previous_state = self._current_state
 
         self._current_state = torch.as_tensor([env.state], dtype=torch.float32).to(self._device)
+        self._observed_action_mask = env.action_mask
 
     def _update_actions(self) -> None:
         self._previous_action = self._current_action
         self._current_action = None
+        self._previous_action_mask = self._current_action_mask
 
     def _store_experience(self, env: ObservableEnvironment) -> None:
         if self._previous_action is not None and self._previous_state is not None:
             self._memory.insert(self._create_experience(env))
 
     def _create_experience(self, env: ObservableEnvironment) -> Tuple[Any, ...]:
-        return (self._previous_state, self._previous_action, self._previous_possible_actions,
-                env.reward, self._current_state, env.is_terminal)
+        # Exploit steps already built the mask for their argmax, explore steps build it here
+        action_mask = self._previous_action_mask
+        if action_mask is None:
+            action_mask = self._create_action_mask(self._previous_possible_actions)
+
+        return (self._previous_state, self._actions_indices[self._previous_action], action_mask, env.reward,
+                self._current_state, env.is_terminal)
+
+    def _get_action_mask(self, actions: Tuple[Any, ...]) -> torch.Tensor:
+        # Mask of the current step, from the observed action mask where the interpreter provides one (it is in the
+        # order of all_possible_actions), shared by the exploit argmax and the experience of this step
+        if self._current_action_mask is None:
+            if self._observed_action_mask is not None and len(self._observed_action_mask) == self._nbr_of_outputs:
+                self._current_action_mask = torch.tensor([self._observed_action_mask], dtype=torch.bool,
+                                                         device=self._device)
+            else:
+                self._current_action_mask = self._create_action_mask(actions)
+
+        return self._current_action_mask
+
+    def _create_action_mask(self, actions: Tuple[Any, ...]) -> torch.Tensor:
+        # Built on every call, a cache keyed by the legal actions would grow with every subset seen on large boards
+        action_indices = torch.tensor([self._actions_indices[action] for action in actions], dtype=torch.int64,
+                                      device=self._device)
+
+        action_mask = torch.zeros((1, self._nbr_of_outputs), dtype=torch.bool, device=self._device)
+
+        return action_mask.index_fill_(1, action_indices, True)
 
     def _update_network(self, env: ObservableEnvironment) -> None:
         if self._previous_action is not None and self._previous_state is not None:
@@ -131,30 +337,22 @@ class SimpleDqn(Base):
 
             batch = zip(*experiences)
 
-            previous_states, previous_actions, previous_possible_actions, rewards, next_states, is_terminals = batch
+            previous_states, previous_actions, action_masks, rewards, next_states, is_terminals = batch
 
-            future_discounted_reward = []
-            for i in range(len(rewards) - 1, -1, -1):
-                sum_reward = 0
-                for j, reward in enumerate(rewards[i:]):
-                    sum_reward += self._gamma ** j * reward
-                future_discounted_reward.insert(0, sum_reward)
+            future_discounted_reward = self._calculate_discounted_returns(rewards, self._gamma).to(self._device)
 
             previous_preds = self._policy_net(torch.cat(previous_states))
             next_preds = self._policy_net(torch.cat(next_states))
 
             next_qs = next_preds.max(dim=1).values.detach()
 
-            target_preds = torch.zeros(previous_preds.shape).to(self._device)
-
-            for i, ppa in enumerate(previous_possible_actions):
-                indices = [self._actions_indices[a] for a in ppa]
-                previous_action_i = self._actions_indices.get(previous_actions[i])
-                target_preds[i][indices] = previous_preds[i][indices]
-                if is_terminals[i]:
-                    target_preds[i][previous_action_i] = future_discounted_reward[i]
-                else:
-                    target_preds[i][previous_action_i] = (next_qs[i] * self._gamma) + future_discounted_reward[i]
+            target_preds = self._create_target_preds(
+                previous_preds=previous_preds.detach(),
+                previous_actions=torch.as_tensor(previous_actions, dtype=torch.int64, device=self._device),
+                action_masks=torch.cat(action_masks),
+                targets=torch.where(torch.as_tensor(is_terminals, device=self._device), future_discounted_reward,
+                                    next_qs * self._gamma + future_discounted_reward)
+            )
 
             loss = self._loss(previous_preds, target_preds)
             self._optim.zero_grad()
@@ -163,6 +361,25 @@ class SimpleDqn(Base):
 
             # self.print_special_case_info()
 
+    @staticmethod
+    def _calculate_discounted_returns(rewards: Tuple[float, ...], gamma: float) -> torch.Tensor:
+        # G_i = r_i + gamma * G_i+1, in one reverse pass
+        returns = [0.0] * len(rewards)
+        discounted_return = 0.0
+
+        for i in range(len(rewards) - 1, -1, -1):
+            discounted_return = rewards[i] + gamma * discounted_return
+            returns[i] = discounted_return
+
+        return torch.as_tensor(returns, dtype=torch.float32)
+
+    @staticmethod
+    def _create_target_preds(previous_preds: torch.Tensor, previous_actions: torch.Tensor, action_masks: torch.Tensor,
+                             targets: torch.Tensor) -> torch.Tensor:
+        # Legal actions keep their prediction, illegal ones are pulled to 0 and the taken action gets its target
+        target_preds = torch.where(action_masks, previous_preds, torch.zeros_like(previous_preds))
+        return target_preds.scatter(1, previous_actions.unsqueeze(dim=-1), targets.unsqueeze(dim=-1))
+
     def _update_reward_sum(self, env: ObservableEnvironment) -> None:
         self._rewards_sum += env.reward
 
@@ -182,27 +399,26 @@ class SimpleDqn(Base):
         if random() < self._epsilon:  # EXPLORE
             action_i = self._choose_random_action_index(actions)
         else:  # EXPLOIT
-            action_i = self._choose_best_action_index(actions)
+            action_i = self._choose_best_action_index(self._get_action_mask(actions))
 
         self._current_action = self._all_actions[action_i]
 
     def _choose_random_action_index(self, actions: Tuple[Any, ...]) -> int:
         rnd_i = randint(0, len(actions) - 1)
 
-        for i in range(len(self._all_actions)):
-            if self._all_actions[i] == actions[rnd_i]:
-                return i
+        return self._actions_indices[actions[rnd_i]]
 
-    def _choose_best_action_index(self, actions: Tuple[Any, ...]) -> int:
+    def _choose_best_action_index(self, action_mask: torch.Tensor) -> int:
+        # Masked argmax on the device, .item() is the only host sync
         pred = self._inference(self._current_state)
 
-        actions_indices_sorted = [i.item() for i in pred.sort(descending=True).indices.squeeze()]
-
-        for i in actions_indices_sorted:
-            if self._all_actions[i] in actions:
-                return i
+        return pred.masked_fill(action_mask.to(pred.device).logical_not(), float('-inf')).argmax().item()
 
     def _inference(self, state: torch.Tensor) -> torch.Tensor:
+        if self._quantized_net is not None:
+            with torch.no_grad():
+                return self._quantized_net(state.cpu())
+
         self._policy_net.eval()
 
         with torch.no_grad():
@@ -210,6 +426,17 @@ class SimpleDqn(Base):
 
         return pred
 
+    @staticmethod
+    def _scripted_file_name(file_name: str, suffix: str = '') -> str:
+        return f'{os.path.splitext(file_name)[0]}{suffix}.pt'
+
+    def _to_device(self, state: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+        return None if state is None else state.to(self._device)
+
+    @staticmethod
+    def _copy_state_dict(state_dict: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        return {name: tensor.detach().clone() for name, tensor in state_dict.items()}
+
     @staticmethod
     def _generate_time_string() -> str:
         return datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
@@ -1 +1,8 @@
 from .replay_memory import ReplayMemory
+from .tensor_replay_memory import TensorReplayMemory
+from .sum_tree import SumTree
+from .prioritized_replay_memory import PrioritizedReplayMemory
+from .inference_server import InferenceServer
+from .checkpointer import Checkpointer
+from .q_table import QTable
+from .tic_tac_toe_solver import TicTacToeSolver
@@ -0,0 +1,155 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import RLock
+from typing import Any, Dict, List, Optional
+import numpy as np
+import os
+import pickle
+import random
+import re
+import torch
+
+
+def get_rng_state() -> Dict[str, Any]:
+    rng_state = {'random': random.getstate(), 'numpy': np.random.get_state(), 'torch': torch.get_rng_state()}
+
+    if torch.cuda.is_available():
+        rng_state['cuda'] = torch.cuda.get_rng_state_all()
+
+    return rng_state
+
+
+def set_rng_state(rng_state: Dict[str, Any]) -> None:
+    random.setstate(rng_state['random'])
+    np.random.set_state(rng_state['numpy'])
+    torch.set_rng_state(rng_state['torch'])
+
+    if 'cuda' in rng_state and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(rng_state['cuda'])
+
+
+class Checkpointer:
+    # Full training checkpoints: the agent's state_dict() snapshot and the python, numpy and torch RNG states.
+    # The snapshot is copied on the calling thread, pickling and writing happen on a background thread. Files are
+    # written next to their final name and renamed into place, so a crash never leaves a partial checkpoint behind,
+    # and only the newest keep_last checkpoints are kept.
+    def __init__(self, directory: str, keep_last: Optional[int] = 3, prefix: str = 'checkpoint') -> None:
+        if keep_last is not None and keep_last < 1:
+            raise Exception('Checkpointer has to keep at least one checkpoint')
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self._keep_last = keep_last
+        self._prefix = prefix
+        self._pattern = re.compile(rf'^{re.escape(prefix)}_(\d+)\.pkl$')
+        # One writer, so checkpoints land in the order they were taken
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkpointer')
+        self._pending = []
+        # Retention on the writer thread must not delete a checkpoint between listing and reading it
+        self._lock = RLock()
+
+    def __enter__(self) -> 'Checkpointer':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def checkpoints(self) -> List[str]:
+        # Paths of the finished checkpoints, oldest first
+        with self._lock:
+            steps = sorted(int(match.group(1)) for match in map(self._pattern.match, os.listdir(self._directory))
+                           if match is not None)
+
+        return [self._path(step) for step in steps]
+
+    def latest(self) -> Optional[str]:
+        checkpoints = self.checkpoints
+        return checkpoints[-1] if len(checkpoints) > 0 else None
+
+    def save(self, agent: Any, step: int) -> Future:
+        checkpoint = {'agent': type(agent).__name__, 'step': step, 'state': agent.state_dict(),
+                      'rng_state': get_rng_state()}
+
+        self._pending = [future for future in self._pending if not future.done() or future.exception() is not None]
+        future = self._executor.submit(self._write, checkpoint, self._path(step))
+        self._pending.append(future)
+
+        return future
+
+    def load(self, agent: Any, path: Optional[str] = None, restore_rng_state: bool = True) -> Optional[int]:
+        # Restores the agent (and the RNGs) from the given or the latest checkpoint and returns its step,
+        # None if there is no checkpoint yet
+        with self._lock:
+            if path is None:
+                path = self.latest()
+                if path is None:
+                    return None
+
+            checkpoint = self.read(path)
+
+        if checkpoint['agent'] != type(agent).__name__:
+            raise Exception(f'Checkpoint of a {checkpoint["agent"]} cannot be loaded into a {type(agent).__name__}')
+
+        agent.load_state_dict(checkpoint['state'])
+
+        if restore_rng_state:
+            set_rng_state(checkpoint['rng_state'])
+
+        return checkpoint['step']
+
+    def wait(self) -> None:
+        # Blocks until every checkpoint taken so far is on disk, raises the first write error
+        pending = self._pending
+        self._pending = []
+
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def read(path: str) -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def _path(self, step: int) -> str:
+        return os.path.join(self._directory, f'{self._prefix}_{step:010d}.pkl')
+
+    def _write(self, checkpoint: Dict[str, Any], path: str) -> str:
+        tmp_path = f'{path}.tmp'
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp_path, path)
+        finally:
+            # Only left behind when the write failed
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._remove_old_checkpoints()
+
+        return path
+
+    def _remove_old_checkpoints(self) -> None:
+        if self._keep_last is None:
+            return
+
+        with self._lock:
+            for path in self.checkpoints[:-self._keep_last]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,170 @@
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+import torch
+
+
+class InferenceServer:
+    # Collects action requests from concurrent games and answers them with one forward pass per micro-batch. A batch
+    # is run as soon as it holds max_batch_size requests or max_wait seconds after its first request arrived.
+    def __init__(self, model: Callable[[torch.Tensor], torch.Tensor], max_batch_size: int = 256,
+                 max_wait: float = 0.001, device: Any = 'cpu') -> None:
+        if max_batch_size < 1:
+            raise Exception('Max batch size must be positive')
+        if max_wait < 0:
+            raise Exception('Max wait cannot be negative')
+
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._device = device
+        self._requests = Queue()
+        self._thread = None
+        # Guards _thread, so no request can be queued behind the stop sentinel
+        self._lock = Lock()
+        self._nbr_of_batches = 0
+        self._nbr_of_requests = 0
+        self._largest_batch_size = 0
+
+    def __enter__(self) -> 'InferenceServer':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def nbr_of_batches(self) -> int:
+        return self._nbr_of_batches
+
+    @property
+    def nbr_of_requests(self) -> int:
+        return self._nbr_of_requests
+
+    @property
+    def largest_batch_size(self) -> int:
+        return self._largest_batch_size
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._serve, daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+
+            self._thread = None
+            self._requests.put(None)
+
+        thread.join()
+        self._fail_pending_requests()
+
+    def submit(self, state: Union[torch.Tensor, Sequence[float]],
+               action_mask: Optional[Union[torch.Tensor, Sequence[bool]]] = None) -> Future:
+        # Resolves to the index of the best legal action
+        future = Future()
+
+        with self._lock:
+            if self._thread is None:
+                raise Exception('Inference server is not running')
+
+            self._requests.put((state, action_mask, future))
+
+        return future
+
+    def infer(self, state: Union[torch.Tensor, Sequence[float]],
+              action_mask: Optional[Union[torch.Tensor, Sequence[bool]]] = None) -> int:
+        return self.submit(state, action_mask).result()
+
+    def infer_batch(self, states: torch.Tensor, action_masks: Optional[torch.Tensor] = None) -> torch.Tensor:
+        # Synchronous path for callers that already hold a batch, e.g. the slots of a vectorized environment
+        actions = []
+
+        with torch.no_grad():
+            for start in range(0, len(states), self._max_batch_size):
+                chunk = slice(start, start + self._max_batch_size)
+                preds = self._model(torch.as_tensor(states[chunk], dtype=torch.float32, device=self._device))
+
+                if action_masks is not None:
+                    mask = torch.as_tensor(action_masks[chunk], dtype=torch.bool, device=preds.device)
+                    preds = preds.masked_fill(mask.logical_not(), float('-inf'))
+
+                actions.append(preds.argmax(dim=1))
+
+        return torch.cat(actions) if len(actions) > 0 else torch.zeros(0, dtype=torch.int64)
+
+    def _serve(self) -> None:
+        is_stopping = False
+
+        while not is_stopping:
+            request = self._requests.get()
+            if request is None:
+                break
+
+            batch = [request]
+            deadline = monotonic() + self._max_wait
+
+            while len(batch) < self._max_batch_size:
+                try:
+                    request = self._requests.get(timeout=max(deadline - monotonic(), 0.0))
+                except Empty:
+                    break
+
+                if request is None:
+                    is_stopping = True
+                    break
+
+                batch.append(request)
+
+            self._run(batch)
+
+    def _run(self, batch: List[Tuple[Any, Any, Future]]) -> None:
+        futures = [future for _, _, future in batch]
+
+        try:
+            states = torch.stack([torch.as_tensor(state, dtype=torch.float32).reshape(-1) for state, _, _ in batch])
+
+            with torch.no_grad():
+                preds = self._model(states.to(self._device))
+
+            masks = torch.stack([self._create_mask(action_mask, preds.shape[1]) for _, action_mask, _ in batch])
+            actions = preds.masked_fill(masks.to(preds.device).logical_not(), float('-inf')).argmax(dim=1).tolist()
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        self._nbr_of_batches += 1
+        self._nbr_of_requests += len(batch)
+        self._largest_batch_size = max(self._largest_batch_size, len(batch))
+
+        for future, action in zip(futures, actions):
+            future.set_result(action)
+
+    def _fail_pending_requests(self) -> None:
+        # Whatever the serving thread left in the queue would otherwise never resolve
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except Empty:
+                return
+
+            if request is not None:
+                request[2].set_exception(Exception('Inference server stopped'))
+
+    @staticmethod
+    def _create_mask(action_mask: Optional[Union[torch.Tensor, Sequence[bool]]], size: int) -> torch.Tensor:
+        if action_mask is None:
+            return torch.ones(size, dtype=torch.bool)
+
+        return torch.as_tensor(action_mask, dtype=torch.bool).reshape(-1).cpu()
@@ -0,0 +1,67 @@
+from .sum_tree import SumTree
+from .tensor_replay_memory import TensorReplayMemory
+from typing import Any, Dict, Sequence, Tuple, Union
+import numpy as np
+import torch
+
+
+class PrioritizedReplayMemory(TensorReplayMemory):
+    # Proportional prioritized replay: experience i is sampled with probability p_i^alpha / sum(p^alpha) and weighted
+    # by (N * P(i))^-beta / max weight, beta growing to 1 by beta_increment per sample. New experiences get the
+    # highest priority seen so far, so each one is replayed at least once.
+    def __init__(self, state_size: int, memory_size: int = 512, batch_size: int = 64, device: Any = 'cpu',
+                 alpha: float = 0.6, beta: float = 0.4, beta_increment: float = 0.0001,
+                 min_priority: float = 0.00001) -> None:
+        super().__init__(state_size=state_size, memory_size=memory_size, batch_size=batch_size, device=device)
+        self._alpha = alpha
+        self._beta = beta
+        self._beta_increment = beta_increment
+        self._min_priority = min_priority
+        self._max_priority = 1.0
+        self._sum_tree = SumTree(memory_size)
+
+    @property
+    def beta(self) -> float:
+        return self._beta
+
+    def insert(self, state: Union[torch.Tensor, Sequence[float]], action: int, reward: float,
+               next_state: Union[torch.Tensor, Sequence[float]], is_terminal: bool) -> None:
+        self._sum_tree.update(self._memory_index, self._max_priority ** self._alpha)
+        super().insert(state, action, reward, next_state, is_terminal)
+
+    def state_dict(self) -> Dict[str, Any]:
+        state = super().state_dict()
+        state.update(sum_tree=self._sum_tree.state_dict(), beta=self._beta, max_priority=self._max_priority)
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict(state)
+        self._sum_tree.load_state_dict(state['sum_tree'])
+        self._beta = state['beta']
+        self._max_priority = state['max_priority']
+
+    def get_prioritized_sample(self) -> Tuple[Tuple[torch.Tensor, ...], torch.Tensor, np.ndarray]:
+        if not self.can_sample():
+            raise Exception(f'Cannot sample {self._batch_size} of {self._size} experiences')
+
+        # One value per equal slice of the total priority, so a batch covers the whole distribution
+        segment = self._sum_tree.total / self._batch_size
+        values = (np.arange(self._batch_size) + np.random.random(self._batch_size)) * segment
+        indices = np.minimum(self._sum_tree.find(values), self._size - 1)
+
+        probabilities = self._sum_tree.get(indices) / self._sum_tree.total
+        weights = (self._size * probabilities) ** -self._beta
+        weights /= weights.max()
+        self._beta = min(1.0, self._beta + self._beta_increment)
+
+        experiences = self._get(torch.as_tensor(indices, device=self._device))
+        return experiences, torch.as_tensor(weights, dtype=torch.float32, device=self._device), indices
+
+    def update_priorities(self, indices: np.ndarray, td_errors: Union[torch.Tensor, np.ndarray]) -> None:
+        if isinstance(td_errors, torch.Tensor):
+            td_errors = td_errors.detach().cpu().numpy()
+
+        priorities = np.abs(np.asarray(td_errors, dtype=np.float64)).reshape(-1) + self._min_priority
+        self._max_priority = max(self._max_priority, float(priorities.max()))
+        self._sum_tree.update(indices, priorities ** self._alpha)
@@ -0,0 +1,177 @@
+from typing import Any, Hashable, List, Optional
+import json
+import numpy as np
+import os
+
+
+class QTable:
+    def __init__(self, nbr_of_actions: int, init_q_value: float = 0.0, capacity: int = 1024,
+                 dtype: Any = np.float64) -> None:
+        if nbr_of_actions < 1 or capacity < 1:
+            raise Exception('Q-table needs at least one action and a positive capacity')
+
+        self._nbr_of_actions = nbr_of_actions
+        self._init_q_value = init_q_value
+        self._values = np.full((capacity, nbr_of_actions), init_q_value, dtype=dtype)
+        self._masks = np.zeros((capacity, nbr_of_actions), dtype=bool)
+        self._index = {}
+        self._states = []
+        self._legal_indices = {}
+        self._is_read_only = False
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, state: Hashable) -> bool:
+        return state in self._index
+
+    @property
+    def nbr_of_actions(self) -> int:
+        return self._nbr_of_actions
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:len(self._states)]
+
+    @property
+    def masks(self) -> np.ndarray:
+        return self._masks[:len(self._states)]
+
+    @property
+    def states(self) -> List[Hashable]:
+        return self._states
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._is_read_only
+
+    @classmethod
+    def load(cls, path: str, read_only: bool = False) -> 'QTable':
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+
+        # Read-only tables are memory mapped, so processes serving the same file share its pages
+        mmap_mode = 'r' if read_only else None
+        values = np.load(os.path.join(path, 'values.npy'), mmap_mode=mmap_mode)
+        masks = np.load(os.path.join(path, 'masks.npy'), mmap_mode=mmap_mode)
+        states = np.load(os.path.join(path, 'states.npy'))
+
+        q_table = cls(nbr_of_actions=meta['nbr_of_actions'], init_q_value=meta['init_q_value'],
+                      capacity=max(len(values), 1), dtype=values.dtype if read_only else np.float64)
+
+        if read_only:
+            q_table._values = values
+            q_table._masks = masks
+            q_table._is_read_only = True
+        else:
+            q_table._values[:len(values)] = values
+            q_table._masks[:len(masks)] = masks
+
+        q_table._states = [tuple(state) for state in states.tolist()]
+        q_table._index = {state: row for row, state in enumerate(q_table._states)}
+
+        return q_table
+
+    def save(self, path: str, dtype: Any = None) -> None:
+        os.makedirs(path, exist_ok=True)
+
+        values = self.values if dtype is None else self.values.astype(dtype)
+        np.save(os.path.join(path, 'values.npy'), values)
+        np.save(os.path.join(path, 'masks.npy'), self.masks)
+        np.save(os.path.join(path, 'states.npy'), self._states_as_array())
+
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump({'nbr_of_actions': self._nbr_of_actions, 'init_q_value': self._init_q_value}, f)
+
+    def copy(self) -> 'QTable':
+        # Writable copy, also of read-only tables
+        q_table = QTable(nbr_of_actions=self._nbr_of_actions, init_q_value=self._init_q_value,
+                         capacity=max(len(self._states), 1), dtype=self._values.dtype)
+        q_table._values[:len(self._states)] = self.values
+        q_table._masks[:len(self._states)] = self.masks
+        q_table._states = list(self._states)
+        q_table._index = dict(self._index)
+
+        return q_table
+
+    def find_row(self, state: Hashable) -> Optional[int]:
+        return self._index.get(state)
+
+    def row(self, state: Hashable) -> int:
+        row = self._index.get(state)
+
+        if row is None:
+            row = self._add_state(state)
+
+        return row
+
+    def legal_indices(self, row: int) -> Optional[List[int]]:
+        # Rows without legal actions (terminal states) are cached as None too, set_legal replaces the entry
+        if row in self._legal_indices:
+            return self._legal_indices[row]
+
+        legal_indices = np.flatnonzero(self._masks[row]).tolist() or None
+        self._legal_indices[row] = legal_indices
+
+        return legal_indices
+
+    def set_legal(self, row: int, action_indices: List[int]) -> None:
+        self._masks[row, action_indices] = True
+        self._legal_indices[row] = np.flatnonzero(self._masks[row]).tolist()
+
+    def max_value(self, row: int) -> Optional[float]:
+        legal_indices = self.legal_indices(row)
+        if legal_indices is None:
+            return None
+
+        # Plain Python over one row, a masked NumPy reduction costs more than the max itself on rows this short
+        values = self._values[row].tolist()
+        return max([values[i] for i in legal_indices])
+
+    def best_action_indices(self, row: int) -> List[int]:
+        legal_indices = self.legal_indices(row)
+        if legal_indices is None:
+            return []
+
+        values = self._values[row].tolist()
+        best = max([values[i] for i in legal_indices])
+        return [i for i in legal_indices if values[i] == best]
+
+    def _add_state(self, state: Hashable) -> int:
+        if self._is_read_only:
+            raise Exception('Cannot add states to a read-only Q-table')
+
+        row = len(self._states)
+
+        if row == len(self._values):
+            self._grow()
+
+        self._index[state] = row
+        self._states.append(state)
+
+        return row
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._values)
+
+        values = np.full((capacity, self._nbr_of_actions), self._init_q_value, dtype=self._values.dtype)
+        values[:len(self._values)] = self._values
+        masks = np.zeros((capacity, self._nbr_of_actions), dtype=bool)
+        masks[:len(self._masks)] = self._masks
+
+        self._values = values
+        self._masks = masks
+
+    def _states_as_array(self) -> np.ndarray:
+        if len(self._states) == 0:
+            return np.zeros((0, 0), dtype=np.int8)
+
+        states = np.array(self._states)
+
+        if states.ndim != 2 or not np.issubdtype(states.dtype, np.integer):
+            raise Exception('Only states made of equally long integer tuples can be saved')
+
+        if states.min() >= np.iinfo(np.int8).min and states.max() <= np.iinfo(np.int8).max:
+            states = states.astype(np.int8)
+
+        return states
@@ -0,0 +1,31 @@
+from environment import VecTicTacToe
+from typing import Callable
+import numpy as np
+
+
+def choose_random_actions(mask: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    # One uniformly random True column per row of mask
+    return np.argmax(np.where(mask, rng.random(mask.shape), -1.0), axis=1)
+
+
+def play_against_random(env: VecTicTacToe, choose_actions: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                        rng: np.random.Generator) -> np.ndarray:
+    # Plays every board of env once to its end, with 'x' moving by choose_actions(is_agent, action_mask) on the boards
+    # selected by is_agent and 'o' moving at random. Returns the winner of every board.
+    winners = np.zeros(env.nbr_of_boards, dtype=np.int8)
+    is_playing = np.ones(env.nbr_of_boards, dtype=bool)
+
+    while is_playing.any():
+        mask = env.action_mask
+        actions = choose_random_actions(mask, rng)
+        is_agent = env.turn == VecTicTacToe.X
+
+        if is_agent.any():
+            actions[is_agent] = choose_actions(is_agent, mask[is_agent])
+
+        env.execute_action(actions)
+
+        winners[is_playing] = env.winner[is_playing]
+        is_playing &= ~env.done
+
+    return winners
@@ -1,5 +1,5 @@
 from random import sample
-from typing import Any, List
+from typing import Any, Dict, List
 
 
 class ReplayMemory:
@@ -33,6 +33,17 @@ class ReplayMemory:
             self._memory[self._memory_index] = experience
             self._update_memory_index()
 
+    def state_dict(self) -> Dict[str, Any]:
+        # Experiences are never changed in place, so a shallow copy of the list is a snapshot
+        return {'memory': list(self._memory), 'memory_index': self._memory_index}
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        if len(state['memory']) > self._memory_size:
+            raise Exception(f'Cannot load {len(state["memory"])} experiences into a memory of {self._memory_size}')
+
+        self._memory = list(state['memory'])
+        self._memory_index = state['memory_index']
+
     def flush(self) -> List[Any]:
         memory = self._memory
         self._memory = []
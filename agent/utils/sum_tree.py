@@ -0,0 +1,59 @@
+from typing import Any, Dict, Union
+import numpy as np
+
+
+class SumTree:
+    # Binary tree in a flat array: node i has the children 2i and 2i + 1, the leaves start at _nbr_of_leaves and
+    # every inner node holds the sum of its leaves. Updates and proportional lookups walk one root-to-leaf path.
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise Exception('Sum tree capacity must be positive')
+
+        self._capacity = capacity
+        self._nbr_of_leaves = 1 << (capacity - 1).bit_length()
+        self._depth = self._nbr_of_leaves.bit_length() - 1
+        self._tree = np.zeros(2 * self._nbr_of_leaves, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> float:
+        return float(self._tree[1])
+
+    def get(self, indices: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        return self._tree[np.asarray(indices) + self._nbr_of_leaves]
+
+    def update(self, indices: Union[int, np.ndarray], priorities: Union[float, np.ndarray]) -> None:
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        if (indices < 0).any() or (indices >= self._capacity).any():
+            raise Exception(f'Sum tree index out of range: {indices}')
+
+        nodes = indices + self._nbr_of_leaves
+        self._tree[nodes] = priorities
+
+        for _ in range(self._depth):
+            nodes = np.unique(nodes >> 1)
+            self._tree[nodes] = self._tree[2 * nodes] + self._tree[2 * nodes + 1]
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {'capacity': self._capacity, 'tree': self._tree.copy()}
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        if state['capacity'] != self._capacity:
+            raise Exception(f'Cannot load a sum tree of {state["capacity"]} leaves into one of {self._capacity}')
+
+        self._tree[:] = state['tree']
+
+    def find(self, values: Union[float, np.ndarray]) -> np.ndarray:
+        # Index of the leaf whose prefix sum interval contains each value
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64)).copy()
+        nodes = np.ones(len(values), dtype=np.int64)
+
+        for _ in range(self._depth):
+            left = 2 * nodes
+            go_right = values > self._tree[left]
+            values -= np.where(go_right, self._tree[left], 0.0)
+            nodes = left + go_right
+
+        return np.minimum(nodes - self._nbr_of_leaves, self._capacity - 1)
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Sequence, Tuple, Union
+import random
+import torch
+
+
+class TensorReplayMemory:
+    # Ring buffer of experiences in preallocated [memory_size, ...] tensors, sampled with one random index tensor
+    def __init__(self, state_size: int, memory_size: int = 512, batch_size: int = 64, device: Any = 'cpu') -> None:
+        if batch_size > memory_size:
+            raise Exception('Batch size cannot exceed memory size')
+
+        self._memory_size = memory_size
+        self._batch_size = batch_size
+        self._device = device
+        self._states = torch.zeros((memory_size, state_size), dtype=torch.float32, device=device)
+        self._actions = torch.zeros(memory_size, dtype=torch.int64, device=device)
+        self._rewards = torch.zeros(memory_size, dtype=torch.float32, device=device)
+        self._next_states = torch.zeros((memory_size, state_size), dtype=torch.float32, device=device)
+        self._is_terminals = torch.zeros(memory_size, dtype=torch.bool, device=device)
+        self._memory_index = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def can_sample(self) -> bool:
+        return self._size >= self._batch_size
+
+    def get_sample(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        if not self.can_sample():
+            raise Exception(f'Cannot sample {self._batch_size} of {self._size} experiences')
+
+        # Without replacement, like ReplayMemory. random.sample over a range is O(batch_size), randperm is O(size)
+        indices = torch.as_tensor(random.sample(range(self._size), self._batch_size), device=self._device)
+        return self._get(indices)
+
+    def insert(self, state: Union[torch.Tensor, Sequence[float]], action: int, reward: float,
+               next_state: Union[torch.Tensor, Sequence[float]], is_terminal: bool) -> None:
+        i = self._memory_index
+
+        self._states[i] = torch.as_tensor(state, dtype=torch.float32).reshape(-1)
+        self._actions[i] = action
+        self._rewards[i] = reward
+        self._next_states[i] = torch.as_tensor(next_state, dtype=torch.float32).reshape(-1)
+        self._is_terminals[i] = is_terminal
+
+        self._update_memory_index()
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {'states': self._states.clone(), 'actions': self._actions.clone(), 'rewards': self._rewards.clone(),
+                'next_states': self._next_states.clone(), 'is_terminals': self._is_terminals.clone(),
+                'memory_index': self._memory_index, 'size': self._size}
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        if state['states'].shape != self._states.shape:
+            raise Exception(f'Cannot load a memory of {tuple(state["states"].shape)} into {tuple(self._states.shape)}')
+
+        for name in ('states', 'actions', 'rewards', 'next_states', 'is_terminals'):
+            getattr(self, f'_{name}').copy_(state[name])
+
+        self._memory_index = state['memory_index']
+        self._size = state['size']
+
+    def _get(self, indices: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        return (self._states[indices], self._actions[indices], self._rewards[indices], self._next_states[indices],
+                self._is_terminals[indices])
+
+    def _update_memory_index(self) -> None:
+        self._memory_index += 1
+        self._size = max(self._size, self._memory_index)
+
+        if self._memory_index >= self._memory_size:
+            self._memory_index = 0
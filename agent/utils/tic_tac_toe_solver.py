@@ -0,0 +1,104 @@
+from .q_table import QTable
+from environment import StateSpace
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+
+# Retrograde analysis over every reachable TicTacToe position. Q-values use the same convention the QLearning agent
+# learns: a move that wins is worth 1, a draw 0, a loss after the opponent's reply -1 and otherwise gamma times the
+# value of the position the agent sees on its next turn. The opponent is either a perfect player ('minimax') or
+# uniformly random ('random'), the latter being what an agent trained against the Random agent converges to.
+class TicTacToeSolver:
+    OPPONENTS = ('minimax', 'random')
+
+    def __init__(self, gamma: float = 0.9, opponent: str = 'minimax',
+                 state_space: Optional[StateSpace] = None) -> None:
+        if opponent not in self.OPPONENTS:
+            raise Exception(f'Unknown opponent: {opponent}')
+
+        self._gamma = gamma
+        self._opponent = opponent
+        self._state_space = StateSpace() if state_space is None else state_space
+        self._q_values, self._values = self._solve()
+
+    @property
+    def state_space(self) -> StateSpace:
+        return self._state_space
+
+    @property
+    def q_values(self) -> np.ndarray:
+        return self._q_values
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def q_table(self) -> Dict[Tuple[int, ...], Dict[Tuple[int, int], float]]:
+        # Layout of QLearning._q_table, terminal positions included without actions
+        q_table = {}
+        actions = self._state_space.actions
+        legal_actions = self._state_space.legal_actions
+
+        for state_id in range(len(self._state_space)):
+            q_table[self._state_space.decode_observation(state_id)] = {
+                actions[a]: float(self._q_values[state_id, a]) for a in np.flatnonzero(legal_actions[state_id])
+            }
+
+        return q_table
+
+    def array_q_table(self, all_possible_actions: Optional[Tuple[Any, ...]] = None) -> QTable:
+        actions = self._state_space.actions
+        if all_possible_actions is None:
+            all_possible_actions = actions
+
+        columns = [all_possible_actions.index(action) for action in actions]
+        q_table = QTable(nbr_of_actions=len(all_possible_actions), capacity=len(self._state_space))
+
+        for state_id in range(len(self._state_space)):
+            q_table.row(self._state_space.decode_observation(state_id))
+
+        q_table.values[:, columns] = self._q_values
+        q_table.masks[:, columns] = self._state_space.legal_actions
+
+        return q_table
+
+    def _solve(self) -> Tuple[np.ndarray, np.ndarray]:
+        space = self._state_space
+        nbr_of_states = len(space)
+
+        legal = space.legal_actions
+        successors = np.where(legal, space.successors, 0)
+        is_terminal = space.is_terminal
+        is_win = space.winner != 0
+
+        q_values = np.zeros((nbr_of_states, space.NBR_OF_ACTIONS), dtype=np.float64)
+        # Value of a position for the player to move (v) and for the player who just moved, after the reply (w)
+        v = np.zeros(nbr_of_states, dtype=np.float64)
+        w = np.zeros(nbr_of_states, dtype=np.float64)
+
+        # Successors are one mark deeper, so one sweep from the full boards back to the empty board is exact
+        for depth in range(space.NBR_OF_ACTIONS - 1, -1, -1):
+            ids = np.flatnonzero((space.depth == depth) & ~is_terminal)
+            if len(ids) == 0:
+                continue
+
+            layer_legal = legal[ids]
+            layer_successors = successors[ids]
+            successor_is_terminal = is_terminal[layer_successors]
+            successor_is_win = is_win[layer_successors]
+
+            q = np.where(successor_is_terminal, successor_is_win.astype(np.float64), w[layer_successors])
+            q_values[ids] = np.where(layer_legal, q, 0.0)
+            v[ids] = np.max(np.where(layer_legal, q, -np.inf), axis=1)
+
+            reply = np.where(successor_is_terminal, -successor_is_win.astype(np.float64),
+                             self._gamma * v[layer_successors])
+            if self._opponent == 'minimax':
+                w[ids] = np.min(np.where(layer_legal, reply, np.inf), axis=1)
+            else:
+                w[ids] = np.sum(np.where(layer_legal, reply, 0.0), axis=1) / layer_legal.sum(axis=1)
+
+        for array in (q_values, v):
+            array.flags.writeable = False
+
+        return q_values, v
@@ -1,2 +1,6 @@
 from .base import Base
-from .tic_tac_toe import TicTacToe
+from .reversible import Reversible
+from .snapshottable import Snapshottable
+from .transition import Transition
+from .tic_tac_toe import TicTacToe, VecTicTacToe, StateSpace
+from .mnk_game import MnkGame
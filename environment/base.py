@@ -1,3 +1,4 @@
+from .transition import Transition
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from typing import Any, Tuple
@@ -8,11 +9,20 @@ class Base(ABC):
         self._state = self._create_init_state()
         self._is_active = True
         self._possible_actions = self._create_init_actions()
+        self._state_view = None
+        self._possible_actions_view = None
 
     @property
     def state(self) -> Any:
         return deepcopy(self._state)
 
+    @property
+    def state_view(self) -> Any:
+        if self._state_view is None:
+            self._state_view = self._create_state_view()
+
+        return self._state_view
+
     @property
     def is_active(self) -> bool:
         return self._is_active
@@ -21,15 +31,27 @@ class Base(ABC):
     def possible_actions(self) -> Tuple[Any, ...]:
         return deepcopy(self._possible_actions)
 
+    @property
+    def possible_actions_view(self) -> Tuple[Any, ...]:
+        if self._possible_actions_view is None:
+            self._possible_actions_view = self._create_possible_actions_view()
+
+        return self._possible_actions_view
+
     def reset(self) -> None:
         self._state = self._create_init_state()
         self._is_active = True
         self._possible_actions = self._create_init_actions()
+        self._invalidate_views()
 
     @abstractmethod
     def execute_action(self, action: Any) -> None:
         pass
 
+    def step(self, action: Any) -> Transition:
+        self.execute_action(action)
+        return self._create_transition()
+
     @abstractmethod
     def _create_init_state(self) -> Any:
         pass
@@ -37,3 +59,24 @@ class Base(ABC):
     @abstractmethod
     def _create_init_actions(self) -> Tuple[Any, ...]:
         pass
+
+    def _create_state_view(self) -> Any:
+        return self._freeze(self._state)
+
+    def _create_possible_actions_view(self) -> Tuple[Any, ...]:
+        return self._freeze(self._possible_actions)
+
+    def _create_transition(self) -> Transition:
+        return Transition(state=self.state_view, is_active=self._is_active,
+                          possible_actions=self.possible_actions_view)
+
+    def _invalidate_views(self) -> None:
+        self._state_view = None
+        self._possible_actions_view = None
+
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+
+        return value
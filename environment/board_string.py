@@ -0,0 +1,30 @@
+from typing import Sequence
+
+
+def board_to_string(state: Sequence[Sequence[str]]) -> str:
+    total_rows = len(state)
+    total_cells = len(state[total_rows - 1]) if total_rows > 0 else 0
+    as_str = ''
+
+    for i in range(total_rows):
+        for j in range(total_cells):
+            cell_value = state[i][j]
+
+            if i < total_rows - 1:
+                if cell_value != '':
+                    str_value = f'_{cell_value.upper()}_'
+                else:
+                    str_value = '___'
+            else:
+                if cell_value != '':
+                    str_value = f' {cell_value.upper()} '
+                else:
+                    str_value = '   '
+
+            if j < total_cells - 1:
+                str_value += '|'
+
+            as_str += str_value
+        as_str += '\n'
+
+    return as_str
@@ -0,0 +1 @@
+from .mnk_game import MnkGame
@@ -0,0 +1,201 @@
+from .. import Base, Reversible, Snapshottable, Transition
+from ..board_string import board_to_string
+from typing import Dict, List, Optional, Tuple
+
+
+class MnkGame(Base, Reversible, Snapshottable):
+    _DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, m: int = 15, n: int = 15, k: int = 5, first_turn: Optional[str] = 'x') -> None:
+        if m < 1 or n < 1:
+            raise Exception(f'Invalid board size: {m}x{n}')
+        if k < 1 or k > max(m, n):
+            raise Exception(f'Cannot get {k} in a row on a {m}x{n} board')
+
+        self._rows = m
+        self._columns = n
+        self._k = k
+        self._all_actions = tuple((i, j) for i in range(m) for j in range(n))
+        super().__init__()
+        self._first_turn = first_turn
+        self._rectify_first_turn()
+        self._turn = self._first_turn
+        self._win_position = None
+        self._winner = None
+        self._bitboard = self._create_init_bitboard()
+        self._undo_stack = []
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def possible_actions(self) -> Tuple[Tuple[int, int], ...]:
+        return self.possible_actions_view
+
+    @property
+    def bitboard(self) -> Tuple[int, int]:
+        return self._bitboard['x'], self._bitboard['o']
+
+    @property
+    def turn(self) -> str:
+        return self._turn
+
+    @property
+    def win_position(self) -> Optional[Tuple[Tuple[int, int], ...]]:
+        return self._win_position
+
+    @property
+    def winner(self) -> Optional[str]:
+        return self._winner
+
+    def execute_action(self, action: Tuple[int, int]) -> None:
+        if action in self._possible_actions:
+            self._update_state(action)
+            self._update_win_position(action)
+            self._update_winner()
+            self._remove_possible_action(action)
+            self._toggle_turn()
+            self._update_is_active()
+            self._invalidate_views()
+
+    def push(self, action: Tuple[int, int]) -> None:
+        if action in self._possible_actions:
+            self._undo_stack.append((action, self._turn, self._winner, self._win_position, self._is_active))
+        else:
+            self._undo_stack.append((None, self._turn, self._winner, self._win_position, self._is_active))
+
+        self.execute_action(action)
+
+    def pop(self) -> None:
+        if len(self._undo_stack) == 0:
+            raise Exception('No pushed action to pop')
+
+        action, self._turn, self._winner, self._win_position, self._is_active = self._undo_stack.pop()
+
+        if action is not None:
+            i, j = action
+            self._state[i][j] = ''
+            self._bitboard[self._turn] &= ~(1 << (i * self._columns + j))
+            self._possible_actions[action] = None
+            self._invalidate_views()
+
+    def snapshot(self) -> Tuple[int, int, str, Optional[str], Optional[Tuple[Tuple[int, int], ...]]]:
+        return self._bitboard['x'], self._bitboard['o'], self._turn, self._winner, self._win_position
+
+    def restore(self, snapshot: Tuple[int, int, str, Optional[str], Optional[Tuple[Tuple[int, int], ...]]]) -> None:
+        self._bitboard['x'], self._bitboard['o'], self._turn, self._winner, self._win_position = snapshot
+        self._state = self._create_init_state()
+        self._possible_actions = self._create_init_actions()
+
+        for mark, bits in self._bitboard.items():
+            for cell, action in enumerate(self._all_actions):
+                if bits >> cell & 1:
+                    self._state[action[0]][action[1]] = mark
+                    del self._possible_actions[action]
+
+        self._update_is_active()
+        self._invalidate_views()
+
+    def reset(self) -> None:
+        super(MnkGame, self).reset()
+        self._turn = self._first_turn
+        self._win_position = None
+        self._winner = None
+        self._bitboard = self._create_init_bitboard()
+        self._undo_stack = []
+
+    def get_state_as_string(self) -> str:
+        return board_to_string(self.state_view)
+
+    def _rectify_first_turn(self) -> None:
+        if isinstance(self._first_turn, str) and self._first_turn.lower() in ('x', 'o'):
+            self._first_turn = self._first_turn.lower()
+        else:
+            self._first_turn = 'x'
+
+    def _create_transition(self) -> Transition:
+        return Transition(state=self.state_view, is_active=self._is_active,
+                          possible_actions=self.possible_actions_view, winner=self._winner)
+
+    def _create_init_state(self) -> List[List[str]]:
+        return [['' for _ in range(self._columns)] for _ in range(self._rows)]
+
+    def _create_init_actions(self) -> Dict[Tuple[int, int], None]:
+        # Dict used as a set, so a move is removed and restored in O(1)
+        return dict.fromkeys(self._all_actions)
+
+    def _create_possible_actions_view(self) -> Tuple[Tuple[int, int], ...]:
+        return tuple(action for action in self._all_actions if action in self._possible_actions)
+
+    @staticmethod
+    def _create_init_bitboard() -> Dict[str, int]:
+        return {'x': 0, 'o': 0}
+
+    def _update_state(self, action: Tuple[int, int]) -> None:
+        i, j = action
+        self._state[i][j] = self._turn
+        self._bitboard[self._turn] |= 1 << (i * self._columns + j)
+
+    def _update_win_position(self, action: Tuple[int, int]) -> None:
+        self._win_position = self._find_win_position(action)
+
+    def _update_winner(self) -> None:
+        if self._win_position is not None:
+            self._winner = self._turn
+
+    def _remove_possible_action(self, action: Tuple[int, int]) -> None:
+        del self._possible_actions[action]
+
+    def _update_is_active(self) -> None:
+        self._is_active = len(self._possible_actions) > 0
+        if self._winner is not None:
+            self._is_active = False
+
+    def _toggle_turn(self) -> None:
+        if self._turn == 'x':
+            self._turn = 'o'
+        else:
+            self._turn = 'x'
+
+    def _find_win_position(self, action: Tuple[int, int]) -> Optional[Tuple[Tuple[int, int], ...]]:
+        for direction in self._DIRECTIONS:
+            position = self._find_line_through(action, direction)
+
+            if len(position) >= self._k:
+                # The line can be up to 2k - 1 marks long, the first k of them contain the action
+                return position[:self._k]
+
+        return None
+
+    def _find_line_through(self, action: Tuple[int, int], direction: Tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
+        backward = self._count_marks_from(action, -direction[0], -direction[1])
+        forward = self._count_marks_from(action, direction[0], direction[1])
+
+        i = action[0] - backward * direction[0]
+        j = action[1] - backward * direction[1]
+
+        return tuple((i + step * direction[0], j + step * direction[1]) for step in range(backward + forward + 1))
+
+    def _count_marks_from(self, action: Tuple[int, int], di: int, dj: int) -> int:
+        i, j = action
+        cnt = 0
+
+        while cnt < self._k - 1:
+            i += di
+            j += dj
+
+            if i < 0 or i >= self._rows or j < 0 or j >= self._columns or self._state[i][j] != self._turn:
+                break
+
+            cnt += 1
+
+        return cnt
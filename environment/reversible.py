@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Reversible(ABC):
+    # Environments that can make and unmake moves in place, e.g. for tree search
+    @abstractmethod
+    def push(self, action: Any) -> None:
+        pass
+
+    @abstractmethod
+    def pop(self) -> None:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Hashable
+
+
+class Snapshottable(ABC):
+    # Environments whose full state round-trips through a hashable snapshot, e.g. as a transposition table key
+    @abstractmethod
+    def snapshot(self) -> Hashable:
+        pass
+
+    @abstractmethod
+    def restore(self, snapshot: Hashable) -> None:
+        pass
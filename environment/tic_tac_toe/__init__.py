@@ -1 +1,3 @@
 from .tic_tac_toe import TicTacToe
+from .vec_tic_tac_toe import VecTicTacToe
+from .state_space import StateSpace
@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Cell (i, j) of the 3x3 board is stored in bit i * 3 + j of a 9-bit integer.
+ROWS = 3
+COLUMNS = 3
+FULL_MASK = (1 << (ROWS * COLUMNS)) - 1
+
+ACTIONS = tuple((i, j) for i in range(ROWS) for j in range(COLUMNS))
+ACTION_BITS = {action: 1 << (action[0] * COLUMNS + action[1]) for action in ACTIONS}
+
+# Ordered like the original scan: rows, then columns, then diagonals.
+WIN_POSITIONS = tuple(tuple((i, j) for j in range(COLUMNS)) for i in range(ROWS)) + \
+                tuple(tuple((i, j) for i in range(ROWS)) for j in range(COLUMNS)) + \
+                (((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0)))
+
+
+def position_to_bits(position: Tuple[Tuple[int, int], ...]) -> int:
+    bits = 0
+    for action in position:
+        bits |= ACTION_BITS[action]
+
+    return bits
+
+
+def bits_to_actions(bits: int) -> Tuple[Tuple[int, int], ...]:
+    return tuple(action for action in ACTIONS if bits & ACTION_BITS[action])
+
+
+WIN_MASKS = tuple(position_to_bits(position) for position in WIN_POSITIONS)
+
+
+def _create_win_table() -> Tuple[Optional[Tuple[Tuple[int, int], ...]], ...]:
+    table = []
+    for bits in range(FULL_MASK + 1):
+        win_position = None
+        for mask, position in zip(WIN_MASKS, WIN_POSITIONS):
+            if bits & mask == mask:
+                win_position = position
+                break
+        table.append(win_position)
+
+    return tuple(table)
+
+
+# Maps the 9-bit board of one player to its first win position (or None).
+WIN_TABLE = _create_win_table()
+
+# Maps a mask of empty cells to the possible actions, in board order.
+ACTIONS_TABLE = tuple(bits_to_actions(bits) for bits in range(FULL_MASK + 1))
+
+
+@lru_cache(maxsize=None)
+def bits_to_rows(x_bits: int, o_bits: int) -> Tuple[Tuple[str, ...], ...]:
+    rows = []
+    for i in range(ROWS):
+        row = []
+        for j in range(COLUMNS):
+            bit = ACTION_BITS[(i, j)]
+            if x_bits & bit:
+                row.append('x')
+            elif o_bits & bit:
+                row.append('o')
+            else:
+                row.append('')
+        rows.append(tuple(row))
+
+    return tuple(rows)
+
+
+def create_init_bitboards() -> Dict[str, int]:
+    return {'x': 0, 'o': 0}
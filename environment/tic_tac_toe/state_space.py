@@ -0,0 +1,174 @@
+from .bitboard import ACTION_BITS, ACTIONS, FULL_MASK, WIN_TABLE, bits_to_rows
+from .tic_tac_toe import TicTacToe
+from .vec_tic_tac_toe import VecTicTacToe
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+# Every reachable TicTacToe position with a dense id. The player who opened the game is stored as 'x', and ids are
+# ordered by the number of marks on the board, so successors always have a larger id than their position.
+class StateSpace:
+    NBR_OF_ACTIONS = len(ACTIONS)
+
+    def __init__(self) -> None:
+        x_bits, o_bits = self._enumerate()
+        nbr_of_states = len(x_bits)
+
+        self._x_bits = np.array(x_bits, dtype=np.int32)
+        self._o_bits = np.array(o_bits, dtype=np.int32)
+
+        self._index = np.full(1 << 18, -1, dtype=np.int32)
+        self._index[(self._x_bits << 9) | self._o_bits] = np.arange(nbr_of_states, dtype=np.int32)
+
+        self._depth = np.zeros(nbr_of_states, dtype=np.int8)
+        self._winner = np.zeros(nbr_of_states, dtype=np.int8)
+        self._is_terminal = np.zeros(nbr_of_states, dtype=bool)
+        self._legal_actions = np.zeros((nbr_of_states, self.NBR_OF_ACTIONS), dtype=bool)
+        self._successors = np.full((nbr_of_states, self.NBR_OF_ACTIONS), -1, dtype=np.int32)
+        self._observations = []
+
+        for state_id, (x, o) in enumerate(zip(x_bits, o_bits)):
+            self._fill_state(state_id, x, o)
+
+        self._observation_array = np.array(self._observations, dtype=np.int8)
+
+        for array in (self._x_bits, self._o_bits, self._index, self._depth, self._winner, self._is_terminal,
+                      self._legal_actions, self._successors, self._observation_array):
+            array.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self._x_bits)
+
+    @property
+    def actions(self) -> Tuple[Tuple[int, int], ...]:
+        return ACTIONS
+
+    @property
+    def depth(self) -> np.ndarray:
+        return self._depth
+
+    @property
+    def winner(self) -> np.ndarray:
+        return self._winner
+
+    @property
+    def is_terminal(self) -> np.ndarray:
+        return self._is_terminal
+
+    @property
+    def legal_actions(self) -> np.ndarray:
+        return self._legal_actions
+
+    @property
+    def successors(self) -> np.ndarray:
+        return self._successors
+
+    @property
+    def observations(self) -> np.ndarray:
+        return self._observation_array
+
+    def encode_bitboard(self, x_bits: int, o_bits: int) -> int:
+        return int(self._index[(x_bits << 9) | o_bits])
+
+    def encode_environment(self, environment: TicTacToe) -> int:
+        x_bits, o_bits = environment.bitboard
+        x_cnt = bin(x_bits).count('1')
+        o_cnt = bin(o_bits).count('1')
+
+        if (x_cnt == o_cnt) == (environment.turn == 'x'):
+            return self.encode_bitboard(x_bits, o_bits)
+
+        return self.encode_bitboard(o_bits, x_bits)
+
+    def encode_observation(self, observation: Sequence[int]) -> int:
+        mover_bits = 0
+        opponent_bits = 0
+
+        for cell in range(self.NBR_OF_ACTIONS):
+            if observation[2 * cell + 1]:
+                mover_bits |= 1 << cell
+            elif observation[2 * cell]:
+                opponent_bits |= 1 << cell
+
+        if bin(mover_bits).count('1') == bin(opponent_bits).count('1'):
+            return self.encode_bitboard(mover_bits, opponent_bits)
+
+        return self.encode_bitboard(opponent_bits, mover_bits)
+
+    def decode_bitboard(self, state_id: int) -> Tuple[int, int]:
+        return int(self._x_bits[state_id]), int(self._o_bits[state_id])
+
+    def decode_observation(self, state_id: int) -> Tuple[int, ...]:
+        return self._observations[state_id]
+
+    def decode_state(self, state_id: int) -> Tuple[Tuple[str, ...], ...]:
+        return bits_to_rows(*self.decode_bitboard(state_id))
+
+    @staticmethod
+    def _enumerate() -> Tuple[List[int], List[int]]:
+        x_bits = [0]
+        o_bits = [0]
+        seen = {(0, 0)}
+        i = 0
+
+        while i < len(x_bits):
+            x, o = x_bits[i], o_bits[i]
+            i += 1
+
+            if WIN_TABLE[x] is not None or WIN_TABLE[o] is not None or x | o == FULL_MASK:
+                continue
+
+            is_x_turn = bin(x).count('1') == bin(o).count('1')
+            for action in ACTIONS:
+                bit = ACTION_BITS[action]
+                if (x | o) & bit:
+                    continue
+
+                successor = (x | bit, o) if is_x_turn else (x, o | bit)
+                if successor not in seen:
+                    seen.add(successor)
+                    x_bits.append(successor[0])
+                    o_bits.append(successor[1])
+
+        return x_bits, o_bits
+
+    def _fill_state(self, state_id: int, x: int, o: int) -> None:
+        is_x_turn = bin(x).count('1') == bin(o).count('1')
+        self._depth[state_id] = bin(x | o).count('1')
+
+        if WIN_TABLE[x] is not None:
+            self._winner[state_id] = VecTicTacToe.X
+        elif WIN_TABLE[o] is not None:
+            self._winner[state_id] = VecTicTacToe.O
+
+        self._is_terminal[state_id] = self._winner[state_id] != 0 or x | o == FULL_MASK
+
+        if is_x_turn:
+            self._observations.append(self._create_observation(x, o))
+        else:
+            self._observations.append(self._create_observation(o, x))
+
+        if self._is_terminal[state_id]:
+            return
+
+        for a, action in enumerate(ACTIONS):
+            bit = ACTION_BITS[action]
+            if not (x | o) & bit:
+                self._legal_actions[state_id, a] = True
+                if is_x_turn:
+                    self._successors[state_id, a] = self.encode_bitboard(x | bit, o)
+                else:
+                    self._successors[state_id, a] = self.encode_bitboard(x, o | bit)
+
+    @staticmethod
+    def _create_observation(mover_bits: int, opponent_bits: int) -> Tuple[int, ...]:
+        observation = []
+        for cell in range(len(ACTIONS)):
+            if mover_bits & (1 << cell):
+                observation += (0, 1)
+            elif opponent_bits & (1 << cell):
+                observation += (1, 0)
+            else:
+                observation += (0, 0)
+
+        return tuple(observation)
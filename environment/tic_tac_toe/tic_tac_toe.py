@@ -1,8 +1,10 @@
-from .. import Base
-from typing import List, Optional, Tuple
+from .. import Base, Reversible, Snapshottable, Transition
+from ..board_string import board_to_string
+from .bitboard import ACTION_BITS, ACTIONS_TABLE, FULL_MASK, WIN_TABLE, bits_to_rows, create_init_bitboards
+from typing import Dict, List, Optional, Tuple
 
 
-class TicTacToe(Base):
+class TicTacToe(Base, Reversible, Snapshottable):
     def __init__(self, first_turn: Optional[str] = 'x') -> None:
         super().__init__()
         self._first_turn = first_turn
@@ -10,6 +12,20 @@ class TicTacToe(Base):
         self._turn = self._first_turn
         self._win_position = None
         self._winner = None
+        self._empty = FULL_MASK
+        self._undo_stack = []
+
+    @property
+    def state(self) -> List[List[str]]:
+        return [list(row) for row in self.state_view]
+
+    @property
+    def possible_actions(self) -> Tuple[Tuple[int, int], ...]:
+        return self.possible_actions_view
+
+    @property
+    def bitboard(self) -> Tuple[int, int]:
+        return self._state['x'], self._state['o']
 
     @property
     def turn(self) -> str:
@@ -24,47 +40,49 @@ class TicTacToe(Base):
         return self._winner
 
     def execute_action(self, action: Tuple[int, int]) -> None:
-        if action in self._possible_actions:
+        if ACTION_BITS.get(action, 0) & self._empty:
             self._update_state(action)
             self._update_win_position()
             self._update_winner()
-            self._remove_possible_action(action)
+            self._update_possible_actions()
             self._toggle_turn()
             self._update_is_active()
+            self._invalidate_views()
+
+    def push(self, action: Tuple[int, int]) -> None:
+        self._undo_stack.append(self.snapshot())
+        self.execute_action(action)
+
+    def pop(self) -> None:
+        if len(self._undo_stack) == 0:
+            raise Exception('No pushed action to pop')
+
+        self.restore(self._undo_stack.pop())
+
+    def snapshot(self) -> int:
+        # Packed as x bits, o bits << 9 and turn << 18, everything else follows from the board
+        return self._state['x'] | self._state['o'] << 9 | (self._turn == 'o') << 18
+
+    def restore(self, snapshot: int) -> None:
+        self._state['x'] = snapshot & FULL_MASK
+        self._state['o'] = snapshot >> 9 & FULL_MASK
+        self._turn = 'o' if snapshot >> 18 & 1 else 'x'
+        self._empty = FULL_MASK ^ (self._state['x'] | self._state['o'])
+        self._restore_winner()
+        self._update_possible_actions()
+        self._update_is_active()
+        self._invalidate_views()
 
     def reset(self) -> None:
         super(TicTacToe, self).reset()
         self._turn = self._first_turn
         self._win_position = None
         self._winner = None
+        self._empty = FULL_MASK
+        self._undo_stack = []
 
     def get_state_as_string(self) -> str:
-        total_rows = len(self._state)
-        total_cells = len(self._state[total_rows - 1]) if total_rows > 0 else 0
-        as_str = ''
-
-        for i in range(total_rows):
-            for j in range(total_cells):
-                cell_value = self._state[i][j]
-
-                if i < total_rows - 1:
-                    if cell_value != '':
-                        str_value = f'_{cell_value.upper()}_'
-                    else:
-                        str_value = '___'
-                else:
-                    if cell_value != '':
-                        str_value = f' {cell_value.upper()} '
-                    else:
-                        str_value = '   '
-
-                if j < total_cells - 1:
-                    str_value += '|'
-
-                as_str += str_value
-            as_str += '\n'
-
-        return as_str
+        return board_to_string(self.state_view)
 
     def _rectify_first_turn(self) -> None:
         if isinstance(self._first_turn, str):
@@ -72,11 +90,21 @@ class TicTacToe(Base):
         else:
             self._first_turn = 'x'
 
-    def _create_init_state(self) -> List[List[str]]:
-        return [['', '', ''], ['', '', ''], ['', '', '']]
+    def _create_transition(self) -> Transition:
+        return Transition(state=self.state_view, is_active=self._is_active,
+                          possible_actions=self.possible_actions_view, winner=self._winner)
+
+    def _create_init_state(self) -> Dict[str, int]:
+        return create_init_bitboards()
 
     def _create_init_actions(self) -> Tuple[Tuple[int, int], ...]:
-        return (0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)
+        return ACTIONS_TABLE[FULL_MASK]
+
+    def _create_state_view(self) -> Tuple[Tuple[str, ...], ...]:
+        return bits_to_rows(self._state['x'], self._state['o'])
+
+    def _create_possible_actions_view(self) -> Tuple[Tuple[int, int], ...]:
+        return self._possible_actions
 
     def _first_turn_as_lower_xo(self) -> None:
         turn = self._first_turn.lower()
@@ -86,26 +114,32 @@ class TicTacToe(Base):
             self._first_turn = turn
 
     def _update_state(self, action: Tuple[int, int]) -> None:
-        i, j = action
-        self._state[i][j] = self._turn
+        bit = ACTION_BITS[action]
+        self._state[self._turn] |= bit
+        self._empty ^= bit
 
     def _update_win_position(self) -> None:
-        self._win_position = self._find_win_position()
+        self._win_position = WIN_TABLE[self._state[self._turn]]
 
     def _update_winner(self) -> None:
         if self._win_position is not None:
             self._winner = self._turn
 
-    def _remove_possible_action(self, action: Tuple[int, int]) -> None:
-        possible_actions = []
-        for pa in self._possible_actions:
-            if not pa == action:
-                possible_actions.append(pa)
+    def _restore_winner(self) -> None:
+        self._winner = None
+        self._win_position = None
+
+        for mark in ('x', 'o'):
+            win_position = WIN_TABLE[self._state[mark]]
+            if win_position is not None:
+                self._winner = mark
+                self._win_position = win_position
 
-        self._possible_actions = tuple(possible_actions)
+    def _update_possible_actions(self) -> None:
+        self._possible_actions = ACTIONS_TABLE[self._empty]
 
     def _update_is_active(self) -> None:
-        self._is_active = len(self._possible_actions) > 0
+        self._is_active = self._empty != 0
         if self._winner is not None:
             self._is_active = False
 
@@ -114,82 +148,3 @@ class TicTacToe(Base):
             self._turn = 'o'
         else:
             self._turn = 'x'
-
-    def _find_win_position(self) -> Optional[Tuple[Tuple[int, int], ...]]:
-        win_position = self._find_win_position_in_horizontal_positions()
-        if win_position is not None:
-            return win_position
-
-        win_position = self._find_win_position_in_vertical_positions()
-        if win_position is not None:
-            return win_position
-
-        win_position = self._find_win_position_in_diagonal_positions()
-        return win_position
-
-    def _find_win_position_in_horizontal_positions(self) -> Optional[Tuple[Tuple[int, int], ...]]:
-        h_pos = self._generate_horizontal_win_positions()
-        return self._find_winning_position_from_positions(h_pos)
-
-    def _find_win_position_in_vertical_positions(self) -> Optional[Tuple[Tuple[int, int], ...]]:
-        v_pos = self._generate_vertical_win_positions()
-        return self._find_winning_position_from_positions(v_pos)
-
-    def _find_win_position_in_diagonal_positions(self) -> Optional[Tuple[Tuple[int, int], ...]]:
-        d_pos = self._generate_diagonal_win_positions()
-        return self._find_winning_position_from_positions(d_pos)
-
-    def _generate_horizontal_win_positions(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
-        positions = []
-
-        for i in range(len(self._state)):
-            h = []
-            for j in range(len(self._state[i])):
-                h.append((i, j))
-            positions.append(tuple(h))
-
-        return tuple(positions)
-
-    def _generate_vertical_win_positions(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
-        positions = []
-        rows = len(self._state)
-        columns = len(self._state[rows - 1])
-
-        for j in range(rows):
-            v = []
-            for i in range(columns):
-                v.append((i, j))
-            positions.append(tuple(v))
-
-        return tuple(positions)
-
-    def _generate_diagonal_win_positions(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
-        return ((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0))
-
-    def _find_winning_position_from_positions(self, positions: Tuple[Tuple[Tuple[int, int], ...], ...]) \
-            -> Optional[Tuple[Tuple[int, int], ...]]:
-
-        for position in positions:
-            winner = self._find_winner_in_position(position)
-
-            if winner is not None:
-                return position
-
-        return None
-
-    def _find_winner_in_position(self, position: Tuple[Tuple[int, int], ...]) -> Optional[str]:
-        x_cnt = 0
-        o_cnt = 0
-
-        for i, j in position:
-            if self._state[i][j] == 'x':
-                x_cnt += 1
-            elif self._state[i][j] == 'o':
-                o_cnt += 1
-
-        if x_cnt == 3:
-            return 'x'
-        elif o_cnt == 3:
-            return 'o'
-        else:
-            return None
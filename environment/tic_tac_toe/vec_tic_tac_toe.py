@@ -0,0 +1,129 @@
+from .. import Base, Transition
+from .bitboard import ACTIONS, COLUMNS, ROWS, WIN_POSITIONS
+from typing import Optional, Tuple
+import numpy as np
+
+
+class VecTicTacToe(Base):
+    EMPTY = 0
+    X = 1
+    O = -1
+
+    _LINES = np.array([[i * COLUMNS + j for i, j in position] for position in WIN_POSITIONS], dtype=np.int64)
+
+    def __init__(self, nbr_of_boards: int = 1024, first_turn: Optional[str] = 'x') -> None:
+        if nbr_of_boards < 1:
+            raise Exception('Number of boards must be positive')
+
+        self._nbr_of_boards = nbr_of_boards
+        self._board_indices = np.arange(nbr_of_boards)
+        super().__init__()
+        self._first_turn = self._rectify_first_turn(first_turn)
+        self._turn = np.full(nbr_of_boards, self._first_turn, dtype=np.int8)
+        self._winner = np.zeros(nbr_of_boards, dtype=np.int8)
+        self._done = np.zeros(nbr_of_boards, dtype=bool)
+
+    @property
+    def nbr_of_boards(self) -> int:
+        return self._nbr_of_boards
+
+    @property
+    def actions(self) -> Tuple[Tuple[int, int], ...]:
+        return ACTIONS
+
+    @property
+    def state(self) -> np.ndarray:
+        return self._state.reshape(self._nbr_of_boards, ROWS, COLUMNS).copy()
+
+    @property
+    def turn(self) -> np.ndarray:
+        return self._turn.copy()
+
+    @property
+    def winner(self) -> np.ndarray:
+        return self._winner.copy()
+
+    @property
+    def done(self) -> np.ndarray:
+        return self._done.copy()
+
+    @property
+    def action_mask(self) -> np.ndarray:
+        return self._possible_actions.copy()
+
+    @property
+    def observation(self) -> np.ndarray:
+        # [N, 18] from the view of each board's player to move, encoded like the QLearning interpreter does:
+        # (0, 1) for the mover's cells, (1, 0) for the opponent's and (0, 0) for empty ones
+        relative = self._state * self._turn[:, None]
+        observation = np.zeros((self._nbr_of_boards, ROWS * COLUMNS, 2), dtype=np.int8)
+        observation[:, :, 1] = relative == 1
+        observation[:, :, 0] = relative == -1
+        return observation.reshape(self._nbr_of_boards, -1)
+
+    def execute_action(self, actions: np.ndarray) -> None:
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self._nbr_of_boards,):
+            raise Exception(f'Expected {self._nbr_of_boards} actions, got shape {actions.shape}')
+
+        is_in_range = (actions >= 0) & (actions < len(ACTIONS))
+        is_legal = is_in_range & self._possible_actions[self._board_indices, np.where(is_in_range, actions, 0)]
+
+        boards = self._board_indices[is_legal]
+        cells = actions[is_legal]
+        turns = self._turn[boards]
+
+        self._state[boards, cells] = turns
+        self._possible_actions[boards, cells] = False
+
+        line_sums = self._state[boards][:, self._LINES].sum(axis=2, dtype=np.int8)
+        is_win = (line_sums == turns[:, None] * len(self._LINES[0])).any(axis=1)
+
+        self._winner = np.zeros(self._nbr_of_boards, dtype=np.int8)
+        self._winner[boards[is_win]] = turns[is_win]
+
+        self._done = np.zeros(self._nbr_of_boards, dtype=bool)
+        self._done[boards] = is_win | ~self._possible_actions[boards].any(axis=1)
+
+        self._turn[boards] = -turns
+        self._reset_boards(self._done)
+        self._invalidate_views()
+
+    def reset(self) -> None:
+        super(VecTicTacToe, self).reset()
+        self._turn = np.full(self._nbr_of_boards, self._first_turn, dtype=np.int8)
+        self._winner = np.zeros(self._nbr_of_boards, dtype=np.int8)
+        self._done = np.zeros(self._nbr_of_boards, dtype=bool)
+
+    def _create_init_state(self) -> np.ndarray:
+        return np.zeros((self._nbr_of_boards, ROWS * COLUMNS), dtype=np.int8)
+
+    def _create_init_actions(self) -> np.ndarray:
+        return np.ones((self._nbr_of_boards, len(ACTIONS)), dtype=bool)
+
+    def _create_transition(self) -> Transition:
+        return Transition(state=self.state_view, is_active=~self._done, possible_actions=self.possible_actions_view,
+                          winner=self._winner)
+
+    def _create_state_view(self) -> np.ndarray:
+        return self._read_only(self._state.reshape(self._nbr_of_boards, ROWS, COLUMNS))
+
+    def _create_possible_actions_view(self) -> np.ndarray:
+        return self._read_only(self._possible_actions)
+
+    def _reset_boards(self, boards: np.ndarray) -> None:
+        self._state[boards] = self.EMPTY
+        self._possible_actions[boards] = True
+        self._turn[boards] = self._first_turn
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        view = array.copy()
+        view.flags.writeable = False
+        return view
+
+    def _rectify_first_turn(self, first_turn: Optional[str]) -> int:
+        if isinstance(first_turn, str) and first_turn.lower() == 'o':
+            return self.O
+
+        return self.X
@@ -0,0 +1,8 @@
+from typing import Any, NamedTuple
+
+
+class Transition(NamedTuple):
+    state: Any
+    is_active: Any
+    possible_actions: Any
+    winner: Any = None
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from environment import Base as Environment
+from typing import Any, Tuple
 
 
 class Base(ABC):
+    def __init__(self, environment: Environment) -> None:
+        self._environment = environment
 
     @property
     def observable_environment(self) -> Any:
@@ -11,3 +14,13 @@ class Base(ABC):
     @abstractmethod
     def interpret(self) -> Any:
         pass
+
+    def step(self, action: Any) -> Any:
+        self._environment.execute_action(self.translate_action(action))
+        return self.interpret()
+
+    def interpret_actions(self, actions: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return actions
+
+    def translate_action(self, action: Any) -> Any:
+        return action
@@ -1 +1,3 @@
+from .observation_encoder import ObservationEncoder
+from .symmetry import Symmetry
 from .q_learning import QLearning
@@ -0,0 +1,80 @@
+from environment import StateSpace
+from typing import Optional, Tuple
+import numpy as np
+
+
+class ObservationEncoder:
+    # Keeps the observation of both players up to date from the x/o bitboards. A cell of the player to move is
+    # encoded as (0, 1), a cell of the opponent as (1, 0) and an empty cell as (0, 0).
+    def __init__(self, nbr_of_cells: int = 9, state_space: Optional[StateSpace] = None) -> None:
+        self._nbr_of_cells = nbr_of_cells
+        self._state_space = state_space
+        self._x_bits = 0
+        self._o_bits = 0
+        self._views = {'x': [0] * (2 * nbr_of_cells), 'o': [0] * (2 * nbr_of_cells)}
+        self._buffers = {'x': np.zeros(2 * nbr_of_cells, dtype=np.float32),
+                         'o': np.zeros(2 * nbr_of_cells, dtype=np.float32)}
+        self._observations = {'x': None, 'o': None}
+
+    @property
+    def bitboard(self) -> Tuple[int, int]:
+        return self._x_bits, self._o_bits
+
+    def update(self, x_bits: int, o_bits: int) -> None:
+        if x_bits == self._x_bits and o_bits == self._o_bits:
+            return
+
+        if self._x_bits & ~x_bits or self._o_bits & ~o_bits:
+            self._clear()
+
+        self._set_cells(x_bits & ~self._x_bits, 'x', 'o')
+        self._set_cells(o_bits & ~self._o_bits, 'o', 'x')
+        self._x_bits = x_bits
+        self._o_bits = o_bits
+        self._observations['x'] = None
+        self._observations['o'] = None
+
+    def observation(self, turn: str) -> Tuple[int, ...]:
+        observation = self._observations[turn]
+
+        if observation is None:
+            observation = tuple(self._views[turn])
+            self._observations[turn] = observation
+
+        return observation
+
+    def buffer(self, turn: str) -> np.ndarray:
+        return self._buffers[turn]
+
+    def state_id(self, turn: str) -> int:
+        if self._state_space is None:
+            raise Exception('State ids need a state space')
+
+        x_cnt = bin(self._x_bits).count('1')
+        o_cnt = bin(self._o_bits).count('1')
+
+        if (x_cnt == o_cnt) == (turn == 'x'):
+            return self._state_space.encode_bitboard(self._x_bits, self._o_bits)
+
+        return self._state_space.encode_bitboard(self._o_bits, self._x_bits)
+
+    def _clear(self) -> None:
+        for turn in ('x', 'o'):
+            self._views[turn][:] = [0] * (2 * self._nbr_of_cells)
+            self._buffers[turn].fill(0.0)
+
+        self._x_bits = 0
+        self._o_bits = 0
+
+    def _set_cells(self, bits: int, mark: str, other: str) -> None:
+        while bits:
+            low_bit = bits & -bits
+            cell = low_bit.bit_length() - 1
+            bits ^= low_bit
+
+            self._set_value(mark, 2 * cell + 1)
+            self._set_value(other, 2 * cell)
+
+    def _set_value(self, turn: str, index: int) -> None:
+        self._views[turn][index] = 1
+        self._buffers[turn][index] = 1.0
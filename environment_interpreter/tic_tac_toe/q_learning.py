@@ -1,87 +1,82 @@
 from .. import Base
+from .observation_encoder import ObservationEncoder
+from .symmetry import Symmetry
 from agent.q_learning import ObservableEnvironment
-from environment import TicTacToe
-from typing import List, Tuple
+from environment import MnkGame, StateSpace, TicTacToe
+from typing import Any, Optional, Tuple, Union
 
 
 class QLearning(Base):
-    def __init__(self, environment: TicTacToe) -> None:
-        super().__init__()
-        self._environment = environment
+    def __init__(self, environment: Union[TicTacToe, MnkGame], canonical: bool = False,
+                 state_space: Optional[StateSpace] = None) -> None:
+        super().__init__(environment)
         self._mark = None
+        self._encoder = self._create_encoder(state_space)
+        self._symmetry = self._create_symmetry() if canonical else None
+        self._transform = 0
+
+    @property
+    def encoder(self) -> ObservationEncoder:
+        self._encoder.update(*self._environment.bitboard)
+        return self._encoder
 
     def interpret(self) -> ObservableEnvironment:
+        turn = self._environment.turn
+        is_active = self._environment.is_active
+        state = self._interpret_state(turn)
+
+        if is_active:
+            self._mark = turn
+
         return ObservableEnvironment(
-            state=self._interpret_state(),
-            reward=self._interpret_reward(),
-            is_terminal=self._interpret_is_terminal()
+            state=state,
+            reward=self._calculate_reward(self._environment.winner),
+            is_terminal=not is_active,
+            action_mask=self._interpret_action_mask(state, is_active)
         )
 
-    def _interpret_state(self) -> Tuple[int, ...]:
-        state = self._environment.state
+    def interpret_actions(self, actions: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        if self._symmetry is None:
+            return actions
+
+        return self._symmetry.to_canonical_actions(actions, self._transform)
+
+    def translate_action(self, action: Any) -> Any:
+        if self._symmetry is None:
+            return action
 
-        if self._environment.turn == 'o':
-            state = self._inverse_state()
+        return self._symmetry.to_board_action(action, self._transform)
 
-        return self._generate_observable_state(state)
+    def _create_encoder(self, state_space: Optional[StateSpace]) -> ObservationEncoder:
+        state = self._environment.state_view
+        return ObservationEncoder(nbr_of_cells=sum(len(row) for row in state), state_space=state_space)
 
-    def _interpret_reward(self) -> float:
-        if self._environment.is_active:
-            self._mark = self._environment.turn
+    def _create_symmetry(self) -> Symmetry:
+        state = self._environment.state_view
+        size = len(state)
 
-        return self._calculate_reward()
+        if any(len(row) != size for row in state):
+            raise Exception('Canonical observations need a square board')
 
-    def _interpret_is_terminal(self) -> bool:
-        return not self._environment.is_active
+        return Symmetry(size=size)
 
-    def _inverse_state(self) -> List[List[str]]:
-        i_state = []
+    def _interpret_state(self, turn: str) -> Tuple[int, ...]:
+        observable_state = self.encoder.observation(turn)
 
-        for row in self._environment.state:
-            i_row = self._inverse_row(row)
-            i_state.append(i_row)
+        if self._symmetry is not None:
+            observable_state, self._transform = self._symmetry.canonicalize(observable_state)
 
-        return i_state
+        return observable_state
 
     @staticmethod
-    def _generate_observable_state(state: List[List[str]]) -> Tuple[int, ...]:
-        observable_state = []
-        for row in state:
-            for cell in row:
-                if cell == 'x':
-                    observable_state.append(0)
-                    observable_state.append(1)
-                elif cell == 'o':
-                    observable_state.append(1)
-                    observable_state.append(0)
-                else:
-                    observable_state.append(0)
-                    observable_state.append(0)
-
-        return tuple(observable_state)
-
-    def _calculate_reward(self) -> float:
-        winner = self._environment.winner
+    def _interpret_action_mask(state: Tuple[int, ...], is_active: bool) -> Tuple[bool, ...]:
+        # Built from the (possibly canonical) observation, so the mask always matches the actions the agent sees
+        return tuple(is_active and not (state[i] or state[i + 1]) for i in range(0, len(state), 2))
 
+    def _calculate_reward(self, winner: Optional[str]) -> float:
         if winner is not None and winner == self._mark:
             return 1.0
         elif winner is not None and winner != self._mark:
             return -1.0
         else:
             return 0.0
-
-    def _inverse_row(self, row: List[str]) -> List[str]:
-        i_row = []
-        for cell in row:
-            i_row.append(self._inverse_cell(cell))
-
-        return i_row
-
-    @staticmethod
-    def _inverse_cell(cell: str) -> str:
-        if cell == 'o':
-            return 'x'
-        elif cell == 'x':
-            return 'o'
-        else:
-            return cell
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+
+class Symmetry:
+    # The 8 rotations and reflections of a square board (dihedral group D4)
+    _TRANSFORMS: Tuple[Callable[[int, int, int], Tuple[int, int]], ...] = (
+        lambda i, j, n: (i, j),
+        lambda i, j, n: (j, n - 1 - i),
+        lambda i, j, n: (n - 1 - i, n - 1 - j),
+        lambda i, j, n: (n - 1 - j, i),
+        lambda i, j, n: (i, n - 1 - j),
+        lambda i, j, n: (n - 1 - i, j),
+        lambda i, j, n: (j, i),
+        lambda i, j, n: (n - 1 - j, n - 1 - i),
+    )
+
+    def __init__(self, size: int = 3, values_per_cell: int = 2) -> None:
+        if size < 1:
+            raise Exception(f'Invalid board size: {size}')
+
+        self._size = size
+        self._values_per_cell = values_per_cell
+        self._forward_actions = []
+        self._backward_actions = []
+        self._observation_indices = []
+
+        for transform in self._TRANSFORMS:
+            forward = {(i, j): transform(i, j, size) for i in range(size) for j in range(size)}
+            self._forward_actions.append(forward)
+            self._backward_actions.append({v: k for k, v in forward.items()})
+            self._observation_indices.append(self._create_observation_indices(forward))
+
+    @property
+    def nbr_of_transforms(self) -> int:
+        return len(self._TRANSFORMS)
+
+    def transform_observation(self, observation: Sequence[int], transform: int) -> Tuple[int, ...]:
+        return tuple([observation[i] for i in self._observation_indices[transform]])
+
+    def canonicalize(self, observation: Sequence[int]) -> Tuple[Tuple[int, ...], int]:
+        canonical = tuple(observation)
+        canonical_transform = 0
+
+        for transform in range(1, len(self._TRANSFORMS)):
+            candidate = self.transform_observation(observation, transform)
+            if candidate < canonical:
+                canonical = candidate
+                canonical_transform = transform
+
+        return canonical, canonical_transform
+
+    def to_canonical_action(self, action: Any, transform: int) -> Any:
+        if action is None:
+            return None
+
+        return self._forward_actions[transform][action]
+
+    def to_board_action(self, action: Any, transform: int) -> Any:
+        if action is None:
+            return None
+
+        return self._backward_actions[transform][action]
+
+    def to_canonical_actions(self, actions: Sequence[Any], transform: int) -> Tuple[Any, ...]:
+        forward = self._forward_actions[transform]
+        return tuple(sorted(forward[action] for action in actions))
+
+    def _create_observation_indices(self, forward: Dict[Tuple[int, int], Tuple[int, int]]) -> Tuple[int, ...]:
+        cell_cnt = self._size * self._size
+        indices = [0] * (cell_cnt * self._values_per_cell)
+
+        for (i, j), (ti, tj) in forward.items():
+            source = i * self._size + j
+            target = ti * self._size + tj
+            for k in range(self._values_per_cell):
+                indices[target * self._values_per_cell + k] = source * self._values_per_cell + k
+
+        return tuple(indices)
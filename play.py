@@ -37,28 +37,30 @@ def main() -> None:
 
 def play(t: TicTacToe, a1: BaseAgent, a2: BaseAgent, ep: int = 10000, nbr_of_games_to_print: int = 2,
          should_print_info: bool = True, should_agent1_train: bool = False, should_agent2_train: bool = False,
-         nbr_of_training: int = 10000) -> Tuple[int, int]:
+         nbr_of_training: int = 10000, canonical: bool = False) -> Tuple[int, int]:
     t.reset()
 
     if should_agent1_train:
         if should_print_info:
             print('Agent 1 Training...')
-        play(t=t, a1=a1, a2=RandomAgent(), ep=nbr_of_training, nbr_of_games_to_print=0, should_print_info=False)
+        play(t=t, a1=a1, a2=RandomAgent(), ep=nbr_of_training, nbr_of_games_to_print=0, should_print_info=False,
+             canonical=canonical)
         if should_print_info:
             print('Agent 1 Finished training...')
 
     if should_agent2_train:
         if should_print_info:
             print('Agent 2 Training...')
-        play(t=t, a1=a2, a2=RandomAgent(), ep=nbr_of_training, nbr_of_games_to_print=0, should_print_info=False)
+        play(t=t, a1=a2, a2=RandomAgent(), ep=nbr_of_training, nbr_of_games_to_print=0, should_print_info=False,
+             canonical=canonical)
         if should_print_info:
             print('Agent 2 finished training...')
 
     wins = {a1: 0, a2: 0}
     turn = {a1: '', a2: ''}
 
-    interpreter1 = EnvironmentInterpreterFactory.create(t, a1)
-    interpreter2 = EnvironmentInterpreterFactory.create(t, a2)
+    interpreter1 = EnvironmentInterpreterFactory.create(t, a1, canonical=canonical)
+    interpreter2 = EnvironmentInterpreterFactory.create(t, a2, canonical=canonical)
 
     a = a1
     inter = interpreter1
@@ -75,7 +77,8 @@ def play(t: TicTacToe, a1: BaseAgent, a2: BaseAgent, ep: int = 10000, nbr_of_gam
                 turn[a] = t.turn
 
             a.observe_environment(inter.observable_environment)
-            t.execute_action(a.choose_action(t.possible_actions))
+            action = a.choose_action(inter.interpret_actions(t.possible_actions_view))
+            t.execute_action(inter.translate_action(action))
             if i > (ep - (nbr_of_games_to_print + 1)):
                 print(f'\n{t.get_state_as_string()}\n')
                 if not t.is_active:
@@ -1,41 +1,75 @@
 #!/usr/bin/env python3
 
 from environment import TicTacToe as T
-from agent import QLearning as Q, Random as R
+from agent import MultiConfigQLearning as MQ, Random as R
+from argparse import ArgumentParser
 from itertools import product
 from time import time
 from play import play
+from tuning import GridSearch, SuccessiveHalving
+
+GRIDS = {
+    'QLearning': {'learning_rate': [i / 10 for i in range(1, 10)], 'gamma': [i / 10 for i in range(1, 10)]},
+    'ArrayQLearning': {'learning_rate': [i / 10 for i in range(1, 10)], 'gamma': [i / 10 for i in range(1, 10)]},
+    'SimpleDqn': {'alpha': [0.0001, 0.001, 0.01], 'gamma': [0.9, 0.99, 0.999]},
+    'DQN': {'alpha': [0.0001, 0.001], 'gamma': [0.9, 0.999], 'batch_size': [64, 512],
+            'replay_memory_size': [8000, 64000]},
+}
 
 
 def main() -> None:
-    x = (i / 10 for i in range(1, 10))
-    y = (i / 10 for i in range(1, 10))
+    parser = ArgumentParser(description='Hyperparameter grid search against the Random agent')
+    parser.add_argument('--agent', default='QLearning', choices=list(GRIDS.keys()))
+    parser.add_argument('--results', default='grid_results.csv', help='.csv, or JSON lines for any other extension')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--training', type=int, default=100000)
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--vectorized', action='store_true', help='Train all QLearning configs in one process')
+    parser.add_argument('--halving', action='store_true', help='Successive halving instead of full training')
+    parser.add_argument('--min-budget', type=int, default=1000)
+    parser.add_argument('--eta', type=int, default=3)
+    args = parser.parse_args()
 
-    hs = {}
     start = time()
 
-    for combo in product(x, y):
-        lr, gam = combo
-        q = Q()
-        q._learning_rate = lr
-        q._gamma = gam
-        r = R()
-
-        wins, _ = play(q, r, nbr_of_games_to_print=0, should_print_info=False, should_agent1_train=True,
-                       should_agent2_train=False, nbr_of_training=100000)
-        hs[combo] = wins
+    if args.vectorized:
+        hs = vectorized_grid(args.training, args.games)
+    elif args.halving:
+        grid = GRIDS[args.agent]
+        search = SuccessiveHalving(agent=args.agent, grid=grid, min_budget=args.min_budget, max_budget=args.training,
+                                   eta=args.eta, nbr_of_games=args.games, seed=args.seed)
+        hs = {tuple(result[name] for name in grid.keys()): (result['budget'], result['wins'])
+              for result in search.run()}
+    else:
+        grid = GRIDS[args.agent]
+        search = GridSearch(agent=args.agent, grid=grid, results_file=args.results, nbr_of_training=args.training,
+                            nbr_of_games=args.games, seed=args.seed, max_workers=args.workers)
+        hs = {tuple(result[name] for name in grid.keys()): int(result['wins']) for result in search.run()}
     end = time()
 
     top = [k for k in hs.keys()]
     top.sort(key=lambda k: hs[k])
 
-    print('  lr, gamma')
+    print('  lr, gamma' if args.vectorized or 'QLearning' in args.agent else f'  {", ".join(GRIDS[args.agent])}')
     for s in top:
         print(f'{s}: {hs[s]}')
 
     print(f'Elapsed time: {end - start}')
 
 
+def vectorized_grid(nbr_of_training: int, nbr_of_games: int) -> dict:
+    # All (lr, gamma) combos learn from the same training games and are evaluated together afterwards
+    t = T()
+    grid = GRIDS['QLearning']
+    q = MQ(all_possible_actions=t.possible_actions, configs=list(product(grid['learning_rate'], grid['gamma'])),
+           training_amount=nbr_of_training)
+    play(t=t, a1=q, a2=R(), ep=nbr_of_training, nbr_of_games_to_print=0, should_print_info=False)
+    wins = q.evaluate(nbr_of_games=nbr_of_games)
+
+    return {combo: int(w) for combo, w in zip(q.configs, wins)}
+
+
 if __name__ == '__main__':
     main()
 
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# Inference only: loads a policy net saved by SimpleDqn/DQN.save_model with use_torchscript=True, without importing
+# the agent, environment or training code.
+
+from argparse import ArgumentParser
+from typing import Any, Optional, Sequence, Union
+import torch
+
+
+class ScriptedPolicy:
+    def __init__(self, file_path: str, device: Any = 'cpu') -> None:
+        self._device = device
+        self._model = torch.jit.load(file_path, map_location=device)
+        self._model.eval()
+
+    def predict(self, states: Union[torch.Tensor, Sequence[Sequence[float]]]) -> torch.Tensor:
+        with torch.no_grad():
+            return self._model(torch.as_tensor(states, dtype=torch.float32, device=self._device))
+
+    def choose_action_indices(self, states: Union[torch.Tensor, Sequence[Sequence[float]]],
+                              action_masks: Optional[Union[torch.Tensor, Sequence[Sequence[bool]]]] = None
+                              ) -> torch.Tensor:
+        preds = self.predict(states)
+
+        if action_masks is not None:
+            mask = torch.as_tensor(action_masks, dtype=torch.bool, device=preds.device)
+            preds = preds.masked_fill(mask.logical_not(), float('-inf'))
+
+        return preds.argmax(dim=1)
+
+    def choose_action_index(self, state: Sequence[float], action_mask: Optional[Sequence[bool]] = None) -> int:
+        action_masks = None if action_mask is None else [action_mask]
+        return self.choose_action_indices([state], action_masks).item()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Best action of a scripted policy for one observation')
+    parser.add_argument('model', help='.pt file written by save_model')
+    parser.add_argument('observation', help='Comma separated observation, e.g. 0,0,0,1,...')
+    args = parser.parse_args()
+
+    policy = ScriptedPolicy(args.model)
+    observation = [float(value) for value in args.observation.split(',')]
+    print(policy.choose_action_index(observation))
+
+
+if __name__ == '__main__':
+    main()
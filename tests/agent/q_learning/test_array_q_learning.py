@@ -0,0 +1,117 @@
+from agent import ArrayQLearning, QLearning, Random as RandomAgent
+from environment import TicTacToe
+from environment_interpreter import EnvironmentInterpreterFactory
+import numpy as np
+import os
+import random
+import tempfile
+import unittest
+from unittest import TestCase
+
+
+class TestArrayQLearning(TestCase):
+    def test_matches_dict_q_learning(self) -> None:
+        env = TicTacToe()
+        all_actions = env.possible_actions
+        results = []
+
+        for agent in (QLearning(training_amount=200), ArrayQLearning(all_actions, training_amount=200)):
+            random.seed(3)
+            results.append(self._play(env, agent, RandomAgent(), 300))
+
+        dict_table, array_table = results
+
+        for state, actions in dict_table._q_table.items():
+            row = array_table._q_table.row(state)
+            for action, value in actions.items():
+                self.assertEqual(value, array_table._q_table.values[row, all_actions.index(action)])
+
+        self.assertEqual(len(dict_table._q_table), len(array_table._q_table))
+
+    def test_choose_from_no_actions(self) -> None:
+        agent = ArrayQLearning(TicTacToe().possible_actions)
+        agent.observe_environment(EnvironmentInterpreterFactory.create(TicTacToe(), agent).observable_environment)
+
+        self.assertEqual(None, agent.choose_action(()))
+
+    def test_resume_from_saved_q_table(self) -> None:
+        env = TicTacToe()
+        all_actions = env.possible_actions
+        random.seed(5)
+        agent = self._play(env, ArrayQLearning(all_actions, training_amount=100), RandomAgent(), 50)
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'q_table')
+            agent.save_q_table(file_name)
+
+            resumed = ArrayQLearning(all_actions, training_amount=100)
+            resumed.load_q_table(file_name)
+
+            self.assertEqual(agent._q_table.states, resumed._q_table.states)
+            self._play(env, resumed, RandomAgent(), 50)
+            self.assertTrue(len(resumed._q_table) >= len(agent._q_table))
+
+            self.assertRaises(Exception, ArrayQLearning(all_actions[:3]).load_q_table, file_name)
+
+    def test_dict_q_learning_load(self) -> None:
+        env = TicTacToe()
+        random.seed(5)
+        agent = self._play(env, QLearning(training_amount=100), RandomAgent(), 50)
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'q_table.pkl')
+            agent.save_q_table(file_name)
+
+            resumed = QLearning()
+            resumed.load_q_table(file_name)
+
+        self.assertEqual(agent._q_table, resumed._q_table)
+        self.assertEqual({s: set(a) for s, a in agent._state_actions.items()},
+                         {s: set(a) for s, a in resumed._state_actions.items()})
+
+    def test_play_with_read_only_q_table(self) -> None:
+        env = TicTacToe()
+        all_actions = env.possible_actions
+        random.seed(7)
+        # Few games, so the greedy games below also reach states the table has never seen
+        agent = self._play(env, ArrayQLearning(all_actions, training_amount=100), RandomAgent(), 20)
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'q_table')
+            agent.save_q_table(file_name)
+
+            served = ArrayQLearning(all_actions)
+            served.load_q_table(file_name, read_only=True)
+            served.epsilon = 0.0
+            self.assertTrue(served.is_read_only)
+
+            self._play(env, served, RandomAgent(), 200)
+
+            self.assertEqual(agent._q_table.states, served._q_table.states)
+            self.assertTrue(np.array_equal(agent._q_table.values, served._q_table.values))
+            self.assertTrue(np.array_equal(agent._q_table.masks, served._q_table.masks))
+            self.assertEqual(0.0, served.epsilon)
+            del served
+
+    @staticmethod
+    def _play(env: TicTacToe, a1: QLearning, a2: RandomAgent, episodes: int) -> QLearning:
+        interpreter = EnvironmentInterpreterFactory.create(env, a1)
+
+        for _ in range(episodes):
+            env.reset()
+            a1.prepare_for_episode()
+
+            while env.is_active:
+                if env.turn == 'x':
+                    a1.observe_environment(interpreter.observable_environment)
+                    env.execute_action(a1.choose_action(env.possible_actions))
+                else:
+                    env.execute_action(a2.choose_action(env.possible_actions))
+
+            a1.observe_environment(interpreter.observable_environment)
+
+        return a1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+from agent import DQN
+from agent.q_learning import ObservableEnvironment
+from agent.q_learning.dqn import dqn_loss
+from environment import TicTacToe
+import os
+import subprocess
+import sys
+import tempfile
+import torch
+import unittest
+from unittest import TestCase, mock
+
+
+class TestDqn(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        torch.manual_seed(0)
+        self._preds = torch.rand(4, 9, requires_grad=True)
+        self._actions = torch.tensor([0, 3, 8, 5])
+        self._rewards = torch.tensor([0.0, 1.0, -1.0, 0.0])
+        self._next_preds = torch.rand(4, 9)
+        self._is_terminals = torch.tensor([False, True, True, False])
+
+    def test_dqn_loss(self) -> None:
+        loss, td_errors = dqn_loss(self._preds, self._actions, self._rewards, self._next_preds, self._is_terminals,
+                                   0.9)
+
+        previous_q = self._preds.gather(dim=1, index=self._actions.unsqueeze(-1))
+        target_q = torch.zeros(4)
+        target_q[self._is_terminals] = self._rewards[self._is_terminals]
+        target_q[~self._is_terminals] = self._next_preds[~self._is_terminals].max(dim=1).values * 0.9
+
+        self.assertTrue(torch.allclose(torch.nn.MSELoss()(previous_q, target_q.unsqueeze(-1)), loss))
+        self.assertTrue(torch.allclose(target_q - previous_q.squeeze(-1), td_errors))
+
+    def test_scripted_dqn_loss_matches(self) -> None:
+        scripted = torch.jit.script(dqn_loss)
+        weights = torch.tensor([1.0, 0.5, 0.25, 1.0])
+
+        for w in (None, weights):
+            expected = dqn_loss(self._preds, self._actions, self._rewards, self._next_preds, self._is_terminals, 0.9, w)
+            actual = scripted(self._preds, self._actions, self._rewards, self._next_preds, self._is_terminals, 0.9, w)
+
+            self.assertTrue(torch.allclose(expected[0], actual[0]))
+            self.assertTrue(torch.allclose(expected[1], actual[1]))
+
+    def test_save_scripted_model(self) -> None:
+        agent = DQN(state_size=18, all_possible_actions=TicTacToe().possible_actions, replay_memory_size=64,
+                    batch_size=8, use_torchscript=True)
+        self.assertTrue(isinstance(agent._policy_net, torch.jit.ScriptModule))
+        self.assertTrue(isinstance(agent._target_net, torch.jit.ScriptModule))
+
+        state = [0.0, 1.0] + [0.0] * 16
+        mask = [False, True, True, False, False, True, True, True, True]
+        agent._current_state = torch.as_tensor([state])
+        expected = agent._choose_best_action_index(torch.as_tensor([mask]))
+
+        with tempfile.TemporaryDirectory() as path:
+            agent.save_model(os.path.join(path, 'model.weights'))
+            file_name = os.path.join(path, 'model')
+
+            for suffix in ('.weights', '.pt', '.target.weights', '.target.pt'):
+                self.assertTrue(os.path.isfile(file_name + suffix), suffix)
+            self.assertTrue(isinstance(torch.jit.load(f'{file_name}.target.pt'), torch.jit.ScriptModule))
+
+            # A fresh interpreter which only imports the inference module
+            code = ('import sys; from scripted_policy import ScriptedPolicy; '
+                    f'print(ScriptedPolicy({file_name + ".pt"!r}).choose_action_index({state}, {mask})); '
+                    'print("agent" in sys.modules)')
+            root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+            output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True,
+                                    check=True).stdout.split()
+
+        self.assertEqual([str(expected), 'False'], output)
+
+    def test_invalid_update_settings(self) -> None:
+        actions = TicTacToe().possible_actions
+
+        self.assertRaises(Exception, DQN, 18, actions, train_every=0)
+        self.assertRaises(Exception, DQN, 18, actions, gradient_steps_per_update=0)
+        self.assertRaises(Exception, DQN, 18, actions, target_update_every=0)
+        self.assertRaises(Exception, DQN, 18, actions, target_update_tau=0.0)
+
+    def test_hard_target_update(self) -> None:
+        agent = self._create_agent()
+        self._perturb(agent)
+        agent._update_target_net()
+
+        for policy_param, target_param in zip(agent._policy_net.parameters(), agent._target_net.parameters()):
+            self.assertTrue(torch.equal(policy_param, target_param))
+
+    def test_polyak_target_update(self) -> None:
+        agent = self._create_agent(target_update_tau=0.25)
+        self._perturb(agent)
+        target = [param.clone() for param in agent._target_net.parameters()]
+        agent._update_target_net()
+
+        for old, policy_param, target_param in zip(target, agent._policy_net.parameters(),
+                                                   agent._target_net.parameters()):
+            self.assertTrue(torch.allclose(0.75 * old + 0.25 * policy_param, target_param))
+
+    def test_target_update_without_foreach_ops(self) -> None:
+        # Older torch versions have no _foreach_copy_ / _foreach_lerp_
+        for tau in (1.0, 0.25):
+            agent = self._create_agent(target_update_tau=tau)
+            self._perturb(agent)
+            target = [param.clone() for param in agent._target_net.parameters()]
+
+            with mock.patch('agent.q_learning.dqn.hasattr', return_value=False, create=True):
+                agent._update_target_net()
+
+            for old, policy_param, target_param in zip(target, agent._policy_net.parameters(),
+                                                       agent._target_net.parameters()):
+                self.assertTrue(torch.allclose((1 - tau) * old + tau * policy_param, target_param))
+
+    def test_update_cadence(self) -> None:
+        for kwargs, expected in (({}, 2), ({'gradient_steps_per_update': 3}, 6),
+                                 ({'train_every': 2}, 2), ({'train_every': 1, 'gradient_steps_per_update': 2}, 8)):
+            agent = self._create_agent(**kwargs)
+            agent._is_training = False
+            agent._update_target_net = lambda: None
+
+            for _ in range(2):
+                agent.prepare_for_episode()
+                for i in range(3):
+                    agent.observe_environment(ObservableEnvironment((0,) * 18, 0.0, i == 2))
+                    if i < 2:
+                        agent.choose_action(TicTacToe().possible_actions)
+
+            self.assertEqual(expected, agent._gradient_step_cnt, kwargs)
+
+    def test_stores_experiences_only_in_replay_memory(self) -> None:
+        agent = self._create_agent(replay_memory_size=32)
+        agent._is_training = False
+
+        for _ in range(3):
+            agent.prepare_for_episode()
+            for i in range(3):
+                agent.observe_environment(ObservableEnvironment((0,) * 18, 0.0, i == 2))
+                if i < 2:
+                    agent.choose_action(TicTacToe().possible_actions)
+
+        self.assertTrue(len(agent._replay_memory) > 0)
+        self.assertEqual([], agent._memory.flush())
+        self.assertNotIn('memory', agent.state_dict())
+
+    def test_target_update_interval(self) -> None:
+        agent = self._create_agent(target_update_every=3)
+        syncs = []
+        agent._update_target_net = lambda: syncs.append(agent._gradient_step_cnt)
+        agent._replay_memory.insert((0,) * 18, 0, 0.0, (0,) * 18, True)
+
+        for _ in range(7):
+            agent._train()
+
+        self.assertEqual([3, 6], syncs)
+
+    @staticmethod
+    def _create_agent(**kwargs) -> DQN:
+        kwargs = {'replay_memory_size': 8, **kwargs}
+        return DQN(state_size=18, all_possible_actions=TicTacToe().possible_actions, batch_size=1, **kwargs)
+
+    @staticmethod
+    def _perturb(agent: DQN) -> None:
+        with torch.no_grad():
+            for param in agent._policy_net.parameters():
+                param.add_(torch.rand_like(param))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+from agent import MultiConfigQLearning, Random as RandomAgent
+from agent.q_learning import ObservableEnvironment
+from environment import TicTacToe
+from play import play
+import numpy as np
+import os
+import random
+import tempfile
+import unittest
+from unittest import TestCase
+
+
+class TestMultiConfigQLearning(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._agent = MultiConfigQLearning(('a', 'b', 'c'), configs=[(0.5, 0.9), (0.1, 0.5)], capacity=1)
+
+    def test_initialization(self) -> None:
+        self.assertEqual(((0.5, 0.9), (0.1, 0.5)), self._agent.configs)
+        self.assertEqual((2, 0, 3), self._agent.q_values.shape)
+        self.assertRaises(Exception, MultiConfigQLearning, ('a',), configs=[])
+
+    def test_terminal_update(self) -> None:
+        self._agent._epsilon = 0.0
+        self._agent.prepare_for_episode()
+        self._agent.observe_environment(ObservableEnvironment((0,), 0.0, False, (True, True, False)))
+        action = self._agent.choose_action(('a', 'b'))
+        self._agent.observe_environment(ObservableEnvironment((1,), -1.0, True, (False, False, False)))
+
+        np.testing.assert_array_equal([-1.0, -1.0], self._agent.q_values[:, 0, ('a', 'b', 'c').index(action)])
+        self.assertEqual([(0,), (1,)], self._agent.states)
+
+    def test_bellman_update_per_config(self) -> None:
+        self._agent._epsilon = 0.0
+        self._agent.prepare_for_episode()
+        self._agent.observe_environment(ObservableEnvironment((0,), 0.0, False, (True, False, False)))
+        self._agent.choose_action(('a',))
+        self._agent._row((1,))
+        self._agent._q_values[:, 1] = [[4.0, 2.0, 9.0], [4.0, 2.0, 9.0]]
+        self._agent.observe_environment(ObservableEnvironment((1,), 0.5, False, (True, True, False)))
+
+        np.testing.assert_allclose([0.5 * (0.5 + 0.9 * 4.0), 0.1 * (0.5 + 0.5 * 4.0)], self._agent.q_values[:, 0, 0])
+        self.assertEqual(0.0, self._agent.q_values[0, 0, 1])
+
+    def test_train_and_evaluate(self) -> None:
+        random.seed(1)
+        env = TicTacToe()
+        agent = MultiConfigQLearning(env.possible_actions, configs=[(0.3, 0.9), (0.9, 0.1)], training_amount=1000)
+        play(t=env, a1=agent, a2=RandomAgent(), ep=2000, nbr_of_games_to_print=0, should_print_info=False)
+
+        wins = agent.evaluate(nbr_of_games=1000, seed=1)
+
+        self.assertEqual((2,), wins.shape)
+        # A random 'x' wins about 58% of its games against a random 'o'
+        self.assertTrue((wins > 700).all())
+        self.assertTrue((wins <= 1000).all())
+
+    def test_save_and_load_q_table(self) -> None:
+        random.seed(2)
+        env = TicTacToe()
+        actions = env.possible_actions
+        agent = MultiConfigQLearning(actions, configs=[(0.3, 0.9), (0.9, 0.1)], capacity=1)
+        play(t=env, a1=agent, a2=RandomAgent(), ep=20, nbr_of_games_to_print=0, should_print_info=False)
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'q_table.pkl')
+            agent.save_q_table(file_name)
+
+            loaded = MultiConfigQLearning(actions, configs=[(0.3, 0.9), (0.9, 0.1)], capacity=1)
+            loaded.load_q_table(file_name)
+
+        self.assertEqual(agent.states, loaded.states)
+        np.testing.assert_array_equal(agent.q_values, loaded.q_values)
+        np.testing.assert_array_equal(agent.masks, loaded.masks)
+        self.assertRaises(Exception, loaded.set_q_table, {(0,): {'a': 1.0}})
+        self.assertRaises(Exception, MultiConfigQLearning(actions, configs=[(0.5, 0.5)]).set_q_table,
+                          agent._copy_q_table())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+from agent import SimpleDqn
+from agent.q_learning import ObservableEnvironment
+from environment import StateSpace, TicTacToe
+from scripted_policy import ScriptedPolicy
+import os
+import tempfile
+import torch
+import unittest
+from unittest import TestCase, mock
+
+
+class TestSimpleDqn(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._actions = TicTacToe().possible_actions
+        self._agent = SimpleDqn(state_size=18, all_possible_actions=self._actions, gamma=0.9)
+
+    def test_discounted_returns(self) -> None:
+        rewards = (0.0, 1.0, 0.0, -1.0)
+        expected = [sum(0.9 ** j * r for j, r in enumerate(rewards[i:])) for i in range(len(rewards))]
+
+        returns = SimpleDqn._calculate_discounted_returns(rewards, 0.9)
+
+        self.assertTrue(torch.allclose(torch.tensor(expected), returns))
+        self.assertEqual(0, len(SimpleDqn._calculate_discounted_returns((), 0.9)))
+
+    def test_action_mask(self) -> None:
+        action_mask = self._agent._create_action_mask(((0, 1), (2, 2)))
+
+        self.assertEqual((1, 9), action_mask.shape)
+        self.assertEqual([1, 8], action_mask.nonzero()[:, 1].tolist())
+        self.assertEqual(torch.bool, action_mask.dtype)
+        self.assertFalse(self._agent._create_action_mask(()).any())
+
+    def test_target_preds(self) -> None:
+        torch.manual_seed(0)
+        previous_preds = torch.rand(3, 9)
+        possible_actions = (self._actions, self._actions[2:5], self._actions[4:])
+        previous_actions = (0, 3, 8)
+        targets = torch.tensor([0.5, -1.0, 2.0])
+
+        expected = torch.zeros(3, 9)
+        for i, actions in enumerate(possible_actions):
+            indices = [self._actions.index(a) for a in actions]
+            expected[i][indices] = previous_preds[i][indices]
+            expected[i][previous_actions[i]] = targets[i]
+
+        target_preds = SimpleDqn._create_target_preds(
+            previous_preds, torch.tensor(previous_actions),
+            torch.cat([self._agent._create_action_mask(actions) for actions in possible_actions]), targets)
+
+        self.assertTrue(torch.equal(expected, target_preds))
+
+    def test_choose_best_action_index(self) -> None:
+        self._agent._current_state = torch.zeros((1, 18))
+        pred = self._agent._inference(self._agent._current_state).squeeze()
+        legal = (self._actions[1], self._actions[4], self._actions[7])
+
+        best = max((self._actions.index(a) for a in legal), key=lambda i: pred[i].item())
+
+        self.assertEqual(best, self._agent._choose_best_action_index(self._agent._create_action_mask(legal)))
+        self.assertEqual(5, self._agent._choose_best_action_index(self._agent._create_action_mask((self._actions[5],))))
+
+    def test_choose_action(self) -> None:
+        self._agent._current_state = torch.zeros((1, 18))
+        legal = self._actions[3:6]
+
+        for epsilon in (1.0, 0.0):
+            self._agent.epsilon = epsilon
+            for _ in range(20):
+                self.assertTrue(self._agent.choose_action(legal) in legal)
+
+    def test_action_mask_built_once_per_step(self) -> None:
+        legal = (False, True, True) + (False,) * 6
+        self._agent._is_training = False
+        self._agent.epsilon = 0.0
+        self._agent.prepare_for_episode()
+
+        with mock.patch.object(self._agent, '_create_action_mask', side_effect=AssertionError):
+            self._agent.observe_environment(ObservableEnvironment((0,) * 18, 0.0, False, legal))
+            action = self._agent.choose_action(self._actions[1:3])
+            action_mask = self._agent._current_action_mask
+            self._agent.observe_environment(ObservableEnvironment((0,) * 18, 0.0, False, legal))
+
+        self.assertTrue(action in self._actions[1:3])
+        self.assertEqual([[False, True, True] + [False] * 6], action_mask.tolist())
+        self.assertIs(action_mask, self._agent._memory.flush()[0][2])
+
+    def test_evaluate(self) -> None:
+        wins, losses, draws = self._agent.evaluate(nbr_of_games=200, max_batch_size=64, seed=0)
+
+        self.assertEqual(200, wins + losses + draws)
+        self.assertEqual((wins, losses, draws), self._agent.evaluate(nbr_of_games=200, seed=0))
+
+    def test_inference_server(self) -> None:
+        legal = self._actions[2:6]
+        state = torch.zeros((1, 18))
+        self._agent._current_state = state
+
+        with self._agent.create_inference_server() as server:
+            action_i = server.infer(state, self._agent._create_action_mask(legal))
+
+        self.assertEqual(self._agent._choose_best_action_index(self._agent._create_action_mask(legal)), action_i)
+
+    def test_quantize(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'model')
+            self._agent.save_model(file_name)
+            self.assertEqual(['model'], os.listdir(path))
+
+            agent = SimpleDqn(state_size=18, all_possible_actions=self._actions)
+            agent.load_model(file_name)
+
+        self.assertRaises(Exception, agent.quantization_mismatch_rate)
+        self.assertFalse(agent.is_quantized)
+
+        mismatch_rate = agent.quantize()
+
+        self.assertTrue(agent.is_quantized)
+        self.assertTrue(0.0 <= mismatch_rate < 0.1)
+        self.assertEqual(mismatch_rate, agent.quantization_mismatch_rate(StateSpace()))
+
+        agent._current_state = torch.zeros((1, 18))
+        legal = self._actions[2:6]
+        self.assertTrue(agent.choose_action(legal) in legal)
+
+        agent.dequantize()
+        self.assertFalse(agent.is_quantized)
+
+    def test_save_quantized_model(self) -> None:
+        self.assertRaises(Exception, self._agent.save_quantized_model)
+        self._agent.quantize()
+        state = [0.0, 1.0] + [0.0] * 16
+        mask = [False, True, True, True, True, True, True, True, True]
+
+        self._agent._current_state = torch.as_tensor([state])
+        expected = self._agent._choose_best_action_index(torch.as_tensor([mask]))
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'model')
+            self._agent.save_quantized_model(file_name)
+            policy = ScriptedPolicy(f'{file_name}.int8.pt')
+
+        self.assertEqual(expected, policy.choose_action_index(state, mask))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+from agent import ArrayQLearning, DQN, MultiConfigQLearning, QLearning, SimpleDqn
+from agent.utils import Checkpointer
+from environment import TicTacToe
+from tuning.training import seed_everything, train
+import os
+import random
+import tempfile
+import torch
+import unittest
+from unittest import TestCase, mock
+
+
+class TestCheckpointer(TestCase):
+    def test_retention(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path, keep_last=2) as checkpointer:
+                for step in (1, 20, 300):
+                    checkpointer.save(QLearning(), step)
+
+            self.assertEqual([os.path.join(path, f'checkpoint_{step:010d}.pkl') for step in (20, 300)],
+                             checkpointer.checkpoints)
+            self.assertEqual(checkpointer.checkpoints[-1], checkpointer.latest())
+            self.assertEqual(['checkpoint_0000000020.pkl', 'checkpoint_0000000300.pkl'], sorted(os.listdir(path)))
+
+    def test_failed_write_leaves_no_tmp_file(self) -> None:
+        agent = QLearning()
+
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path) as checkpointer:
+                with mock.patch.object(agent, 'state_dict', return_value={'unpicklable': lambda: None}):
+                    checkpointer.save(agent, 1)
+
+                self.assertRaises(Exception, checkpointer.wait)
+
+            self.assertEqual([], os.listdir(path))
+            self.assertIsNone(checkpointer.latest())
+
+    def test_load_while_removing_old_checkpoints(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path, keep_last=1) as checkpointer:
+                for step in range(1, 51):
+                    checkpointer.save(QLearning(), step)
+                    loaded_step = checkpointer.load(QLearning())
+                    self.assertTrue(loaded_step is None or loaded_step <= step)
+
+            self.assertEqual(50, checkpointer.load(QLearning()))
+
+    def test_snapshot(self) -> None:
+        agent = QLearning()
+        agent.set_q_table({(0,): {'a': 0.5}})
+
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path) as checkpointer:
+                checkpointer.save(agent, 1)
+                agent._q_table[(0,)]['a'] = 1.0
+
+            self.assertEqual({(0,): {'a': 0.5}}, Checkpointer.read(checkpointer.latest())['state']['q_table'])
+
+    def test_load(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path) as checkpointer:
+                self.assertIsNone(checkpointer.latest())
+                self.assertIsNone(checkpointer.load(QLearning()))
+
+                checkpointer.save(QLearning(), 7)
+                checkpointer.wait()
+
+                self.assertEqual(7, checkpointer.load(QLearning()))
+                self.assertRaises(Exception, checkpointer.load, ArrayQLearning(TicTacToe().possible_actions))
+
+    def test_restores_rng_state(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with Checkpointer(path) as checkpointer:
+                random.seed(0)
+                torch.manual_seed(0)
+                checkpointer.save(QLearning(), 1)
+                expected = (random.random(), torch.rand(3))
+
+                checkpointer.wait()
+                checkpointer.load(QLearning())
+
+                self.assertEqual(expected[0], random.random())
+                self.assertTrue(torch.equal(expected[1], torch.rand(3)))
+
+    def test_resume_q_learning(self) -> None:
+        expected, resumed = self._train_and_resume(lambda: QLearning(training_amount=100))
+
+        self.assertEqual(expected._q_table, resumed._q_table)
+        self.assertEqual(expected.epsilon, resumed.epsilon)
+
+    def test_resume_dqn(self) -> None:
+        def create_agent() -> DQN:
+            agent = DQN(state_size=18, all_possible_actions=TicTacToe().possible_actions, training_amount=100,
+                        replay_memory_size=32, batch_size=4, prioritized_replay=True, train_every=2)
+            agent._is_training = False
+            return agent
+
+        expected, resumed = self._train_and_resume(create_agent)
+
+        for expected_param, resumed_param in zip(expected._policy_net.parameters(), resumed._policy_net.parameters()):
+            self.assertTrue(torch.equal(expected_param, resumed_param))
+        for expected_param, resumed_param in zip(expected._target_net.parameters(), resumed._target_net.parameters()):
+            self.assertTrue(torch.equal(expected_param, resumed_param))
+        self.assertEqual(expected._gradient_step_cnt, resumed._gradient_step_cnt)
+        self.assertEqual(expected._replay_memory.beta, resumed._replay_memory.beta)
+
+    def test_resume_array_q_learning(self) -> None:
+        expected, resumed = self._train_and_resume(
+            lambda: ArrayQLearning(TicTacToe().possible_actions, training_amount=100))
+
+        self.assertEqual(expected._q_table.states, resumed._q_table.states)
+        self.assertTrue((expected._q_table.values == resumed._q_table.values).all())
+        self.assertTrue((expected._q_table.masks == resumed._q_table.masks).all())
+        self.assertEqual(expected.epsilon, resumed.epsilon)
+
+    def test_resume_multi_config_q_learning(self) -> None:
+        expected, resumed = self._train_and_resume(
+            lambda: MultiConfigQLearning(TicTacToe().possible_actions, [(0.1, 0.9), (0.5, 0.5)], training_amount=100))
+
+        self.assertEqual(expected.states, resumed.states)
+        self.assertTrue((expected.q_values == resumed.q_values).all())
+        self.assertTrue((expected.masks == resumed.masks).all())
+        self.assertEqual(expected.epsilon, resumed.epsilon)
+
+    def test_resume_simple_dqn(self) -> None:
+        def create_agent() -> SimpleDqn:
+            agent = SimpleDqn(state_size=18, all_possible_actions=TicTacToe().possible_actions, training_amount=100)
+            agent._is_training = False
+            return agent
+
+        expected, resumed = self._train_and_resume(create_agent)
+
+        for expected_param, resumed_param in zip(expected._policy_net.parameters(), resumed._policy_net.parameters()):
+            self.assertTrue(torch.equal(expected_param, resumed_param))
+        self.assertEqual(expected._step_cnt, resumed._step_cnt)
+        self.assertEqual(expected.epsilon, resumed.epsilon)
+
+    @staticmethod
+    def _train_and_resume(create_agent):
+        # Trains 20 games, checkpoints and trains 10 more, then resumes a fresh agent from the checkpoint
+        with tempfile.TemporaryDirectory() as path:
+            seed_everything(0)
+            expected = create_agent()
+            train(TicTacToe(), expected, 20)
+
+            with Checkpointer(path) as checkpointer:
+                checkpointer.save(expected, 20)
+
+            train(TicTacToe(), expected, 10)
+
+            seed_everything(1)
+            resumed = create_agent()
+            Checkpointer(path).load(resumed)
+            train(TicTacToe(), resumed, 10)
+
+        return expected, resumed
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+from agent.utils import InferenceServer
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Thread
+from time import sleep
+import torch
+import torch.nn as nn
+import unittest
+from unittest import TestCase
+
+
+class TestInferenceServer(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        torch.manual_seed(0)
+        self._model = nn.Linear(4, 3)
+        self._states = torch.rand(50, 4)
+        self._masks = torch.rand(50, 3) > 0.3
+        self._masks[:, 0] = True
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(Exception, InferenceServer, self._model, max_batch_size=0)
+        self.assertRaises(Exception, InferenceServer, self._model, max_wait=-1.0)
+        self.assertRaises(Exception, InferenceServer(self._model).submit, self._states[0])
+
+    def test_infer_matches_masked_argmax(self) -> None:
+        expected = self._expected()
+
+        with InferenceServer(self._model, max_batch_size=8, max_wait=0.01) as server:
+            self.assertTrue(server.is_running)
+            with ThreadPoolExecutor(16) as executor:
+                actions = list(executor.map(server.infer, self._states, self._masks))
+
+        self.assertFalse(server.is_running)
+        self.assertEqual(expected, actions)
+        self.assertEqual(50, server.nbr_of_requests)
+        self.assertTrue(server.nbr_of_batches < 50)
+        self.assertTrue(server.largest_batch_size <= 8)
+
+    def test_infer_without_mask(self) -> None:
+        with InferenceServer(self._model) as server:
+            action = server.infer(self._states[0].tolist())
+
+        self.assertEqual(self._model(self._states[:1]).argmax().item(), action)
+
+    def test_infer_batch(self) -> None:
+        server = InferenceServer(self._model, max_batch_size=7)
+
+        self.assertEqual(self._expected(), server.infer_batch(self._states, self._masks).tolist())
+        self.assertEqual(0, len(server.infer_batch(torch.zeros(0, 4))))
+
+    def test_error_is_forwarded(self) -> None:
+        with InferenceServer(self._model) as server:
+            future = server.submit([1.0, 2.0])
+            self.assertRaises(Exception, future.result)
+
+    def test_stop_fails_pending_requests(self) -> None:
+        is_in_model = Event()
+        is_released = Event()
+
+        def model(states: torch.Tensor) -> torch.Tensor:
+            is_in_model.set()
+            is_released.wait()
+            return self._model(states)
+
+        server = InferenceServer(model, max_wait=0.0)
+        server.start()
+        served = server.submit(self._states[0])
+        is_in_model.wait()
+
+        stopper = Thread(target=server.stop)
+        stopper.start()
+        while server._requests.qsize() == 0:
+            sleep(0.001)
+
+        # A request that ended up behind the stop sentinel
+        left_over = Future()
+        server._requests.put((self._states[1], None, left_over))
+        is_released.set()
+        stopper.join()
+
+        self.assertEqual(self._model(self._states[:1]).argmax().item(), served.result(timeout=1))
+        self.assertTrue(left_over.done())
+        self.assertRaises(Exception, left_over.result)
+        self.assertRaises(Exception, server.submit, self._states[2])
+
+    def _expected(self) -> list:
+        with torch.no_grad():
+            preds = self._model(self._states).masked_fill(~self._masks, float('-inf'))
+
+        return preds.argmax(dim=1).tolist()
+
+
+if __name__ == '__main__':
+    unittest.main()
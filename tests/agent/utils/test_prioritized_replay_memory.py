@@ -0,0 +1,49 @@
+from agent.utils import PrioritizedReplayMemory
+import numpy as np
+import torch
+import unittest
+from unittest import TestCase
+
+
+class TestPrioritizedReplayMemory(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        np.random.seed(0)
+        self._memory = PrioritizedReplayMemory(state_size=2, memory_size=4, batch_size=2, beta=0.5,
+                                               beta_increment=0.25)
+        for i in range(4):
+            self._memory.insert((i, i), i, float(i), (i, i), False)
+
+    def test_sample(self) -> None:
+        experiences, weights, indices = self._memory.get_prioritized_sample()
+        states, actions, rewards, next_states, is_terminals = experiences
+
+        self.assertEqual((2, 2), states.shape)
+        self.assertTrue(torch.equal(torch.as_tensor(indices), actions))
+        # Equal priorities give uniform weights
+        self.assertTrue(torch.equal(torch.ones(2), weights))
+        self.assertEqual(0.75, self._memory.beta)
+
+    def test_update_priorities(self) -> None:
+        self._memory.update_priorities(np.array([0, 1, 2, 3]), torch.tensor([0.0, 0.0, 0.0, 4.0]))
+
+        counts = np.zeros(4)
+        for _ in range(200):
+            _, weights, indices = self._memory.get_prioritized_sample()
+            counts += np.bincount(indices, minlength=4)
+
+        self.assertTrue(counts[3] > 300)
+        self.assertEqual(1.0, self._memory.beta)
+
+        _, weights, indices = self._memory.get_prioritized_sample()
+        self.assertTrue(weights[indices == 3].max() <= 1.0)
+
+    def test_new_experience_gets_max_priority(self) -> None:
+        self._memory.update_priorities(np.array([0, 1, 2, 3]), np.array([0.0, 0.0, 0.0, 4.0]))
+        self._memory.insert((9, 9), 0, 1.0, (9, 9), True)
+
+        self.assertEqual(self._memory._sum_tree.get(3), self._memory._sum_tree.get(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+from agent.utils import QTable
+import numpy as np
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+
+class TestQTable(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._q_table = QTable(nbr_of_actions=3, capacity=2)
+
+    def test_initialization(self) -> None:
+        self.assertEqual(0, len(self._q_table))
+        self.assertEqual(3, self._q_table.nbr_of_actions)
+        self.assertRaises(Exception, QTable, nbr_of_actions=0)
+
+    def test_row(self) -> None:
+        first = self._q_table.row((0, 1))
+        second = self._q_table.row((1, 0))
+
+        self.assertEqual(0, first)
+        self.assertEqual(1, second)
+        self.assertEqual(first, self._q_table.row((0, 1)))
+        self.assertTrue((1, 0) in self._q_table)
+        self.assertFalse((1, 1) in self._q_table)
+        self.assertEqual(second, self._q_table.find_row((1, 0)))
+        self.assertIsNone(self._q_table.find_row((1, 1)))
+        self.assertEqual([(0, 1), (1, 0)], self._q_table.states)
+
+    def test_grow(self) -> None:
+        self._q_table.row('a')
+        self._q_table.values[0, 2] = 0.5
+        self._q_table.set_legal(0, [2])
+
+        for state in 'bcdef':
+            self._q_table.row(state)
+
+        self.assertEqual(6, len(self._q_table))
+        self.assertEqual((6, 3), self._q_table.values.shape)
+        self.assertEqual(0.5, self._q_table.values[0, 2])
+        np.testing.assert_array_equal(np.array([False, False, True]), self._q_table.masks[0])
+        self.assertFalse(self._q_table.masks[5].any())
+
+    def test_max_value(self) -> None:
+        row = self._q_table.row('a')
+        self.assertEqual(None, self._q_table.max_value(row))
+
+        self._q_table.values[row] = [3.0, -1.0, 2.0]
+        self._q_table.set_legal(row, [1, 2])
+
+        self.assertEqual(2.0, self._q_table.max_value(row))
+
+    def test_best_action_indices(self) -> None:
+        row = self._q_table.row('a')
+        self._q_table.values[row] = [1.0, 3.0, 3.0]
+        self._q_table.set_legal(row, [0, 1, 2])
+
+        self.assertEqual([1, 2], self._q_table.best_action_indices(row))
+        self.assertEqual([0, 1, 2], self._q_table.legal_indices(row))
+
+        row = self._q_table.row('b')
+        self._q_table.values[row] = [1.0, 3.0, 2.0]
+        self._q_table.set_legal(row, [0, 2])
+
+        self.assertEqual([2], self._q_table.best_action_indices(row))
+
+    def test_save_and_load(self) -> None:
+        self._fill()
+
+        with tempfile.TemporaryDirectory() as path:
+            self._q_table.save(path)
+            loaded = QTable.load(path)
+
+        self.assertEqual(self._q_table.states, loaded.states)
+        np.testing.assert_array_equal(self._q_table.values, loaded.values)
+        np.testing.assert_array_equal(self._q_table.masks, loaded.masks)
+        self.assertEqual([1, 2], loaded.legal_indices(1))
+        self.assertFalse(loaded.is_read_only)
+
+        row = loaded.row((1, 1, 1))
+        self.assertEqual(3, row)
+        self.assertEqual(np.float64, loaded.values.dtype)
+
+    def test_save_as_float16(self) -> None:
+        self._fill()
+
+        with tempfile.TemporaryDirectory() as path:
+            self._q_table.save(path, dtype=np.float16)
+            self.assertEqual(np.float16, np.load(os.path.join(path, 'values.npy')).dtype)
+            loaded = QTable.load(path)
+
+        np.testing.assert_allclose(self._q_table.values, loaded.values, atol=1e-3)
+
+    def test_load_read_only(self) -> None:
+        self._fill()
+
+        with tempfile.TemporaryDirectory() as path:
+            self._q_table.save(path)
+            loaded = QTable.load(path, read_only=True)
+
+            self.assertTrue(loaded.is_read_only)
+            self.assertTrue(isinstance(loaded.values, np.memmap))
+            self.assertEqual(1, loaded.row((0, 1, 0)))
+            self.assertEqual(-0.5, loaded.max_value(1))
+            self.assertRaises(Exception, loaded.row, (1, 1, 1))
+            del loaded
+
+    def test_save_unsupported_states(self) -> None:
+        self._q_table.row('a')
+
+        with tempfile.TemporaryDirectory() as path:
+            self.assertRaises(Exception, self._q_table.save, path)
+
+    def _fill(self) -> None:
+        for state, values, legal in (((0, 0, 0), [0.1, 0.2, 0.3], [0, 1, 2]),
+                                     ((0, 1, 0), [0.0, -0.5, -0.75], [1, 2]),
+                                     ((1, 1, 0), [0.0, 0.0, 1.0], [2])):
+            row = self._q_table.row(state)
+            self._q_table.values[row] = values
+            self._q_table.set_legal(row, legal)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+from agent.utils import SumTree
+import numpy as np
+import unittest
+from unittest import TestCase
+
+
+class TestSumTree(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._tree = SumTree(5)
+
+    def test_initialization(self) -> None:
+        self.assertEqual(5, len(self._tree))
+        self.assertEqual(0.0, self._tree.total)
+        self.assertRaises(Exception, SumTree, 0)
+
+    def test_update(self) -> None:
+        self._tree.update(np.array([0, 2, 4]), np.array([1.0, 2.0, 3.0]))
+        self.assertEqual(6.0, self._tree.total)
+
+        self._tree.update(2, 0.5)
+        self.assertEqual(4.5, self._tree.total)
+        np.testing.assert_array_equal([1.0, 0.0, 0.5, 0.0, 3.0], self._tree.get(np.arange(5)))
+        self.assertRaises(Exception, self._tree.update, 5, 1.0)
+
+    def test_find(self) -> None:
+        self._tree.update(np.arange(5), np.array([1.0, 0.0, 2.0, 0.0, 3.0]))
+
+        np.testing.assert_array_equal([0, 0, 2, 2, 4, 4], self._tree.find(np.array([0.0, 1.0, 1.5, 3.0, 3.5, 6.0])))
+
+    def test_find_is_proportional(self) -> None:
+        self._tree.update(np.arange(5), np.array([1.0, 0.0, 2.0, 0.0, 7.0]))
+        rng = np.random.default_rng(0)
+
+        counts = np.bincount(self._tree.find(rng.random(100000) * self._tree.total), minlength=5)
+
+        np.testing.assert_allclose([0.1, 0.0, 0.2, 0.0, 0.7], counts / counts.sum(), atol=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+from agent.utils import TensorReplayMemory
+import torch
+import unittest
+from unittest import TestCase
+
+
+class TestTensorReplayMemory(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._memory = TensorReplayMemory(state_size=3, memory_size=4, batch_size=2)
+
+    def test_initialization(self) -> None:
+        self.assertEqual(4, self._memory.memory_size)
+        self.assertEqual(2, self._memory.batch_size)
+        self.assertEqual(0, len(self._memory))
+        self.assertRaises(Exception, TensorReplayMemory, state_size=3, memory_size=32, batch_size=64)
+
+    def test_insertion(self) -> None:
+        self._memory.insert(torch.tensor([[1.0, 0.0, 1.0]]), 2, -1.0, (0, 1, 1), True)
+        states, actions, rewards, next_states, is_terminals = self._memory._get(torch.tensor([0]))
+
+        self.assertTrue(torch.equal(torch.tensor([[1.0, 0.0, 1.0]]), states))
+        self.assertTrue(torch.equal(torch.tensor([2]), actions))
+        self.assertTrue(torch.equal(torch.tensor([-1.0]), rewards))
+        self.assertTrue(torch.equal(torch.tensor([[0.0, 1.0, 1.0]]), next_states))
+        self.assertTrue(torch.equal(torch.tensor([True]), is_terminals))
+        self.assertEqual(1, len(self._memory))
+
+    def test_insertion_at_beginning_on_overflow(self) -> None:
+        for i in range(6):
+            self._memory.insert((i, i, i), i, float(i), (i, i, i), False)
+
+        _, actions, _, _, _ = self._memory._get(torch.arange(4))
+
+        self.assertTrue(torch.equal(torch.tensor([4, 5, 2, 3]), actions))
+        self.assertEqual(4, len(self._memory))
+
+    def test_sample(self) -> None:
+        self._memory.insert((0, 0, 0), 0, 0.0, (0, 0, 0), False)
+        self.assertFalse(self._memory.can_sample())
+        self.assertRaises(Exception, self._memory.get_sample)
+
+        for i in range(1, 3):
+            self._memory.insert((i, i, i), i, float(i), (i, i, i), i == 2)
+
+        self.assertTrue(self._memory.can_sample())
+        states, actions, rewards, next_states, is_terminals = self._memory.get_sample()
+
+        self.assertEqual((2, 3), states.shape)
+        self.assertEqual((2,), actions.shape)
+        self.assertEqual(torch.int64, actions.dtype)
+        self.assertEqual(torch.bool, is_terminals.dtype)
+        self.assertTrue((actions <= 2).all())
+        self.assertTrue(torch.equal(rewards, actions.float()))
+        self.assertTrue(torch.equal(is_terminals, actions == 2))
+
+    def test_sample_without_replacement(self) -> None:
+        memory = TensorReplayMemory(state_size=1, memory_size=8, batch_size=8)
+        for i in range(8):
+            memory.insert((i,), i, 0.0, (i,), False)
+
+        for _ in range(20):
+            _, actions, _, _, _ = memory.get_sample()
+            self.assertEqual(list(range(8)), sorted(actions.tolist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+from agent import ArrayQLearning, QLearning, Random as RandomAgent
+from agent.utils import TicTacToeSolver
+from environment import TicTacToe
+from environment_interpreter import EnvironmentInterpreterFactory
+import numpy as np
+import random
+import time
+import unittest
+from unittest import TestCase
+
+
+class TestTicTacToeSolver(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._solver = TicTacToeSolver()
+
+    def test_speed(self) -> None:
+        start = time.perf_counter()
+        TicTacToeSolver(opponent='random', state_space=self._solver.state_space).q_table()
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_unknown_opponent(self) -> None:
+        self.assertRaises(Exception, TicTacToeSolver, opponent='perfect')
+
+    def test_empty_board_is_a_draw(self) -> None:
+        np.testing.assert_array_equal(np.zeros(9), self._solver.q_values[0])
+        self.assertEqual(0.0, self._solver.values[0])
+
+    def test_q_values(self) -> None:
+        #  _X_|_X_|___
+        #  _O_|_O_|___
+        #     |   |
+        state = (0, 1, 0, 1, 0, 0,
+                 1, 0, 1, 0, 0, 0,
+                 0, 0, 0, 0, 0, 0)
+        q_table = self._solver.q_table()
+
+        self.assertEqual(1.0, q_table[state][(0, 2)])
+        self.assertEqual(-1.0, q_table[state][(2, 0)])
+        self.assertEqual(5, len(q_table[state]))
+        self.assertEqual(len(self._solver.state_space), len(q_table))
+
+    def test_random_opponent_prefers_corner(self) -> None:
+        q_values = TicTacToeSolver(opponent='random', state_space=self._solver.state_space).q_values[0]
+
+        self.assertEqual(q_values[0], q_values.max())
+        self.assertTrue(q_values[4] > q_values[1])
+
+    def test_array_q_table_matches_q_table(self) -> None:
+        all_actions = tuple(reversed(TicTacToe().possible_actions))
+        array_q_table = self._solver.array_q_table(all_actions)
+
+        for state, actions in self._solver.q_table().items():
+            row = array_q_table.row(state)
+            self.assertEqual(len(actions), array_q_table.masks[row].sum())
+            for action, value in actions.items():
+                self.assertEqual(value, array_q_table.values[row, all_actions.index(action)])
+
+    def test_warm_started_agents_never_lose(self) -> None:
+        env = TicTacToe()
+        dict_agent = QLearning()
+        dict_agent.set_q_table(self._solver.q_table())
+        array_agent = ArrayQLearning(env.possible_actions)
+        array_agent.set_q_table(self._solver.array_q_table(env.possible_actions))
+
+        random.seed(7)
+        for agent in (dict_agent, array_agent):
+            agent._epsilon = 0.0
+            interpreter = EnvironmentInterpreterFactory.create(env, agent)
+            opponent = RandomAgent()
+
+            for _ in range(200):
+                env.reset()
+                agent.prepare_for_episode()
+
+                while env.is_active:
+                    if env.turn == 'x':
+                        agent.observe_environment(interpreter.observable_environment)
+                        env.execute_action(agent.choose_action(env.possible_actions))
+                    else:
+                        env.execute_action(opponent.choose_action(env.possible_actions))
+
+                self.assertNotEqual('o', env.winner)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+from unittest import TestCase
+from environment import MnkGame, TicTacToe
+from random import Random
+
+
+class TestMnkGame(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.game = MnkGame()
+
+    def test_default_board(self) -> None:
+        self.assertEqual(15, self.game.rows)
+        self.assertEqual(15, self.game.columns)
+        self.assertEqual(5, self.game.k)
+        self.assertEqual(225, len(self.game.possible_actions))
+        self.assertEqual('x', self.game.turn)
+
+    def test_invalid_board(self) -> None:
+        self.assertRaises(Exception, MnkGame, m=0, n=3, k=3)
+        self.assertRaises(Exception, MnkGame, m=3, n=3, k=4)
+
+    def test_rectangular_board(self) -> None:
+        game = MnkGame(m=2, n=4, k=3)
+        expected = ((0, 0), (0, 1), (0, 2), (0, 3), (1, 0), (1, 1), (1, 2), (1, 3))
+
+        self.assertEqual(expected, game.possible_actions)
+        self.assertEqual([['', '', '', ''], ['', '', '', '']], game.state)
+
+    def test_possible_actions_after_action_execution(self) -> None:
+        self.game.execute_action((7, 7))
+
+        self.assertTrue((7, 7) not in self.game.possible_actions)
+        self.assertEqual(224, len(self.game.possible_actions))
+        self.assertEqual('x', self.game.state[7][7])
+        self.assertEqual('o', self.game.turn)
+
+    def test_on_invalid_action(self) -> None:
+        self.game.execute_action((7, 7))
+        self.game.execute_action((7, 7))
+        self.game.execute_action((15, 0))
+
+        self.assertEqual('o', self.game.turn)
+        self.assertEqual(224, len(self.game.possible_actions))
+
+    def test_horizontal_win(self) -> None:
+        for j in (0, 1, 3, 4):
+            self.game.execute_action((0, j))
+            self.game.execute_action((5, j))
+
+        self.assertIsNone(self.game.winner)
+        self.assertTrue(self.game.is_active)
+
+        self.game.execute_action((0, 2))
+
+        self.assertEqual('x', self.game.winner)
+        self.assertEqual(((0, 0), (0, 1), (0, 2), (0, 3), (0, 4)), self.game.win_position)
+        self.assertFalse(self.game.is_active)
+
+    def test_anti_diagonal_win(self) -> None:
+        self.game = MnkGame(first_turn='o')
+
+        for step in range(4):
+            self.game.execute_action((10 + step, 10 - step))
+            self.game.execute_action((0, step))
+        self.game.execute_action((14, 6))
+
+        self.assertEqual('o', self.game.winner)
+        self.assertEqual(((10, 10), (11, 9), (12, 8), (13, 7), (14, 6)), self.game.win_position)
+
+    def test_win_position_has_k_cells(self) -> None:
+        self.game = MnkGame(m=3, n=7, k=3)
+
+        for step, j in enumerate((0, 1, 3, 4)):
+            self.game.execute_action((0, j))
+            self.game.execute_action((2, 2 * step))
+
+        self.game.execute_action((0, 2))
+
+        self.assertEqual('x', self.game.winner)
+        self.assertEqual(((0, 0), (0, 1), (0, 2)), self.game.win_position)
+
+    def test_no_win_with_less_than_k(self) -> None:
+        for i in range(4):
+            self.game.execute_action((i, 0))
+            self.game.execute_action((i, 14))
+
+        self.assertIsNone(self.game.winner)
+        self.assertTrue(self.game.is_active)
+
+    def test_bitboard(self) -> None:
+        self.game.execute_action((0, 1))
+        self.game.execute_action((1, 0))
+
+        self.assertEqual((1 << 1, 1 << 15), self.game.bitboard)
+
+    def test_draw(self) -> None:
+        game = MnkGame(m=1, n=2, k=2)
+        game.execute_action((0, 0))
+        game.execute_action((0, 1))
+
+        self.assertIsNone(game.winner)
+        self.assertFalse(game.is_active)
+
+    def test_reset(self) -> None:
+        self.game.execute_action((0, 0))
+        self.game.reset()
+
+        self.assertEqual(225, len(self.game.possible_actions))
+        self.assertEqual('', self.game.state[0][0])
+        self.assertEqual((0, 0), self.game.bitboard)
+        self.assertEqual('x', self.game.turn)
+
+    def test_push_pop(self) -> None:
+        for j in range(4):
+            self.game.push((0, j))
+            self.game.push((1, j))
+        before = (self.game.state, self.game.possible_actions, self.game.bitboard, self.game.turn)
+
+        self.game.push((0, 4))
+        self.assertEqual('x', self.game.winner)
+
+        self.game.pop()
+        self.assertEqual(before, (self.game.state, self.game.possible_actions, self.game.bitboard, self.game.turn))
+        self.assertIsNone(self.game.winner)
+        self.assertIsNone(self.game.win_position)
+        self.assertTrue(self.game.is_active)
+
+        self.game.push((0, 0))
+        self.game.pop()
+        self.assertEqual(before, (self.game.state, self.game.possible_actions, self.game.bitboard, self.game.turn))
+
+        for _ in range(8):
+            self.game.pop()
+        self.assertEqual(225, len(self.game.possible_actions))
+        self.assertEqual((0, 0), self.game.bitboard)
+        self.assertRaises(Exception, self.game.pop)
+
+    def test_matches_tic_tac_toe(self) -> None:
+        rnd = Random(0)
+        game = MnkGame(m=3, n=3, k=3)
+        ttt = TicTacToe()
+
+        for _ in range(200):
+            game.reset()
+            ttt.reset()
+
+            while ttt.is_active:
+                action = rnd.choice(ttt.possible_actions)
+                game.execute_action(action)
+                ttt.execute_action(action)
+
+                self.assertEqual(ttt.state, game.state)
+                self.assertEqual(ttt.possible_actions, game.possible_actions)
+                self.assertEqual(ttt.winner, game.winner)
+                self.assertEqual(ttt.win_position, game.win_position)
+                self.assertEqual(ttt.is_active, game.is_active)
+                self.assertEqual(ttt.get_state_as_string(), game.get_state_as_string())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,6 +33,14 @@ class TestActions(TestCase):
 
         self.assertTrue(action not in new_actions and len(new_actions) == (len(old_actions) - 1))
 
+    def test_possible_actions_view(self) -> None:
+        self.ttt.execute_action((0, 0))
+        expected = ((0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2))
+        actual = self.ttt.possible_actions_view
+
+        self.assertEqual(expected, actual)
+        self.assertIs(actual, self.ttt.possible_actions_view)
+
     def test_on_invalid_action(self) -> None:
         action = (-1, 99)
         self.ttt.execute_action(action)
@@ -0,0 +1,55 @@
+import unittest
+from unittest import TestCase
+from environment.tic_tac_toe.bitboard import ACTIONS, ACTIONS_TABLE, FULL_MASK, WIN_MASKS, WIN_TABLE, \
+    bits_to_actions, bits_to_rows, position_to_bits
+from .utils import generate_horizontal_win_actions, generate_vertical_win_actions, generate_diagonal_win_actions
+
+
+class TestBitboard(TestCase):
+    def test_win_masks(self) -> None:
+        positions = generate_horizontal_win_actions() + generate_vertical_win_actions() + \
+                    generate_diagonal_win_actions()
+        expected = tuple(position_to_bits(position) for position in positions)
+        actual = WIN_MASKS
+
+        self.assertEqual(expected, actual)
+
+    def test_win_table_size(self) -> None:
+        self.assertEqual(512, len(WIN_TABLE))
+        self.assertEqual(512, len(ACTIONS_TABLE))
+
+    def test_win_table_on_win_positions(self) -> None:
+        for position in generate_horizontal_win_actions() + generate_vertical_win_actions():
+            self.assertEqual(position, WIN_TABLE[position_to_bits(position)])
+
+    def test_win_table_without_win(self) -> None:
+        bits = position_to_bits(((0, 0), (0, 1), (1, 2), (2, 0)))
+
+        self.assertEqual(None, WIN_TABLE[bits])
+        self.assertEqual(None, WIN_TABLE[0])
+
+    def test_win_table_prefers_horizontal(self) -> None:
+        bits = position_to_bits(((0, 0), (0, 1), (0, 2), (1, 0), (2, 0)))
+        expected = ((0, 0), (0, 1), (0, 2))
+
+        self.assertEqual(expected, WIN_TABLE[bits])
+
+    def test_actions_table(self) -> None:
+        self.assertEqual(ACTIONS, ACTIONS_TABLE[FULL_MASK])
+        self.assertEqual((), ACTIONS_TABLE[0])
+
+        bits = position_to_bits(((1, 1), (2, 2)))
+        self.assertEqual(((1, 1), (2, 2)), ACTIONS_TABLE[bits])
+        self.assertEqual(((1, 1), (2, 2)), bits_to_actions(bits))
+
+    def test_bits_to_rows(self) -> None:
+        x_bits = position_to_bits(((0, 0), (1, 1)))
+        o_bits = position_to_bits(((2, 2),))
+        expected = (('x', '', ''), ('', 'x', ''), ('', '', 'o'))
+        actual = bits_to_rows(x_bits, o_bits)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from unittest import TestCase
+from environment import Reversible, TicTacToe, VecTicTacToe
+from random import Random
+
+
+class TestPushPop(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.ttt = TicTacToe()
+
+    def test_push(self) -> None:
+        self.ttt.push((1, 1))
+
+        self.assertEqual([['', '', ''], ['', 'x', ''], ['', '', '']], self.ttt.state)
+        self.assertEqual('o', self.ttt.turn)
+
+    def test_pop_restores_empty_board(self) -> None:
+        self.ttt.push((1, 1))
+        self.ttt.pop()
+
+        self.assertEqual([['', '', ''], ['', '', ''], ['', '', '']], self.ttt.state)
+        self.assertEqual('x', self.ttt.turn)
+        self.assertEqual(9, len(self.ttt.possible_actions))
+        self.assertTrue(self.ttt.is_active)
+
+    def test_pop_restores_win(self) -> None:
+        for action in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            self.ttt.push(action)
+        self.ttt.push((0, 2))
+
+        self.assertEqual('x', self.ttt.winner)
+        self.assertFalse(self.ttt.is_active)
+
+        self.ttt.pop()
+
+        self.assertEqual(None, self.ttt.winner)
+        self.assertEqual(None, self.ttt.win_position)
+        self.assertTrue(self.ttt.is_active)
+        self.assertEqual('x', self.ttt.turn)
+        self.assertTrue((0, 2) in self.ttt.possible_actions)
+
+    def test_pop_after_invalid_action(self) -> None:
+        self.ttt.push((0, 0))
+        self.ttt.push((0, 0))
+        self.ttt.pop()
+
+        self.assertEqual('o', self.ttt.turn)
+        self.assertEqual('x', self.ttt.state[0][0])
+
+    def test_pop_without_push(self) -> None:
+        self.assertRaises(Exception, self.ttt.pop)
+
+        self.ttt.push((0, 0))
+        self.ttt.reset()
+        self.assertRaises(Exception, self.ttt.pop)
+
+    def test_random_push_pop_sequences(self) -> None:
+        rnd = Random(0)
+
+        for _ in range(100):
+            history = []
+            while self.ttt.is_active and rnd.random() < 0.9:
+                history.append((self.ttt.state, self.ttt.turn, self.ttt.winner, self.ttt.win_position,
+                                self.ttt.is_active, self.ttt.possible_actions, self.ttt.get_state_as_string()))
+                self.ttt.push(rnd.choice(self.ttt.possible_actions))
+
+            while history:
+                self.ttt.pop()
+                self.assertEqual(history.pop(), (self.ttt.state, self.ttt.turn, self.ttt.winner,
+                                                 self.ttt.win_position, self.ttt.is_active,
+                                                 self.ttt.possible_actions, self.ttt.get_state_as_string()))
+
+    def test_unsupported_environment(self) -> None:
+        vec = VecTicTacToe(nbr_of_boards=1)
+
+        self.assertTrue(isinstance(self.ttt, Reversible))
+        self.assertFalse(isinstance(vec, Reversible))
+        self.assertFalse(hasattr(vec, 'push'))
+        self.assertFalse(hasattr(vec, 'pop'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest import TestCase
+from environment import MnkGame, Snapshottable, TicTacToe, VecTicTacToe
+import pickle
+
+
+class TestSnapshot(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.ttt = TicTacToe()
+
+    def test_empty_board_snapshot(self) -> None:
+        self.assertEqual(0, self.ttt.snapshot())
+        self.assertEqual(1 << 18, TicTacToe(first_turn='o').snapshot())
+
+    def test_snapshot_is_hashable_and_picklable(self) -> None:
+        self.ttt.execute_action((1, 1))
+        snapshot = self.ttt.snapshot()
+
+        cache = {snapshot: 'center'}
+        self.assertEqual('center', cache[pickle.loads(pickle.dumps(snapshot))])
+
+    def test_transpositions_share_snapshot(self) -> None:
+        other = TicTacToe()
+        for action in ((0, 0), (1, 1), (2, 2)):
+            self.ttt.execute_action(action)
+        for action in ((2, 2), (1, 1), (0, 0)):
+            other.execute_action(action)
+
+        self.assertEqual(self.ttt.snapshot(), other.snapshot())
+
+    def test_restore(self) -> None:
+        for action in ((0, 0), (1, 0), (0, 1)):
+            self.ttt.execute_action(action)
+        snapshot = self.ttt.snapshot()
+        expected = (self.ttt.state, self.ttt.turn, self.ttt.possible_actions, self.ttt.is_active)
+
+        self.ttt.execute_action((1, 1))
+        self.ttt.execute_action((0, 2))
+        self.assertEqual('x', self.ttt.winner)
+
+        self.ttt.restore(snapshot)
+        actual = (self.ttt.state, self.ttt.turn, self.ttt.possible_actions, self.ttt.is_active)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(None, self.ttt.winner)
+        self.assertEqual(None, self.ttt.win_position)
+
+    def test_restore_won_position_in_other_environment(self) -> None:
+        for action in ((0, 0), (1, 0), (0, 1), (1, 1), (2, 2), (1, 2)):
+            self.ttt.execute_action(action)
+
+        other = TicTacToe()
+        other.restore(self.ttt.snapshot())
+
+        self.assertEqual(self.ttt.state, other.state)
+        self.assertEqual('o', other.winner)
+        self.assertEqual(((1, 0), (1, 1), (1, 2)), other.win_position)
+        self.assertFalse(other.is_active)
+        self.assertEqual(self.ttt.get_state_as_string(), other.get_state_as_string())
+
+    def test_mnk_game_snapshot(self) -> None:
+        game = MnkGame(m=4, n=5, k=3)
+        for action in ((0, 0), (3, 4), (0, 1), (3, 3)):
+            game.execute_action(action)
+        snapshot = game.snapshot()
+        expected = (game.state, game.turn, game.possible_actions, game.bitboard)
+
+        game.execute_action((0, 2))
+        self.assertEqual('x', game.winner)
+
+        other = MnkGame(m=4, n=5, k=3)
+        other.restore(pickle.loads(pickle.dumps(snapshot)))
+        game.restore(snapshot)
+
+        for g in (game, other):
+            self.assertEqual(expected, (g.state, g.turn, g.possible_actions, g.bitboard))
+            self.assertIsNone(g.winner)
+            self.assertTrue(g.is_active)
+
+    def test_unsupported_environment(self) -> None:
+        self.assertTrue(isinstance(TicTacToe(), Snapshottable))
+        self.assertTrue(isinstance(MnkGame(), Snapshottable))
+        self.assertFalse(isinstance(VecTicTacToe(nbr_of_boards=1), Snapshottable))
+        self.assertFalse(hasattr(VecTicTacToe(nbr_of_boards=1), 'snapshot'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,30 @@ class TestState(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_state_view(self) -> None:
+        self.ttt.execute_action((1, 1))
+        expected = (('', '', ''), ('', 'x', ''), ('', '', ''))
+        actual = self.ttt.state_view
+
+        self.assertEqual(expected, actual)
+        self.assertEqual([list(row) for row in actual], self.ttt.state)
+
+    def test_state_view_cached_until_action_execution(self) -> None:
+        view = self.ttt.state_view
+        self.assertIs(view, self.ttt.state_view)
+
+        self.ttt.execute_action((0, 0))
+        self.assertIsNot(view, self.ttt.state_view)
+        self.assertEqual((('', '', ''), ('', '', ''), ('', '', '')), view)
+
+    def test_state_view_after_reset(self) -> None:
+        self.ttt.execute_action((0, 0))
+        self.ttt.reset()
+        expected = (('', '', ''), ('', '', ''), ('', '', ''))
+        actual = self.ttt.state_view
+
+        self.assertEqual(expected, actual)
+
     def test_empty_state_as_string(self) -> None:
         expected = '___|___|___\n___|___|___\n   |   |   \n'
         actual = self.ttt.get_state_as_string()
@@ -0,0 +1,70 @@
+import unittest
+from unittest import TestCase
+from environment import StateSpace, TicTacToe
+from environment_interpreter.tic_tac_toe import QLearning
+from random import Random
+
+
+class TestStateSpace(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        cls.space = StateSpace()
+
+    def test_size(self) -> None:
+        self.assertEqual(5478, len(self.space))
+        self.assertEqual(958, self.space.is_terminal.sum())
+        self.assertEqual(626, (self.space.winner == 1).sum())
+        self.assertEqual(316, (self.space.winner == -1).sum())
+
+    def test_empty_board(self) -> None:
+        ttt = TicTacToe()
+
+        self.assertEqual(0, self.space.encode_environment(ttt))
+        self.assertEqual((0,) * 18, self.space.decode_observation(0))
+        self.assertTrue(self.space.legal_actions[0].all())
+        self.assertEqual(0, self.space.depth[0])
+
+    def test_successors(self) -> None:
+        ttt = TicTacToe()
+        ttt.execute_action((1, 1))
+        successor = self.space.successors[0, 4]
+
+        self.assertEqual(self.space.encode_environment(ttt), successor)
+        self.assertFalse(self.space.legal_actions[successor, 4])
+        self.assertEqual(-1, self.space.successors[successor, 4])
+        self.assertTrue((self.space.successors[self.space.legal_actions] > 0).all())
+
+    def test_terminal_states_have_no_actions(self) -> None:
+        self.assertFalse(self.space.legal_actions[self.space.is_terminal].any())
+
+    def test_matches_environment_and_interpreter(self) -> None:
+        rnd = Random(0)
+
+        for first_turn in ('x', 'o'):
+            ttt = TicTacToe(first_turn=first_turn)
+            inter = QLearning(ttt)
+
+            for _ in range(100):
+                ttt.reset()
+                state_id = self.space.encode_environment(ttt)
+
+                while ttt.is_active:
+                    action = rnd.choice(ttt.possible_actions)
+                    ttt.execute_action(action)
+
+                    state_id = self.space.successors[state_id, self.space.actions.index(action)]
+                    observation = inter.observable_environment.state
+
+                    self.assertEqual(state_id, self.space.encode_environment(ttt))
+                    self.assertEqual(state_id, self.space.encode_observation(observation))
+                    self.assertEqual(observation, self.space.decode_observation(state_id))
+                    self.assertEqual(not ttt.is_active, self.space.is_terminal[state_id])
+
+                if first_turn == 'x':
+                    self.assertEqual(ttt.state_view, self.space.decode_state(state_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest import TestCase
+from environment import TicTacToe, VecTicTacToe
+import numpy as np
+
+
+class TestStep(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.ttt = TicTacToe()
+
+    def test_step(self) -> None:
+        transition = self.ttt.step((1, 1))
+
+        self.assertEqual(self.ttt.state_view, transition.state)
+        self.assertTrue(transition.is_active)
+        self.assertEqual(self.ttt.possible_actions, transition.possible_actions)
+        self.assertEqual(None, transition.winner)
+
+    def test_step_on_win(self) -> None:
+        for action in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            self.ttt.step(action)
+        transition = self.ttt.step((0, 2))
+
+        self.assertFalse(transition.is_active)
+        self.assertEqual('x', transition.winner)
+
+    def test_vec_step(self) -> None:
+        vec = VecTicTacToe(nbr_of_boards=2)
+        transition = vec.step(np.array([0, 4]))
+
+        np.testing.assert_array_equal(vec.state_view, transition.state)
+        np.testing.assert_array_equal(np.array([True, True]), transition.is_active)
+        np.testing.assert_array_equal(vec.action_mask, transition.possible_actions)
+        np.testing.assert_array_equal(np.array([0, 0]), transition.winner)
+
+
+if __name__ == '__main__':
+    unittest.main()
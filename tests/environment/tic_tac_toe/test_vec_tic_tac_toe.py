@@ -0,0 +1,123 @@
+import unittest
+from unittest import TestCase
+from environment import TicTacToe, VecTicTacToe
+from environment_interpreter.tic_tac_toe import QLearning as QLearningInterpreter
+import numpy as np
+
+
+class TestVecTicTacToe(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.vec = VecTicTacToe(nbr_of_boards=3)
+
+    def test_empty_state(self) -> None:
+        expected = np.zeros((3, 3, 3), dtype=np.int8)
+        actual = self.vec.state
+
+        np.testing.assert_array_equal(expected, actual)
+        self.assertTrue(self.vec.action_mask.all())
+        np.testing.assert_array_equal(np.full(3, VecTicTacToe.X), self.vec.turn)
+
+    def test_first_turn_selection(self) -> None:
+        vec = VecTicTacToe(nbr_of_boards=2, first_turn='O')
+
+        np.testing.assert_array_equal(np.full(2, VecTicTacToe.O), vec.turn)
+
+    def test_state_after_action_execution(self) -> None:
+        self.vec.execute_action(np.array([0, 4, 8]))
+
+        state = self.vec.state
+        self.assertEqual(VecTicTacToe.X, state[0, 0, 0])
+        self.assertEqual(VecTicTacToe.X, state[1, 1, 1])
+        self.assertEqual(VecTicTacToe.X, state[2, 2, 2])
+        self.assertFalse(self.vec.action_mask[0, 0])
+        self.assertFalse(self.vec.action_mask[1, 4])
+        np.testing.assert_array_equal(np.full(3, VecTicTacToe.O), self.vec.turn)
+
+    def test_on_illegal_action(self) -> None:
+        self.vec.execute_action(np.array([0, 0, 0]))
+        self.vec.execute_action(np.array([0, 1, 99]))
+
+        expected_turn = np.array([VecTicTacToe.O, VecTicTacToe.X, VecTicTacToe.O])
+        np.testing.assert_array_equal(expected_turn, self.vec.turn)
+        self.assertEqual(VecTicTacToe.X, self.vec.state[0, 0, 0])
+
+    def test_wrong_number_of_actions(self) -> None:
+        self.assertRaises(Exception, self.vec.execute_action, np.array([0, 1]))
+
+    def test_win_and_auto_reset(self) -> None:
+        for actions in ([0, 0, 0], [3, 3, 1], [1, 4, 3], [4, 1, 2], [2, 2, 5], [5, 5, 4], [6, 8, 6], [8, 7, 8]):
+            self.vec.execute_action(np.array(actions))
+            if self.vec.done[0]:
+                break
+
+        np.testing.assert_array_equal(np.array([VecTicTacToe.X, 0, 0]), self.vec.winner)
+        np.testing.assert_array_equal(np.array([True, False, False]), self.vec.done)
+        np.testing.assert_array_equal(np.zeros((3, 3), dtype=np.int8), self.vec.state[0])
+        self.assertTrue(self.vec.action_mask[0].all())
+        self.assertEqual(VecTicTacToe.X, self.vec.turn[0])
+
+    def test_matches_tic_tac_toe(self) -> None:
+        nbr_of_boards = 64
+        vec = VecTicTacToe(nbr_of_boards=nbr_of_boards)
+        games = [TicTacToe() for _ in range(nbr_of_boards)]
+        rnd = np.random.RandomState(0)
+        marks = {'x': VecTicTacToe.X, 'o': VecTicTacToe.O, None: 0}
+
+        for _ in range(200):
+            mask = vec.action_mask
+            actions = np.array([rnd.choice(np.flatnonzero(m)) for m in mask])
+            vec.execute_action(actions)
+
+            for i, game in enumerate(games):
+                game.execute_action(vec.actions[actions[i]])
+                self.assertEqual(marks[game.winner], vec.winner[i])
+                self.assertEqual(not game.is_active, vec.done[i])
+                if not game.is_active:
+                    game.reset()
+
+    def test_observation_matches_q_learning_interpreter(self) -> None:
+        nbr_of_boards = 16
+        vec = VecTicTacToe(nbr_of_boards=nbr_of_boards)
+        games = [TicTacToe() for _ in range(nbr_of_boards)]
+        interpreters = [QLearningInterpreter(game) for game in games]
+        rnd = np.random.RandomState(1)
+
+        for _ in range(30):
+            observation = vec.observation
+            self.assertEqual((nbr_of_boards, 18), observation.shape)
+            for i, interpreter in enumerate(interpreters):
+                self.assertEqual(interpreter.interpret().state, tuple(observation[i]))
+
+            actions = np.array([rnd.choice(np.flatnonzero(m)) for m in vec.action_mask])
+            vec.execute_action(actions)
+
+            for i, game in enumerate(games):
+                game.execute_action(vec.actions[actions[i]])
+                if not game.is_active:
+                    game.reset()
+
+    def test_read_only_views(self) -> None:
+        state_view = self.vec.state_view
+        mask_view = self.vec.possible_actions_view
+
+        self.assertIs(state_view, self.vec.state_view)
+        self.assertRaises(ValueError, state_view.__setitem__, 0, 1)
+        self.assertRaises(ValueError, mask_view.__setitem__, 0, False)
+
+        self.vec.execute_action(np.array([0, 1, 2]))
+        self.assertEqual(VecTicTacToe.EMPTY, state_view[0, 0, 0])
+        self.assertEqual(VecTicTacToe.X, self.vec.state_view[0, 0, 0])
+
+    def test_reset(self) -> None:
+        self.vec.execute_action(np.array([0, 1, 2]))
+        self.vec.reset()
+
+        np.testing.assert_array_equal(np.zeros((3, 3, 3), dtype=np.int8), self.vec.state)
+        self.assertTrue(self.vec.action_mask.all())
+        np.testing.assert_array_equal(np.full(3, VecTicTacToe.X), self.vec.turn)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+from environment import StateSpace, TicTacToe
+from environment_interpreter.tic_tac_toe import ObservationEncoder, QLearning
+import numpy as np
+import unittest
+from unittest import TestCase
+
+
+class TestObservationEncoder(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._encoder = ObservationEncoder()
+
+    def test_empty_observation(self) -> None:
+        expected = (0,) * 18
+
+        self.assertEqual(expected, self._encoder.observation('x'))
+        self.assertEqual(expected, self._encoder.observation('o'))
+
+    def test_both_perspectives(self) -> None:
+        # x at (0, 0), o at (1, 1)
+        self._encoder.update(1 << 0, 1 << 4)
+
+        x_view = self._encoder.observation('x')
+        o_view = self._encoder.observation('o')
+
+        self.assertEqual((0, 1), x_view[0:2])
+        self.assertEqual((1, 0), x_view[8:10])
+        self.assertEqual((1, 0), o_view[0:2])
+        self.assertEqual((0, 1), o_view[8:10])
+        np.testing.assert_array_equal(np.array(x_view, dtype=np.float32), self._encoder.buffer('x'))
+        np.testing.assert_array_equal(np.array(o_view, dtype=np.float32), self._encoder.buffer('o'))
+
+    def test_observation_is_cached(self) -> None:
+        self._encoder.update(1, 2)
+        observation = self._encoder.observation('x')
+        buffer = self._encoder.buffer('x')
+
+        self._encoder.update(1, 2)
+        self.assertIs(observation, self._encoder.observation('x'))
+
+        self._encoder.update(1 | 4, 2)
+        self.assertIsNot(observation, self._encoder.observation('x'))
+        self.assertIs(buffer, self._encoder.buffer('x'))
+
+    def test_update_after_removal(self) -> None:
+        self._encoder.update(1, 2)
+        self._encoder.update(0, 2)
+
+        expected = (0, 0, 0, 1) + (0,) * 14
+        self.assertEqual(expected, self._encoder.observation('o'))
+        self.assertEqual(expected, tuple(self._encoder.buffer('o').astype(int)))
+
+    def test_state_id(self) -> None:
+        space = StateSpace()
+        encoder = ObservationEncoder(state_space=space)
+        ttt = TicTacToe(first_turn='o')
+
+        for action in ((0, 0), (1, 1), (2, 2)):
+            ttt.execute_action(action)
+            encoder.update(*ttt.bitboard)
+
+            self.assertEqual(space.encode_environment(ttt), encoder.state_id(ttt.turn))
+            self.assertEqual(space.decode_observation(encoder.state_id(ttt.turn)), encoder.observation(ttt.turn))
+
+        self.assertRaises(Exception, self._encoder.state_id, 'x')
+
+    def test_interpreter_after_push_pop_and_reset(self) -> None:
+        ttt = TicTacToe()
+        inter = QLearning(ttt)
+
+        ttt.push((0, 0))
+        ttt.push((1, 1))
+        after_two = inter.observable_environment.state
+        ttt.pop()
+        ttt.pop()
+        self.assertEqual((0,) * 18, inter.observable_environment.state)
+
+        ttt.execute_action((0, 0))
+        ttt.execute_action((1, 1))
+        self.assertEqual(after_two, inter.observable_environment.state)
+
+        ttt.reset()
+        self.assertEqual((0,) * 18, inter.observable_environment.state)
+
+
+if __name__ == '__main__':
+    unittest.main()
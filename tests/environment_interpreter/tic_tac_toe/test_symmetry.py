@@ -0,0 +1,78 @@
+from environment import MnkGame, StateSpace, TicTacToe
+from environment_interpreter.tic_tac_toe import QLearning, Symmetry
+import unittest
+from unittest import TestCase
+
+
+class TestSymmetry(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._symmetry = Symmetry()
+
+    def test_identity_transform(self) -> None:
+        observation = tuple(range(18))
+
+        self.assertEqual(observation, self._symmetry.transform_observation(observation, 0))
+        self.assertEqual((2, 1), self._symmetry.to_canonical_action((2, 1), 0))
+
+    def test_rotation(self) -> None:
+        # X in the top left corner ends up in the top right corner after a clockwise rotation
+        observation = (0, 1) + (0, 0) * 8
+        expected = (0, 0) * 2 + (0, 1) + (0, 0) * 6
+
+        self.assertEqual(expected, self._symmetry.transform_observation(observation, 1))
+        self.assertEqual((0, 2), self._symmetry.to_canonical_action((0, 0), 1))
+
+    def test_actions_round_trip(self) -> None:
+        for transform in range(self._symmetry.nbr_of_transforms):
+            for i in range(3):
+                for j in range(3):
+                    canonical = self._symmetry.to_canonical_action((i, j), transform)
+                    self.assertEqual((i, j), self._symmetry.to_board_action(canonical, transform))
+
+        self.assertEqual(None, self._symmetry.to_board_action(None, 3))
+
+    def test_symmetric_positions_share_canonical_form(self) -> None:
+        corners = ((0, 0), (0, 2), (2, 0), (2, 2))
+        canonical = set()
+
+        for corner in corners:
+            env = TicTacToe()
+            inter = QLearning(env, canonical=True)
+            env.execute_action(corner)
+            canonical.add(inter.observable_environment.state)
+
+        self.assertEqual(1, len(canonical))
+
+    def test_canonical_action_translation(self) -> None:
+        env = TicTacToe()
+        inter = QLearning(env, canonical=True)
+        env.execute_action((2, 2))
+        env.execute_action((1, 0))
+
+        state = inter.observable_environment.state
+        actions = inter.interpret_actions(env.possible_actions)
+
+        self.assertEqual(7, len(actions))
+        self.assertEqual(tuple(sorted(actions)), actions)
+
+        for action in actions:
+            board_action = inter.translate_action(action)
+            self.assertTrue(board_action in env.possible_actions)
+
+            i, j = action
+            cell = 2 * (i * 3 + j)
+            self.assertEqual((0, 0), state[cell:cell + 2])
+
+    def test_non_square_board(self) -> None:
+        self.assertRaises(Exception, QLearning, MnkGame(m=2, n=3, k=2), canonical=True)
+
+    def test_canonical_state_count(self) -> None:
+        space = StateSpace()
+        canonical = {self._symmetry.canonicalize(space.decode_observation(i))[0] for i in range(len(space))}
+
+        self.assertEqual(765, len(canonical))
+
+
+if __name__ == '__main__':
+    unittest.main()
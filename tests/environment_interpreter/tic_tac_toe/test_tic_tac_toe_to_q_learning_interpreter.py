@@ -1,4 +1,4 @@
-from environment import TicTacToe
+from environment import MnkGame, TicTacToe
 from environment_interpreter.tic_tac_toe import QLearning
 
 import unittest
@@ -65,6 +65,45 @@ class TestTicTacToeToQlearningInterpreter(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_mnk_game_state(self) -> None:
+        env = MnkGame(m=2, n=4, k=3)
+        inter = QLearning(env)
+        env.execute_action((0, 3))
+        env.execute_action((1, 0))
+        expected = (
+            0, 0, 0, 0, 0, 0, 0, 1,
+            1, 0, 0, 0, 0, 0, 0, 0
+        )
+        actual = inter.observable_environment.state
+
+        self.assertEqual(expected, actual)
+
+    def test_action_mask(self) -> None:
+        self._env.execute_action((0, 0))
+        self._env.execute_action((2, 1))
+
+        expected = (False, True, True, True, True, True, True, False, True)
+        actual = self._inter.observable_environment.action_mask
+
+        self.assertEqual(expected, actual)
+
+    def test_step(self) -> None:
+        self._inter.step((0, 0))
+        observation = self._inter.step((2, 1))
+
+        self.assertEqual(self._inter.observable_environment, observation)
+        self.assertEqual('x', self._env.turn)
+        self.assertEqual(0.0, observation.reward)
+        self.assertFalse(observation.is_terminal)
+
+    def test_action_mask_on_terminal(self) -> None:
+        for action in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            self._inter.step(action)
+        observation = self._inter.step((0, 2))
+
+        self.assertTrue(observation.is_terminal)
+        self.assertEqual((False,) * 9, observation.action_mask)
+
     def test_is_terminal_on_draw(self) -> None:
         self._env.execute_action((0, 0))
         self.assertEqual(False, self.get_is_terminal())
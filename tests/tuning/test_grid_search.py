@@ -0,0 +1,120 @@
+from tuning import AgentFactory, GridSearch
+from tuning.grid_search import run_cell
+from tuning.training import EVALUATION_VERSION
+from agent import DQN, QLearning
+from environment import TicTacToe
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+
+class TestGridSearch(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._dir = tempfile.TemporaryDirectory()
+        self._grid = {'learning_rate': [0.1, 0.5], 'gamma': [0.9]}
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+        super().tearDown()
+
+    def test_cells(self) -> None:
+        search = GridSearch('QLearning', {'learning_rate': [0.1, 0.5], 'gamma': [0.8, 0.9]}, self._file('r.csv'))
+
+        self.assertEqual(4, len(search.cells))
+        self.assertEqual({'learning_rate': 0.1, 'gamma': 0.8}, search.cells[0])
+        self.assertRaises(Exception, GridSearch, 'Unknown', self._grid, self._file('r.csv'))
+        self.assertRaises(Exception, GridSearch, 'QLearning', {'wins': [1]}, self._file('r.csv'))
+
+    def test_run_csv_and_resume(self) -> None:
+        results_file = self._file('results.csv')
+        search = GridSearch('QLearning', self._grid, results_file, nbr_of_training=50, nbr_of_games=20, max_workers=2)
+
+        results = search.run()
+        self.assertEqual(2, len(results))
+
+        with open(results_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual({'0.1', '0.5'}, {row['learning_rate'] for row in rows})
+        for row in rows:
+            self.assertEqual(20, int(row['wins']) + int(row['losses']) + int(row['draws']))
+
+        modified = os.path.getmtime(results_file)
+        self.assertEqual(2, len(search.run()))
+        self.assertEqual(modified, os.path.getmtime(results_file))
+
+    def test_resume_partial_json(self) -> None:
+        results_file = self._file('results.jsonl')
+        with open(results_file, 'w') as f:
+            f.write(json.dumps({'learning_rate': 0.1, 'gamma': 0.9, 'agent': 'QLearning',
+                                'evaluation_version': EVALUATION_VERSION, 'seed': 0, 'wins': 1, 'losses': 0,
+                                'draws': 0, 'elapsed_time': 0.0}) + '\n')
+
+        search = GridSearch('QLearning', self._grid, results_file, nbr_of_training=50, nbr_of_games=20, max_workers=1)
+        results = search.run()
+
+        with open(results_file) as f:
+            lines = [json.loads(line) for line in f]
+
+        self.assertEqual(2, len(results))
+        self.assertEqual(2, len(lines))
+        self.assertEqual(0.5, lines[1]['learning_rate'])
+        self.assertEqual(1, lines[1]['seed'])
+
+    def test_resume_ignores_other_agents_and_protocols(self) -> None:
+        results_file = self._file('results.jsonl')
+        stale = {'learning_rate': 0.1, 'gamma': 0.9, 'seed': 0, 'wins': 1, 'losses': 0, 'draws': 0, 'elapsed_time': 0.0}
+        with open(results_file, 'w') as f:
+            f.write(json.dumps({**stale, 'agent': 'QLearning'}) + '\n')
+            f.write(json.dumps({**stale, 'agent': 'ArrayQLearning', 'evaluation_version': EVALUATION_VERSION}) + '\n')
+
+        search = GridSearch('QLearning', self._grid, results_file, nbr_of_training=50, nbr_of_games=20, max_workers=1)
+        results = search.run()
+
+        self.assertEqual(2, len(results))
+        self.assertEqual({0.1, 0.5}, {result['learning_rate'] for result in results})
+        for result in results:
+            self.assertEqual('QLearning', result['agent'])
+            self.assertEqual(EVALUATION_VERSION, result['evaluation_version'])
+
+    def test_csv_header_of_changed_grid(self) -> None:
+        results_file = self._file('results.csv')
+        GridSearch('QLearning', {'learning_rate': [0.1]}, results_file, nbr_of_training=20, nbr_of_games=10,
+                   max_workers=1).run()
+        GridSearch('QLearning', {'gamma': [0.5]}, results_file, nbr_of_training=20, nbr_of_games=10,
+                   max_workers=1).run()
+
+        with open(results_file, newline='') as f:
+            header = next(csv.reader(f))
+            f.seek(0)
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(['learning_rate', 'gamma'], [name for name in header if name not in GridSearch.RESULT_FIELDS])
+        self.assertEqual([('0.1', ''), ('', '0.5')], [(row['learning_rate'], row['gamma']) for row in rows])
+        self.assertTrue(all(row['agent'] == 'QLearning' for row in rows))
+
+    def test_run_cell_is_seeded(self) -> None:
+        first = run_cell('QLearning', {'learning_rate': 0.5}, nbr_of_training=50, nbr_of_games=30, seed=3)
+        second = run_cell('QLearning', {'learning_rate': 0.5}, nbr_of_training=50, nbr_of_games=30, seed=3)
+
+        self.assertEqual((first['wins'], first['losses']), (second['wins'], second['losses']))
+
+    def test_agent_factory(self) -> None:
+        actions = TicTacToe().possible_actions
+
+        self.assertTrue(isinstance(AgentFactory.create('QLearning', actions, 10, gamma=0.5), QLearning))
+        self.assertEqual(0.5, AgentFactory.create('QLearning', actions, 10, gamma=0.5)._gamma)
+        self.assertEqual(32, AgentFactory.create('DQN', actions, 10, batch_size=32, replay_memory_size=64)._batch_size)
+        self.assertTrue(isinstance(AgentFactory.create('DQN', actions, 10, batch_size=32, replay_memory_size=64), DQN))
+        self.assertRaises(Exception, AgentFactory.create, 'Unknown', actions, 10)
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self._dir.name, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from tuning import SuccessiveHalving
+from tuning.training import EVALUATION_VERSION
+import unittest
+from unittest import TestCase
+
+
+class TestSuccessiveHalving(TestCase):
+    def test_budgets(self) -> None:
+        self.assertEqual([1000, 3000, 9000, 27000, 81000, 100000],
+                         SuccessiveHalving('QLearning', {}, min_budget=1000, max_budget=100000).budgets)
+        self.assertEqual([10], SuccessiveHalving('QLearning', {}, min_budget=10, max_budget=10).budgets)
+        self.assertEqual([10, 40, 50], SuccessiveHalving('QLearning', {}, min_budget=10, max_budget=50, eta=4).budgets)
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(Exception, SuccessiveHalving, 'Unknown', {})
+        self.assertRaises(Exception, SuccessiveHalving, 'QLearning', {}, min_budget=100, max_budget=10)
+        self.assertRaises(Exception, SuccessiveHalving, 'QLearning', {}, eta=1)
+
+    def test_run(self) -> None:
+        grid = {'learning_rate': [0.1, 0.3, 0.5, 0.7, 0.9], 'gamma': [0.9]}
+        search = SuccessiveHalving('ArrayQLearning', grid, min_budget=20, max_budget=80, eta=2, nbr_of_games=50)
+
+        results = search.run()
+
+        self.assertEqual([5, 3, 2], [len(rung) for rung in search.history])
+        self.assertEqual([20, 40, 80], [rung[0]['budget'] for rung in search.history])
+        self.assertEqual(5, len(results))
+        self.assertEqual(80, results[0]['budget'])
+        self.assertTrue(results[0]['wins'] >= results[1]['wins'])
+        self.assertEqual(50, results[0]['wins'] + results[0]['losses'] + results[0]['draws'])
+        self.assertEqual(EVALUATION_VERSION, results[0]['evaluation_version'])
+
+        best_at_40 = sorted(search.history[1], key=lambda r: (r['wins'], -r['losses']), reverse=True)[:2]
+        self.assertEqual({r['learning_rate'] for r in best_at_40}, {r['learning_rate'] for r in search.history[2]})
+
+    def test_continues_training(self) -> None:
+        grid = {'learning_rate': [0.5]}
+        search = SuccessiveHalving('QLearning', grid, min_budget=10, max_budget=30, eta=3, nbr_of_games=10, seed=2)
+        first = search.run()
+        second = search.run()
+
+        self.assertEqual(first, second)
+        self.assertEqual(30, first[0]['budget'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+from agent import ArrayQLearning, DQN, MultiConfigQLearning, QLearning, SimpleDqn
+from environment import TicTacToe
+from tuning.training import evaluate, seed_everything, train
+import copy
+import numpy as np
+import torch
+import unittest
+from unittest import TestCase, mock
+
+
+class TestTraining(TestCase):
+    def test_evaluate_does_not_train_q_learning(self) -> None:
+        seed_everything(0)
+        agent = QLearning(training_amount=100)
+        train(TicTacToe(), agent, 20)
+        q_table = copy.deepcopy(agent._q_table)
+        epsilon = agent.epsilon
+
+        wins, losses, draws = evaluate(TicTacToe(), agent, 100)
+
+        self.assertEqual(100, wins + losses + draws)
+        self.assertEqual(q_table, agent._q_table)
+        self.assertEqual(epsilon, agent.epsilon)
+        self.assertFalse(agent.is_frozen)
+
+    def test_evaluate_restores_agent_on_error(self) -> None:
+        agent = QLearning(training_amount=100)
+        agent.epsilon = 0.5
+
+        with mock.patch('tuning.training.play', side_effect=KeyboardInterrupt):
+            self.assertRaises(KeyboardInterrupt, evaluate, TicTacToe(), agent, 10)
+
+        self.assertEqual(0.5, agent.epsilon)
+        self.assertFalse(agent.is_frozen)
+
+    def test_evaluate_does_not_train_array_q_learning(self) -> None:
+        seed_everything(0)
+        actions = TicTacToe().possible_actions
+
+        for agent in (ArrayQLearning(actions, training_amount=100),
+                      MultiConfigQLearning(actions, [(0.1, 0.9), (0.3, 0.9)], training_amount=100)):
+            train(TicTacToe(), agent, 20)
+            expected = agent.state_dict()['q_table']
+
+            evaluate(TicTacToe(), agent, 100)
+            actual = agent.state_dict()['q_table']
+
+            if isinstance(agent, MultiConfigQLearning):
+                self.assertEqual(expected['states'], actual['states'])
+                self.assertTrue(np.array_equal(expected['q_values'], actual['q_values']))
+                self.assertTrue(np.array_equal(expected['masks'], actual['masks']))
+            else:
+                self.assertEqual(expected.states, actual.states)
+                self.assertTrue(np.array_equal(expected.values, actual.values))
+                self.assertTrue(np.array_equal(expected.masks, actual.masks))
+
+    def test_evaluate_does_not_train_dqn(self) -> None:
+        seed_everything(0)
+        actions = TicTacToe().possible_actions
+
+        for agent in (SimpleDqn(state_size=18, all_possible_actions=actions, training_amount=100),
+                      DQN(state_size=18, all_possible_actions=actions, training_amount=100, replay_memory_size=64,
+                          batch_size=4, train_every=1)):
+            agent._is_training = False
+            train(TicTacToe(), agent, 10)
+            expected = agent.state_dict()
+
+            evaluate(TicTacToe(), agent, 20)
+            actual = agent.state_dict()
+
+            for name, param in expected['policy_net'].items():
+                self.assertTrue(torch.equal(param, actual['policy_net'][name]))
+            for name in ('epsilon', 'step_cnt', 'episode_cnt', 'rewards_sum'):
+                self.assertEqual(expected[name], actual[name])
+
+            if isinstance(agent, DQN):
+                self.assertEqual(expected['gradient_step_cnt'], actual['gradient_step_cnt'])
+                self.assertEqual(expected['replay_memory']['size'], actual['replay_memory']['size'])
+            else:
+                self.assertEqual(len(expected['memory']['memory']), len(actual['memory']['memory']))
+
+
+if __name__ == '__main__':
+    unittest.main()
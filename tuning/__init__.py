@@ -0,0 +1,3 @@
+from .agent_factory import AgentFactory
+from .grid_search import GridSearch
+from .successive_halving import SuccessiveHalving
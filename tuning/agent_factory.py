@@ -0,0 +1,22 @@
+from agent import ArrayQLearning, Base, DQN, QLearning, SimpleDqn
+from typing import Any, Tuple
+
+
+class AgentFactory:
+    AGENTS = ('QLearning', 'ArrayQLearning', 'SimpleDqn', 'DQN')
+
+    @staticmethod
+    def create(name: str, all_possible_actions: Tuple[Any, ...], training_amount: int, state_size: int = 18,
+               **params: Any) -> Base:
+        if name == 'QLearning':
+            return QLearning(training_amount=training_amount, **params)
+        elif name == 'ArrayQLearning':
+            return ArrayQLearning(all_possible_actions, training_amount=training_amount, **params)
+        elif name == 'SimpleDqn':
+            return SimpleDqn(state_size=state_size, all_possible_actions=all_possible_actions,
+                             training_amount=training_amount, **params)
+        elif name == 'DQN':
+            return DQN(state_size=state_size, all_possible_actions=all_possible_actions,
+                       training_amount=training_amount, **params)
+        else:
+            raise Exception(f'Unknown agent: {name}')
@@ -0,0 +1,141 @@
+from .agent_factory import AgentFactory
+from .training import EVALUATION_VERSION, evaluate, seed_everything, train
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from environment import TicTacToe
+from itertools import product
+from time import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import csv
+import json
+import os
+import torch
+
+
+class GridSearch:
+    # Trains one agent per cell of the grid in a process pool and evaluates it against the Random agent. Every
+    # finished cell is appended to the results file (.csv, or JSON lines otherwise), so a stopped sweep resumes where
+    # it left off. Each cell has its own seed, so its result does not depend on the worker that ran it.
+    RESULT_FIELDS = ('agent', 'evaluation_version', 'seed', 'wins', 'losses', 'draws', 'elapsed_time')
+
+    def __init__(self, agent: str, grid: Dict[str, Sequence[Any]], results_file: str,
+                 nbr_of_training: int = 100000, nbr_of_games: int = 10000, seed: int = 0,
+                 max_workers: Optional[int] = None) -> None:
+        if agent not in AgentFactory.AGENTS:
+            raise Exception(f'Unknown agent: {agent}')
+        if any(name in self.RESULT_FIELDS for name in grid.keys()):
+            raise Exception(f'Grid parameters cannot be named like a result field: {self.RESULT_FIELDS}')
+
+        self._agent = agent
+        self._grid = dict(grid)
+        self._results_file = results_file
+        self._nbr_of_training = nbr_of_training
+        self._nbr_of_games = nbr_of_games
+        self._seed = seed
+        self._max_workers = max_workers
+        self._is_csv = results_file.lower().endswith('.csv')
+
+    @property
+    def cells(self) -> List[Dict[str, Any]]:
+        names = list(self._grid.keys())
+        return [dict(zip(names, values)) for values in product(*self._grid.values())]
+
+    def run(self) -> List[Dict[str, Any]]:
+        # Results of other agents, grids or evaluation protocols in the same file are neither reused nor returned
+        keys = {self._create_cell_key(cell) for cell in self.cells}
+        results = [result for result in self._read_results() if self._create_key(result) in keys]
+        done = {self._create_key(result) for result in results}
+        pending = [(i, cell) for i, cell in enumerate(self.cells) if self._create_cell_key(cell) not in done]
+
+        if len(pending) == 0:
+            return results
+
+        with ProcessPoolExecutor(max_workers=self._max_workers, initializer=_init_worker) as executor:
+            futures = [executor.submit(run_cell, self._agent, cell, self._nbr_of_training, self._nbr_of_games,
+                                       self._seed + i) for i, cell in pending]
+
+            for future in as_completed(futures):
+                result = future.result()
+                self._write_result(result)
+                results.append(result)
+
+        return results
+
+    def _create_cell_key(self, cell: Dict[str, Any]) -> Tuple[str, ...]:
+        return self._create_key({**cell, 'agent': self._agent, 'evaluation_version': EVALUATION_VERSION})
+
+    def _create_key(self, result: Dict[str, Any]) -> Tuple[str, ...]:
+        # Compared as strings, so results read back from a CSV match the cells of the grid
+        names = ('agent', 'evaluation_version') + tuple(self._grid.keys())
+        return tuple(str(result.get(name)) for name in names)
+
+    def _read_results(self) -> List[Dict[str, Any]]:
+        if not os.path.isfile(self._results_file):
+            return []
+
+        with open(self._results_file, newline='') as f:
+            if self._is_csv:
+                return [dict(row) for row in csv.DictReader(f)]
+
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        if self._is_csv:
+            self._write_csv_result(result)
+            return
+
+        with open(self._results_file, 'a') as f:
+            f.write(json.dumps(result) + '\n')
+            f.flush()
+
+    def _write_csv_result(self, result: Dict[str, Any]) -> None:
+        fieldnames = list(self._grid.keys()) + list(self.RESULT_FIELDS)
+        header = self._read_csv_header()
+
+        if header is not None and any(name not in header for name in fieldnames):
+            # Another grid wrote this file, so it is rewritten with the columns of both before appending
+            self._rewrite_csv(header + [name for name in fieldnames if name not in header])
+            header = self._read_csv_header()
+
+        with open(self._results_file, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames if header is None else header)
+            if header is None:
+                writer.writeheader()
+            writer.writerow(result)
+            f.flush()
+
+    def _read_csv_header(self) -> Optional[List[str]]:
+        if not os.path.isfile(self._results_file) or os.path.getsize(self._results_file) == 0:
+            return None
+
+        with open(self._results_file, newline='') as f:
+            return next(csv.reader(f), None)
+
+    def _rewrite_csv(self, fieldnames: List[str]) -> None:
+        rows = self._read_results()
+        tmp_file = f'{self._results_file}.tmp'
+
+        with open(tmp_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        os.replace(tmp_file, self._results_file)
+
+
+def _init_worker() -> None:
+    # One intra-op thread per worker, otherwise torch oversubscribes the cores the pool already uses
+    torch.set_num_threads(1)
+
+
+def run_cell(agent: str, params: Dict[str, Any], nbr_of_training: int, nbr_of_games: int,
+             seed: int) -> Dict[str, Any]:
+    seed_everything(seed)
+    start = time()
+    env = TicTacToe()
+    a1 = AgentFactory.create(agent, env.possible_actions, training_amount=nbr_of_training, **params)
+
+    train(env, a1, nbr_of_training)
+    wins, losses, draws = evaluate(env, a1, nbr_of_games)
+
+    return {**params, 'agent': agent, 'evaluation_version': EVALUATION_VERSION, 'seed': seed, 'wins': wins,
+            'losses': losses, 'draws': draws, 'elapsed_time': time() - start}
@@ -0,0 +1,78 @@
+from .agent_factory import AgentFactory
+from .training import EVALUATION_VERSION, evaluate, seed_everything, train
+from environment import TicTacToe
+from itertools import product
+from math import ceil
+from typing import Any, Dict, List, Sequence
+
+
+class SuccessiveHalving:
+    # Trains every config of the grid for min_budget games, evaluates it against the Random agent and keeps the best
+    # 1 / eta of them. Survivors continue training where they stopped, with an eta times larger budget, until they
+    # reach max_budget. Agents are created with max_budget as training amount, so their exploration schedule is the
+    # one of a full run.
+    def __init__(self, agent: str, grid: Dict[str, Sequence[Any]], min_budget: int = 1000, max_budget: int = 100000,
+                 eta: int = 3, nbr_of_games: int = 1000, seed: int = 0) -> None:
+        if agent not in AgentFactory.AGENTS:
+            raise Exception(f'Unknown agent: {agent}')
+        if min_budget < 1 or max_budget < min_budget:
+            raise Exception(f'Invalid budgets: {min_budget} - {max_budget}')
+        if eta < 2:
+            raise Exception('Eta must be at least 2')
+
+        self._agent = agent
+        self._grid = dict(grid)
+        self._min_budget = min_budget
+        self._max_budget = max_budget
+        self._eta = eta
+        self._nbr_of_games = nbr_of_games
+        self._seed = seed
+        self._history = []
+
+    @property
+    def cells(self) -> List[Dict[str, Any]]:
+        names = list(self._grid.keys())
+        return [dict(zip(names, values)) for values in product(*self._grid.values())]
+
+    @property
+    def budgets(self) -> List[int]:
+        budgets = [self._min_budget]
+
+        while budgets[-1] < self._max_budget:
+            budgets.append(min(budgets[-1] * self._eta, self._max_budget))
+
+        return budgets
+
+    @property
+    def history(self) -> List[List[Dict[str, Any]]]:
+        return self._history
+
+    def run(self) -> List[Dict[str, Any]]:
+        seed_everything(self._seed)
+        self._history = []
+
+        env = TicTacToe()
+        cells = self.cells
+        agents = [AgentFactory.create(self._agent, env.possible_actions, training_amount=self._max_budget, **cell)
+                  for cell in cells]
+        survivors = list(range(len(cells)))
+        trained = [0] * len(cells)
+        results = {}
+
+        for budget in self.budgets:
+            rung = []
+
+            for i in survivors:
+                train(env, agents[i], budget - trained[i])
+                trained[i] = budget
+
+                wins, losses, draws = evaluate(env, agents[i], self._nbr_of_games)
+                results[i] = {**cells[i], 'agent': self._agent, 'evaluation_version': EVALUATION_VERSION,
+                              'budget': budget, 'wins': wins, 'losses': losses, 'draws': draws}
+                rung.append(results[i])
+
+            self._history.append(rung)
+            survivors.sort(key=lambda i: (results[i]['wins'], -results[i]['losses']), reverse=True)
+            survivors = survivors[:max(1, ceil(len(survivors) / self._eta))]
+
+        return sorted(results.values(), key=lambda r: (r['budget'], r['wins'], -r['losses']), reverse=True)
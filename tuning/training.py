@@ -0,0 +1,43 @@
+from agent import Base as BaseAgent, Random as RandomAgent
+from contextlib import redirect_stdout
+from environment import TicTacToe
+from play import play
+from typing import Tuple
+import numpy as np
+import os
+import random
+import torch
+
+# Bumped whenever evaluate changes what it measures, so results of different protocols are never mixed.
+# 1: epsilon 0 only, the games still trained the agent; 2: frozen agent
+EVALUATION_VERSION = 2
+
+
+def seed_everything(seed: int) -> None:
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def train(env: TicTacToe, agent: BaseAgent, nbr_of_games: int) -> None:
+    # Trains against the Random agent, continuing from wherever the agent stopped
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        play(t=env, a1=agent, a2=RandomAgent(), ep=nbr_of_games, nbr_of_games_to_print=0, should_print_info=False)
+
+
+def evaluate(env: TicTacToe, agent: BaseAgent, nbr_of_games: int) -> Tuple[int, int, int]:
+    # Greedy games against the Random agent with the agent frozen, so evaluating does not train it
+    epsilon = agent.epsilon
+    is_frozen = agent.is_frozen
+    agent.epsilon = 0.0
+    agent.is_frozen = True
+
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            wins, losses = play(t=env, a1=agent, a2=RandomAgent(), ep=nbr_of_games, nbr_of_games_to_print=0,
+                                should_print_info=False)
+    finally:
+        agent.epsilon = epsilon
+        agent.is_frozen = is_frozen
+
+    return wins, losses, nbr_of_games - wins - losses